@@ -4,6 +4,7 @@ Custom JWT authentication backend for custom User model.
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken
 from apps.authentication.models import User
+from apps.core.db_routers import route_user_reads
 
 
 class CustomJWTAuthentication(JWTAuthentication):
@@ -25,6 +26,9 @@ class CustomJWTAuthentication(JWTAuthentication):
             if user is None:
                 raise InvalidToken('User not found or inactive')
 
+            # Read-your-writes: users who just uploaded read from the primary database
+            route_user_reads(user.id)
+
             return user
 
         except User.DoesNotExist:
@@ -0,0 +1,56 @@
+"""
+ASGI helpers.
+"""
+import asyncio
+
+
+def _accepts_event_stream(scope) -> bool:
+    for name, value in scope.get('headers', ()):
+        if name == b'accept':
+            return b'text/event-stream' in value
+    return False
+
+
+def close_event_streams_on_disconnect(app):
+    """
+    Cancel Server-Sent Events requests as soon as the client disconnects.
+
+    Django 4.2 stops reading from the client once the request body is in,
+    and servers silently drop writes to a closed connection, so an event
+    stream generator would otherwise run until it ends on its own. For
+    requests that accept text/event-stream this wrapper keeps listening for
+    http.disconnect and cancels the request task, which closes the
+    generator (running its cleanup).
+    """
+    async def application(scope, receive, send):
+        if scope['type'] != 'http' or not _accepts_event_stream(scope):
+            return await app(scope, receive, send)
+
+        body_received = asyncio.Event()
+        disconnected = asyncio.Event()
+
+        async def app_receive():
+            message = await receive()
+            if message['type'] != 'http.request' or not message.get('more_body', False):
+                body_received.set()
+            return message
+
+        request = asyncio.ensure_future(app(scope, app_receive, send))
+
+        async def watch():
+            await body_received.wait()
+            while (await receive())['type'] != 'http.disconnect':
+                pass
+            disconnected.set()
+            request.cancel()
+
+        watcher = asyncio.ensure_future(watch())
+        try:
+            await request
+        except asyncio.CancelledError:
+            if not disconnected.is_set():
+                raise
+        finally:
+            watcher.cancel()
+
+    return application
@@ -0,0 +1,10 @@
+"""
+Cache deployment helpers.
+"""
+from django.conf import settings
+
+
+def cache_is_shared(alias: str = 'default') -> bool:
+    """Whether the cache is shared by every worker process (not per-process memory)."""
+    backend = settings.CACHES[alias]['BACKEND']
+    return backend.rsplit('.', 1)[-1] not in ('LocMemCache', 'DummyCache')
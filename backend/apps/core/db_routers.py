@@ -0,0 +1,127 @@
+"""
+Read-replica database routing.
+
+When DATABASES has a replica alias (see DB_REPLICA_* in settings), reads of
+the dashboard and data upload models go to the replica and all writes go to
+the primary ('default'). Reads stay on the primary when they must see
+writes that the replica may not have applied yet:
+
+- inside a transaction on the primary (e.g. refreshing derived dashboard
+  data during an upload),
+- inside use_primary() blocks (e.g. rebuilding caches right after a commit),
+- for a user who changed data within the last DATABASE_REPLICA_PIN_SECONDS
+  (read-your-writes after an upload or delete, see pin_user_to_primary()).
+
+The pins live in the default cache, so every worker process has to see the
+same cache: with a replica configured, startup fails on the per-process
+memory cache outside DEBUG (see check_replica_cache()).
+"""
+import contextvars
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .cache import cache_is_shared
+
+
+REPLICA_ALIAS = getattr(settings, 'DATABASE_REPLICA_ALIAS', 'replica')
+
+# App labels whose reads may be served by the replica
+REPLICA_APP_LABELS = frozenset(getattr(settings, 'DATABASE_REPLICA_APPS', ('dashboard', 'data_upload')))
+
+# How long a user's reads stay on the primary after they changed data (seconds);
+# should comfortably exceed the replication lag
+REPLICA_PIN_SECONDS = getattr(settings, 'DATABASE_REPLICA_PIN_SECONDS', 10)
+
+# Set per request (and per use_primary() block); copied into worker threads with the context
+_primary_pinned = contextvars.ContextVar('primary_pinned', default=False)
+
+
+def _pin_key(user_id: int) -> str:
+    return f'db_primary_pin:{user_id}'
+
+
+def replica_configured() -> bool:
+    return REPLICA_ALIAS in connections.settings
+
+
+def check_replica_cache() -> None:
+    """
+    Refuse to start with a replica but a per-process cache (called from CoreConfig.ready()).
+
+    A pin written by the worker that handled an upload would be invisible to
+    the other workers, which would keep serving the user stale replica reads.
+    runserver (DEBUG) is a single process, so its memory cache is enough.
+    """
+    if replica_configured() and not cache_is_shared() and not settings.DEBUG:
+        raise ImproperlyConfigured(
+            'A read replica (DB_REPLICA_HOST) requires a shared cache for read-your-writes pins; '
+            'set REDIS_URL.'
+        )
+
+
+@contextmanager
+def use_primary():
+    """Route every read in the block (and in contexts copied from it) to the primary."""
+    token = _primary_pinned.set(True)
+    try:
+        yield
+    finally:
+        _primary_pinned.reset(token)
+
+
+def pin_user_to_primary(user_id: int) -> None:
+    """
+    Serve the user's reads from the primary for REPLICA_PIN_SECONDS.
+
+    Call after the user's write has committed, so their next requests see
+    it even while the replica is behind.
+    """
+    if not replica_configured():
+        return
+    try:
+        cache.set(_pin_key(user_id), True, REPLICA_PIN_SECONDS)
+    except Exception:
+        # Best effort: without the pin the user only sees the change a little later
+        pass
+
+
+def route_user_reads(user_id: int) -> None:
+    """Pin the current request to the primary if the user wrote recently (called on authentication)."""
+    if not replica_configured():
+        return
+    try:
+        pinned = bool(cache.get(_pin_key(user_id)))
+    except Exception:
+        pinned = False
+    _primary_pinned.set(pinned)
+
+
+class ReplicaRouter:
+    """Sends reads of REPLICA_APP_LABELS models to the replica, everything else to the primary."""
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label not in REPLICA_APP_LABELS or not replica_configured():
+            return None
+        if _primary_pinned.get() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return REPLICA_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same rows as the primary
+        databases = {DEFAULT_DB_ALIAS, REPLICA_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica is populated by replication, never migrated directly
+        if db == REPLICA_ALIAS:
+            return False
+        return None
@@ -0,0 +1,170 @@
+"""
+Response compression and ASGI streaming middleware.
+"""
+from typing import AsyncIterator, Iterator, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_sequence, compress_string
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+# Responses smaller than this are sent uncompressed (bytes)
+COMPRESSION_MIN_SIZE = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+
+COMPRESSION_CONTENT_TYPES = getattr(settings, 'COMPRESSION_CONTENT_TYPES', (
+    'application/json',
+    'application/x-ndjson',
+    'application/vnd.apache.arrow.stream',
+    'text/csv',
+))
+
+# Brotli quality 0-11; mid levels compress JSON close to gzip -9 at gzip -6 speed
+COMPRESSION_BROTLI_QUALITY = getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 5)
+
+# Bytes collected per thread hop when streaming a synchronous iterator under ASGI
+ASGI_STREAMING_BATCH_SIZE = getattr(settings, 'ASGI_STREAMING_BATCH_SIZE', 64 * 1024)
+
+
+def parse_accept_encoding(header: str) -> dict:
+    """Accept-Encoding header -> {coding: q}."""
+    codings = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        codings[coding] = q
+    return codings
+
+
+def select_encoding(header: str) -> Optional[str]:
+    """Preferred supported coding: br (if brotli is installed), then gzip."""
+    codings = parse_accept_encoding(header)
+    wildcard = codings.get('*', 0.0)
+
+    candidates = ['br', 'gzip'] if brotli is not None else ['gzip']
+    accepted = [
+        (codings.get(coding, wildcard), -index, coding)
+        for index, coding in enumerate(candidates)
+    ]
+    q, _, coding = max(accepted)
+    return coding if q > 0 else None
+
+
+def _brotli_sequence(sequence) -> Iterator[bytes]:
+    compressor = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+    for chunk in sequence:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+        # Flush per chunk so streamed rows reach the client promptly
+        data = compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress JSON/NDJSON/Arrow/CSV responses with brotli or gzip.
+
+    The coding is negotiated from Accept-Encoding (brotli preferred when the
+    optional brotli package is installed). Non-streaming responses below
+    COMPRESSION_MIN_SIZE are left alone; streaming responses are compressed
+    chunk by chunk. Strong ETags are weakened as in Django's GZipMiddleware.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding'):
+            return response
+
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type not in COMPRESSION_CONTENT_TYPES:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        if not response.streaming and len(response.content) < COMPRESSION_MIN_SIZE:
+            return response
+
+        encoding = select_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if encoding == 'br':
+                response.streaming_content = _brotli_sequence(response.streaming_content)
+            else:
+                response.streaming_content = compress_sequence(response.streaming_content)
+            del response.headers['Content-Length']
+        else:
+            if encoding == 'br':
+                compressed = brotli.compress(response.content, quality=COMPRESSION_BROTLI_QUALITY)
+            else:
+                compressed = compress_string(response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+
+def _next_batch(iterator: Iterator[bytes]) -> List[bytes]:
+    """Chunks up to ASGI_STREAMING_BATCH_SIZE bytes (an empty list at the end)."""
+    batch, size = [], 0
+    for chunk in iterator:
+        batch.append(chunk)
+        size += len(chunk)
+        if size >= ASGI_STREAMING_BATCH_SIZE:
+            break
+    return batch
+
+
+async def _iterate_in_request_thread(content: Iterator[bytes]) -> AsyncIterator[bytes]:
+    iterator = iter(content)
+    # Thread-sensitive: the request's own thread, where the sync view opened its cursors
+    next_batch = sync_to_async(_next_batch, thread_sensitive=True)
+    while True:
+        batch = await next_batch(iterator)
+        if not batch:
+            return
+        for chunk in batch:
+            yield chunk
+
+
+class ASGIStreamingMiddleware(MiddlewareMixin):
+    """
+    Keep synchronous streaming responses streaming under ASGI.
+
+    Django 4.2 serves a StreamingHttpResponse over a synchronous iterator on
+    ASGI by collecting the whole iterator into a list first, so row streams
+    and exports would be buffered in memory. This middleware advances the
+    iterator in batches on the request's thread instead. It must come first
+    in MIDDLEWARE so it wraps the final (e.g. compressed) iterator.
+    """
+
+    def process_response(self, request, response):
+        if isinstance(request, ASGIRequest) and response.streaming and not response.is_async:
+            response.streaming_content = _iterate_in_request_thread(response.streaming_content)
+        return response
@@ -0,0 +1,13 @@
+"""
+PostgreSQL database backend with a per-process connection pool.
+
+Use it as the ENGINE of a DATABASES entry and tune the pool with a POOL
+dict (see pool.POOL_DEFAULTS):
+
+    'ENGINE': 'apps.core.postgresql_pool',
+    'CONN_MAX_AGE': 0,
+    'POOL': {'MIN_SIZE': 2, 'MAX_SIZE': 10},
+
+Django still opens and closes "its" connection per request; with this
+backend that is a checkout from and a return to the pool.
+"""
@@ -0,0 +1,41 @@
+"""
+PostgreSQL backend whose connections are checked out from a ConnectionPool.
+"""
+from functools import partial
+
+from django.db.backends.postgresql import base as postgresql
+
+from .creation import DatabaseCreation
+from .pool import get_pool
+
+
+class DatabaseWrapper(postgresql.DatabaseWrapper):
+    """
+    postgresql.DatabaseWrapper that borrows connections from the alias's pool.
+
+    Closing the wrapper's connection returns it to the pool. A connection
+    closed inside an atomic block is closed for real, because the wrapper
+    keeps referring to it until the block exits.
+    """
+
+    creation_class = DatabaseCreation
+
+    @property
+    def pool(self):
+        settings_dict = self.settings_dict
+        # Keyed by target too: the test runner switches NAME to the test database
+        key = (self.alias, settings_dict['NAME'], settings_dict['HOST'], settings_dict['PORT'], settings_dict['USER'])
+        return get_pool(
+            key,
+            partial(super().get_new_connection, self.get_connection_params()),
+            settings_dict.get('POOL') or {},
+        )
+
+    def get_new_connection(self, conn_params):
+        return self.pool.getconn()
+
+    def _close(self):
+        if self.connection is None:
+            return
+        with self.wrap_database_errors:
+            self.pool.putconn(self.connection, close=self.in_atomic_block)
@@ -0,0 +1,349 @@
+"""
+Thread-safe psycopg2 connection pool with health checks and idle reaping.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from psycopg2 import OperationalError
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+
+logger = logging.getLogger(__name__)
+
+
+# DATABASES[alias]['POOL'] keys and their defaults
+POOL_DEFAULTS = {
+    # Connections kept open while idle (opened in the background)
+    'MIN_SIZE': 1,
+    # Connections open at once, idle or checked out
+    'MAX_SIZE': 10,
+    # Seconds a checkout waits for a free connection before failing
+    'TIMEOUT': 10.0,
+    # Idle connections above MIN_SIZE are closed after this many seconds
+    'MAX_IDLE': 300.0,
+    # Connections are replaced after this many seconds (0: never)
+    'MAX_LIFETIME': 3600.0,
+    # A connection idle this long is pinged (SELECT 1) before it is handed out
+    'CHECK_AFTER': 5.0,
+    # Seconds between reaper runs (idle reaping and refilling to MIN_SIZE)
+    'REAP_INTERVAL': 30.0,
+}
+
+
+class PoolTimeout(OperationalError):
+    """No connection became free within the checkout timeout."""
+
+
+class _Entry:
+    __slots__ = ('connection', 'created_at', 'returned_at')
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.created_at = self.returned_at = time.monotonic()
+
+
+class ConnectionPool:
+    """
+    Pool of raw psycopg2 connections for one database alias.
+
+    Idle connections are reused last-in first-out, so under light load the
+    same few stay warm and the rest age out through idle reaping. A
+    background reaper closes connections idle longer than MAX_IDLE (down to
+    MIN_SIZE) or older than MAX_LIFETIME, and reopens connections up to
+    MIN_SIZE, so a worker that scales down keeps a small warm set instead
+    of reconnecting on every burst.
+    """
+
+    def __init__(self, name: str, connect: Callable, **options):
+        self.name = name
+        self.connect = connect
+        config = {**POOL_DEFAULTS, **options}
+        self.min_size = int(config['MIN_SIZE'])
+        self.max_size = max(int(config['MAX_SIZE']), self.min_size, 1)
+        self.timeout = float(config['TIMEOUT'])
+        self.max_idle = float(config['MAX_IDLE'])
+        self.max_lifetime = float(config['MAX_LIFETIME'])
+        self.check_after = float(config['CHECK_AFTER'])
+        self.reap_interval = float(config['REAP_INTERVAL'])
+
+        self._condition = threading.Condition()
+        self._idle: List[_Entry] = []
+        self._in_use: Dict[int, _Entry] = {}
+        self._opening = 0
+        self._waiting = 0
+        self._closed = False
+        self._reaper: Optional[threading.Thread] = None
+        self.counters = dict.fromkeys((
+            'connections_opened',
+            'connections_closed',
+            'connect_errors',
+            'checkouts',
+            'checkouts_waited',
+            'checkout_timeouts',
+            'health_check_failures',
+        ), 0)
+        self.wait_seconds = 0.0
+
+    @property
+    def size(self) -> int:
+        return len(self._idle) + len(self._in_use) + self._opening
+
+    def getconn(self):
+        """
+        Check out a connection, opening one if the pool is below MAX_SIZE.
+
+        Raises:
+            PoolTimeout: No connection became free within TIMEOUT seconds
+        """
+        self._start_reaper()
+        deadline = None
+        while True:
+            with self._condition:
+                entry = self._take_idle()
+                if entry is None and self.size >= self.max_size:
+                    if deadline is None:
+                        deadline = time.monotonic() + self.timeout
+                        self.counters['checkouts_waited'] += 1
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.counters['checkout_timeouts'] += 1
+                        raise PoolTimeout(
+                            f'Connection pool "{self.name}" exhausted: no connection free '
+                            f'within {self.timeout:g}s (max size {self.max_size})'
+                        )
+                    self._waiting += 1
+                    started = time.monotonic()
+                    try:
+                        self._condition.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+                        self.wait_seconds += time.monotonic() - started
+                    continue
+                if entry is None:
+                    # Reserve the slot; connect outside the lock
+                    self._opening += 1
+                else:
+                    self._in_use[id(entry.connection)] = entry
+
+            if entry is None:
+                entry = self._open(self.connect)
+                with self._condition:
+                    self._in_use[id(entry.connection)] = entry
+            elif time.monotonic() - entry.returned_at >= self.check_after and not self._ping(entry.connection):
+                # Server restarted or dropped the connection while it sat idle
+                with self._condition:
+                    self._in_use.pop(id(entry.connection), None)
+                    self.counters['health_check_failures'] += 1
+                self._discard(entry)
+                continue
+
+            with self._condition:
+                self.counters['checkouts'] += 1
+            return entry.connection
+
+    def putconn(self, connection, close: bool = False) -> None:
+        """
+        Return a checked-out connection.
+
+        Broken or expired connections are closed, as are all of them when
+        close is set; an open transaction is rolled back.
+        """
+        with self._condition:
+            entry = self._in_use.pop(id(connection), None)
+        if entry is None:
+            self._close(connection)
+            return
+
+        if close or self._closed or self._expired(entry, time.monotonic()) or not self._reset(connection):
+            self._discard(entry)
+            return
+
+        entry.returned_at = time.monotonic()
+        with self._condition:
+            self._idle.append(entry)
+            self._condition.notify()
+
+    def stats(self) -> Dict[str, object]:
+        """Current pool state and lifetime counters of this process."""
+        with self._condition:
+            return {
+                'pid': os.getpid(),
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'size': self.size,
+                'idle': len(self._idle),
+                'in_use': len(self._in_use),
+                'waiting': self._waiting,
+                'wait_seconds': round(self.wait_seconds, 3),
+                **self.counters,
+            }
+
+    def reap(self) -> None:
+        """Close expired and surplus idle connections, then refill to MIN_SIZE."""
+        now = time.monotonic()
+        expired = []
+        with self._condition:
+            keep = []
+            # Most recently returned first: those count toward MIN_SIZE, older ones may go
+            for entry in reversed(self._idle):
+                surplus = len(self._in_use) + len(keep) >= self.min_size
+                if self._expired(entry, now) or (surplus and now - entry.returned_at > self.max_idle):
+                    expired.append(entry)
+                else:
+                    keep.append(entry)
+            self._idle = keep[::-1]
+        for entry in expired:
+            self._close(entry.connection)
+        self._fill()
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones are closed when returned."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for entry in idle:
+            self._close(entry.connection)
+
+    def _take_idle(self) -> Optional[_Entry]:
+        """Pop an unexpired idle connection (most recently returned first). Called with the lock held."""
+        now = time.monotonic()
+        while self._idle:
+            entry = self._idle.pop()
+            if self._expired(entry, now) or entry.connection.closed:
+                self._close(entry.connection)
+                continue
+            return entry
+        return None
+
+    def _open(self, connect: Callable) -> _Entry:
+        try:
+            entry = _Entry(connect())
+        except BaseException:
+            with self._condition:
+                self._opening -= 1
+                self.counters['connect_errors'] += 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._opening -= 1
+            self.counters['connections_opened'] += 1
+        return entry
+
+    def _fill(self) -> None:
+        while not self._closed:
+            with self._condition:
+                if self.size >= self.min_size or self.size >= self.max_size:
+                    return
+                self._opening += 1
+            try:
+                entry = self._open(self.connect)
+            except Exception as e:
+                logger.warning(f'Connection pool "{self.name}" could not open a connection: {e}')
+                return
+            with self._condition:
+                self._idle.insert(0, entry)
+                self._condition.notify()
+
+    def _discard(self, entry: _Entry) -> None:
+        self._close(entry.connection)
+        with self._condition:
+            self._condition.notify()
+
+    def _close(self, connection) -> None:
+        with self._condition:
+            self.counters['connections_closed'] += 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return bool(self.max_lifetime) and now - entry.created_at > self.max_lifetime
+
+    @staticmethod
+    def _ping(connection) -> bool:
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            if not connection.autocommit:
+                connection.rollback()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(connection) -> bool:
+        """Roll back an open transaction; False if the connection is no longer usable."""
+        if connection.closed:
+            return False
+        status = connection.info.transaction_status
+        if status == TRANSACTION_STATUS_UNKNOWN:
+            return False
+        if status != TRANSACTION_STATUS_IDLE:
+            try:
+                connection.rollback()
+            except Exception:
+                return False
+        return True
+
+    def _start_reaper(self) -> None:
+        if self._reaper is not None or not self.reap_interval:
+            return
+        with self._condition:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(
+                target=self._run_reaper,
+                name=f'db-pool-reaper-{self.name}',
+                daemon=True,
+            )
+            self._reaper.start()
+
+    def _run_reaper(self) -> None:
+        self._fill()
+        while not self._closed:
+            time.sleep(self.reap_interval)
+            try:
+                self.reap()
+            except Exception as e:  # pragma: no cover - keep the reaper alive
+                logger.warning(f'Connection pool "{self.name}" reaper failed: {e}')
+
+
+_pools: Dict[Tuple, ConnectionPool] = {}
+_pools_pid = os.getpid()
+_pools_lock = threading.Lock()
+
+
+def get_pool(key: Tuple, connect: Callable, options: dict) -> ConnectionPool:
+    """
+    The process's pool for a (database alias, target) key, created on first
+    use (and again after fork).
+    """
+    global _pools_pid
+    pool = _pools.get(key)
+    if pool is not None and _pools_pid == os.getpid():
+        return pool
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            # Connections inherited from the parent process must not be shared
+            _pools.clear()
+            _pools_pid = os.getpid()
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(key[0], connect, **options)
+        return pool
+
+
+def pool_stats() -> Dict[str, Dict[str, object]]:
+    """stats() of every open pool in this process, by database alias."""
+    return {pool.name: pool.stats() for pool in list(_pools.values()) if not pool._closed}
+
+
+def close_pools() -> None:
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
@@ -0,0 +1,425 @@
+"""
+Custom renderers for DRF.
+"""
+import csv
+import io
+import json
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from rest_framework.utils import encoders
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+except ImportError:  # pragma: no cover - optional dependency
+    Workbook = None
+
+
+# Datetimes go through DRF's encoder so the format matches JSONRenderer (ISO 8601, 'Z', ms)
+ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson else 0
+)
+
+_drf_encoder = encoders.JSONEncoder()
+
+
+def dumps_json(data) -> bytes:
+    """
+    Serialize data to compact UTF-8 JSON bytes.
+
+    Uses orjson when installed, otherwise the standard library. Types orjson
+    does not handle natively (Decimal, datetime, lazy strings, ...) are
+    converted by DRF's JSONEncoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_drf_encoder.default, option=ORJSON_OPTIONS)
+    return json.dumps(
+        data, cls=encoders.JSONEncoder, ensure_ascii=False, separators=(',', ':'),
+    ).encode('utf-8')
+
+
+def _tabular_rows(data) -> List[Dict[str, Any]]:
+    """
+    Rows of a non-streamed payload for the tabular renderers.
+
+    List responses render their 'data' rows; error payloads and other
+    objects become a one-row table.
+    """
+    if isinstance(data, dict) and isinstance(data.get('data'), list):
+        return data['data']
+    if isinstance(data, list):
+        return data
+    return [data]
+
+
+def _cell_value(value: Any) -> Any:
+    """Scalars pass through; nested JSON values (lists/objects) become JSON text."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return value
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson.
+
+    Produces the same compact UTF-8 output as DRF's JSONRenderer (including
+    the \\u2028/\\u2029 escaping) several times faster on large row lists.
+    Indented output (browsable API, ``; indent=``) and installs without
+    orjson fall back to JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = dumps_json(data)
+        # Keep the output a strict JavaScript subset like JSONRenderer
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Newline-delimited JSON renderer.
+
+    Views stream rows themselves when this renderer is negotiated
+    (?format=ndjson or Accept: application/x-ndjson). Non-streamed
+    payloads such as error responses are rendered as a single line.
+    """
+
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return self.render_line(data)
+
+    @staticmethod
+    def render_line(item) -> bytes:
+        """Serialize one item as a JSON line."""
+        return dumps_json(item) + b'\n'
+
+
+INT64_RANGE = range(-2 ** 63, 2 ** 63)
+
+
+def value_type(value: Any) -> Optional[str]:
+    """
+    Value type of a row value (None for null).
+
+    Integers outside the 64-bit range count as numbers; nested JSON values
+    (lists/objects) and anything else count as strings.
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer' if value in INT64_RANGE else 'number'
+    if isinstance(value, float):
+        return 'number'
+    return 'string'
+
+
+def widen_type(current: Optional[str], other: Optional[str]) -> Optional[str]:
+    """
+    Narrowest value type holding values of both types.
+
+    Integers widen to numbers; any other mix widens to strings.
+    """
+    if current is None or current == other:
+        return other or current
+    if other is None:
+        return current
+    if {current, other} == {'integer', 'number'}:
+        return 'number'
+    return 'string'
+
+
+def infer_value_types(rows: Iterable[Dict[str, Any]]) -> Dict[str, str]:
+    """Value type of every key of the rows, in order of first appearance (all-null keys are strings)."""
+    types: Dict[str, Optional[str]] = {}
+    for row in rows:
+        for key, value in row.items():
+            types[key] = widen_type(types.get(key), value_type(value))
+    return {key: kind or 'string' for key, kind in types.items()}
+
+
+class ArrowStreamRenderer(BaseRenderer):
+    """
+    Apache Arrow IPC stream renderer (requires pyarrow, see requirements.txt).
+
+    Views stream rows themselves when this renderer is negotiated
+    (?format=arrow or Accept: application/vnd.apache.arrow.stream): rows
+    are converted to record batches as they come off the database cursor,
+    so a full dataset is one response readable with
+    pyarrow.ipc.open_stream() / pandas without any JSON parsing.
+
+    The schema has to be known before the first batch, so streaming views
+    pass the value type of every column (see value_type()); columns without
+    a declared type are strings. Non-string values of string columns are
+    sent as JSON text, and a value that does not fit its column's type
+    raises ValueError instead of being sent as null.
+    """
+
+    media_type = 'application/vnd.apache.arrow.stream'
+    format = 'arrow'
+    charset = None
+    render_style = 'binary'
+
+    available = pa is not None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        rows = _tabular_rows(data)
+        return b''.join(self.stream(rows, types=infer_value_types(rows)))
+
+    @classmethod
+    def stream(
+        cls,
+        rows: Iterable[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+        batch_size: int = 2000,
+        types: Optional[Dict[str, str]] = None,
+    ) -> Iterator[bytes]:
+        """
+        Serialize rows as an Arrow IPC stream, one record batch per batch_size rows.
+
+        Args:
+            rows: Row dicts (e.g. from a server-side cursor)
+            columns: Column names in order (default: keys of types, else of the first batch)
+            batch_size: Rows per record batch
+            types: Value type per column ('boolean', 'integer', 'number' or 'string')
+        """
+        types = types or {}
+        rows = iter(rows)
+        batch = list(islice(rows, batch_size))
+        names = list(columns or types) or list(dict.fromkeys(
+            key for row in batch for key in row
+        ))
+        kinds = {name: types.get(name, 'string') for name in names}
+        schema = pa.schema([pa.field(name, cls._arrow_type(kind)) for name, kind in kinds.items()])
+
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            yield cls._drain(sink)
+            while batch:
+                writer.write_batch(cls._to_record_batch(batch, schema, kinds))
+                yield cls._drain(sink)
+                batch = list(islice(rows, batch_size))
+        yield cls._drain(sink)
+
+    @staticmethod
+    def _drain(sink: io.BytesIO) -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    @staticmethod
+    def _arrow_type(kind: str):
+        return {
+            'boolean': pa.bool_(),
+            'integer': pa.int64(),
+            'number': pa.float64(),
+        }.get(kind, pa.string())
+
+    @classmethod
+    def _to_record_batch(cls, rows: List[Dict[str, Any]], schema, kinds: Dict[str, str]):
+        arrays = [
+            pa.array(cls._column_values(field.name, kinds[field.name], rows), type=field.type)
+            for field in schema
+        ]
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    @staticmethod
+    def _column_values(name: str, kind: str, rows: List[Dict[str, Any]]) -> List[Any]:
+        values = [row.get(name) for row in rows]
+        if kind == 'string':
+            return [
+                value if value is None or isinstance(value, str)
+                else json.dumps(value, ensure_ascii=False, default=str)
+                for value in values
+            ]
+        # pyarrow would silently truncate floats into integer columns
+        for value in values:
+            if widen_type(kind, value_type(value)) != kind:
+                raise ValueError(f'Column {name!r} is typed {kind} but has the value {value!r}')
+        if kind == 'number':
+            return [None if value is None else float(value) for value in values]
+        return values
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    CSV renderer for row exports.
+
+    Export views stream rows through CSVRenderer.stream(); non-streamed
+    payloads such as error responses are rendered as a small table. Output
+    starts with a UTF-8 BOM so spreadsheet applications detect the encoding
+    of Korean headers and values.
+    """
+
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    # Bytes buffered per yielded chunk (keeps chunks large enough to compress well)
+    chunk_size = 64 * 1024
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return b''.join(self.stream(_tabular_rows(data)))
+
+    @classmethod
+    def stream(
+        cls,
+        rows: Iterable[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[bytes]:
+        """
+        Serialize rows as CSV with a header line, in chunks of about chunk_size bytes.
+
+        Args:
+            rows: Row dicts (e.g. from a server-side cursor)
+            columns: Column names in order (default: keys of the first row)
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if columns is None:
+            columns = list(first) if first is not None else []
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        buffer.write('\ufeff')
+        writer.writerow(columns)
+
+        if first is not None:
+            for row in chain([first], rows):
+                writer.writerow([_cell_value(row.get(column)) for column in columns])
+                if buffer.tell() >= cls.chunk_size:
+                    yield buffer.getvalue().encode('utf-8')
+                    buffer.seek(0)
+                    buffer.truncate()
+        yield buffer.getvalue().encode('utf-8')
+
+
+class XLSXRenderer(BaseRenderer):
+    """
+    Excel (.xlsx) renderer for row exports (requires openpyxl).
+
+    Rows are written with openpyxl's write-only mode, which spools each
+    worksheet to a temporary file instead of keeping cells in memory, and
+    the finished workbook is written to a file object. Rows beyond the
+    Excel sheet limit continue on additional sheets.
+    """
+
+    media_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    format = 'xlsx'
+    charset = None
+    render_style = 'binary'
+
+    available = Workbook is not None
+
+    # Excel limit is 1,048,576 rows per sheet, including the header
+    max_rows_per_sheet = 1_048_575
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        output = io.BytesIO()
+        self.write(output, _tabular_rows(data))
+        return output.getvalue()
+
+    @classmethod
+    def write(
+        cls,
+        output,
+        rows: Iterable[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+        title: str = 'data',
+    ) -> None:
+        """
+        Write rows as a workbook to a binary file object.
+
+        Args:
+            output: Writable binary file object (e.g. a temporary file)
+            rows: Row dicts (e.g. from a server-side cursor)
+            columns: Column names in order (default: keys of the first row)
+            title: Worksheet title (further sheets get a numeric suffix)
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if columns is None:
+            columns = list(first) if first is not None else []
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title)
+        sheet.append(columns)
+        sheet_rows = 0
+
+        if first is not None:
+            for row in chain([first], rows):
+                if sheet_rows == cls.max_rows_per_sheet:
+                    sheet = workbook.create_sheet(f'{title}_{len(workbook.worksheets) + 1}')
+                    sheet.append(columns)
+                    sheet_rows = 0
+                sheet.append([cls._cell(row.get(column)) for column in columns])
+                sheet_rows += 1
+
+        workbook.save(output)
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        value = _cell_value(value)
+        if isinstance(value, str):
+            # Control characters are not allowed in worksheet XML
+            return ILLEGAL_CHARACTERS_RE.sub('', value)
+        return value
+
+
+class ParquetRenderer(BaseRenderer):
+    """
+    Parquet renderer (requires pyarrow, see requirements.txt).
+
+    Bulk export views write Parquet files themselves; this renderer makes
+    ?format=parquet negotiable and renders non-streamed payloads such as
+    error responses as a small table.
+    """
+
+    media_type = 'application/vnd.apache.parquet'
+    format = 'parquet'
+    charset = None
+    render_style = 'binary'
+
+    available = pa is not None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        output = io.BytesIO()
+        pq.write_table(pa.Table.from_pylist(_tabular_rows(data)), output)
+        return output.getvalue()
@@ -0,0 +1,77 @@
+"""
+Unit tests for the ASGI event stream disconnect wrapper
+"""
+import asyncio
+
+import pytest
+
+from apps.core.asgi import close_event_streams_on_disconnect
+
+
+def _scope(accept):
+    return {'type': 'http', 'headers': [(b'accept', accept)]}
+
+
+def _client(disconnect_after):
+    """receive() that delivers the request body, then disconnects after a delay."""
+    messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.sleep(disconnect_after)
+        return {'type': 'http.disconnect'}
+    return receive
+
+
+async def _send(message):
+    pass
+
+
+async def _stream_app(scope, receive, send, log):
+    await receive()
+    try:
+        await asyncio.sleep(10)
+        log.append('finished')
+    finally:
+        log.append('cleaned up')
+
+
+@pytest.mark.unit
+class TestCloseEventStreamsOnDisconnect:
+    """close_event_streams_on_disconnect() request cancellation"""
+
+    def test_event_stream_is_cancelled_on_disconnect(self):
+        """
+        Given: An event stream request still running when the client disconnects
+        When: http.disconnect arrives
+        Then: Should cancel the request (running its cleanup) and return normally
+        """
+        log = []
+        application = close_event_streams_on_disconnect(
+            lambda scope, receive, send: _stream_app(scope, receive, send, log)
+        )
+
+        asyncio.run(asyncio.wait_for(
+            application(_scope(b'text/event-stream'), _client(0.01), _send), timeout=1,
+        ))
+
+        assert log == ['cleaned up']
+
+    def test_other_requests_are_passed_through(self):
+        """
+        Given: A request that does not accept text/event-stream
+        When: Handled
+        Then: Should run the application without watching for disconnects
+        """
+        log = []
+        application = close_event_streams_on_disconnect(
+            lambda scope, receive, send: _stream_app(scope, receive, send, log)
+        )
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(
+                application(_scope(b'application/json'), _client(0.01), _send), timeout=0.2,
+            ))
+
+        assert log == ['cleaned up']
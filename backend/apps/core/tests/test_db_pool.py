@@ -0,0 +1,164 @@
+"""
+Unit tests for the PostgreSQL connection pool
+"""
+import threading
+import time
+
+import pytest
+from psycopg2.extensions import (
+    TRANSACTION_STATUS_IDLE,
+    TRANSACTION_STATUS_INTRANS,
+    TRANSACTION_STATUS_UNKNOWN,
+)
+
+from apps.core.postgresql_pool.pool import ConnectionPool, PoolTimeout
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql):
+        if not self.connection.alive:
+            raise Exception('server closed the connection unexpectedly')
+
+
+class FakeConnection:
+    """Stands in for a psycopg2 connection."""
+
+    def __init__(self):
+        self.closed = 0
+        self.alive = True
+        self.autocommit = True
+        self.rolled_back = False
+        self.info = type('Info', (), {'transaction_status': TRANSACTION_STATUS_IDLE})()
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        self.rolled_back = True
+        self.info.transaction_status = TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+def _pool(**options):
+    opened = []
+
+    def connect():
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    options = {'MIN_SIZE': 0, 'REAP_INTERVAL': 0, 'CHECK_AFTER': 60, **options}
+    return ConnectionPool('default', connect, **options), opened
+
+
+@pytest.mark.unit
+class TestConnectionPool:
+    """ConnectionPool checkout, return and reaping"""
+
+    def test_returned_connection_is_reused(self):
+        """
+        Given: A connection checked out and returned
+        When: Another checkout happens
+        Then: Should hand out the same connection without connecting again
+        """
+        pool, opened = _pool()
+
+        first = pool.getconn()
+        pool.putconn(first)
+        second = pool.getconn()
+
+        assert second is first
+        assert len(opened) == 1
+        assert pool.stats()['checkouts'] == 2
+
+    def test_exhausted_pool_times_out(self):
+        """
+        Given: All MAX_SIZE connections checked out
+        When: One more checkout waits past TIMEOUT
+        Then: Should raise PoolTimeout and count it
+        """
+        pool, _ = _pool(MAX_SIZE=1, TIMEOUT=0.05)
+        pool.getconn()
+
+        with pytest.raises(PoolTimeout):
+            pool.getconn()
+
+        assert pool.stats()['checkout_timeouts'] == 1
+
+    def test_waiting_checkout_gets_returned_connection(self):
+        """
+        Given: A full pool and a checkout waiting for a connection
+        When: Another thread returns its connection
+        Then: Should hand that connection to the waiting checkout
+        """
+        pool, opened = _pool(MAX_SIZE=1, TIMEOUT=5)
+        held = pool.getconn()
+        threading.Timer(0.05, pool.putconn, [held]).start()
+
+        assert pool.getconn() is held
+        assert len(opened) == 1
+        assert pool.stats()['checkouts_waited'] == 1
+
+    def test_dead_idle_connection_is_replaced_on_checkout(self):
+        """
+        Given: An idle connection dropped by the server (e.g. a database restart)
+        When: It is checked out after CHECK_AFTER seconds
+        Then: Should fail the health check, close it and open a new connection
+        """
+        pool, opened = _pool(CHECK_AFTER=0)
+        stale = pool.getconn()
+        pool.putconn(stale)
+        stale.alive = False
+
+        connection = pool.getconn()
+
+        assert connection is not stale
+        assert stale.closed
+        assert pool.stats()['health_check_failures'] == 1
+
+    def test_returned_connections_are_reset_or_discarded(self):
+        """
+        Given: Connections returned mid-transaction and broken
+        When: They are put back
+        Then: Should roll back the open transaction and close the broken one
+        """
+        pool, _ = _pool()
+        in_transaction, broken = pool.getconn(), pool.getconn()
+        in_transaction.info.transaction_status = TRANSACTION_STATUS_INTRANS
+        broken.info.transaction_status = TRANSACTION_STATUS_UNKNOWN
+
+        pool.putconn(in_transaction)
+        pool.putconn(broken)
+
+        assert in_transaction.rolled_back and not in_transaction.closed
+        assert broken.closed
+        assert pool.stats()['idle'] == 1
+
+    def test_reap_closes_idle_connections_above_min_size(self):
+        """
+        Given: Three idle connections past MAX_IDLE and MIN_SIZE 1
+        When: The reaper runs
+        Then: Should keep the most recently used one and close the rest
+        """
+        pool, opened = _pool(MIN_SIZE=1, MAX_IDLE=0)
+        connections = [pool.getconn() for _ in range(3)]
+        for connection in connections:
+            pool.putconn(connection)
+        time.sleep(0.01)
+
+        pool.reap()
+
+        stats = pool.stats()
+        assert (stats['size'], stats['idle'], stats['connections_closed']) == (1, 1, 2)
+        assert not connections[-1].closed
+        assert len(opened) == 3
@@ -0,0 +1,139 @@
+"""
+Unit tests for read-replica routing
+"""
+import contextvars
+
+import pytest
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.test import override_settings
+
+from apps.authentication.models import User
+from apps.core import db_routers
+from apps.core.db_routers import (
+    ReplicaRouter,
+    check_replica_cache,
+    pin_user_to_primary,
+    route_user_reads,
+    use_primary,
+)
+from apps.dashboard.models import FilterDimension
+from apps.data_upload.models import UploadedData
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """Pretend DATABASES has a replica alias."""
+    monkeypatch.setattr(db_routers, 'replica_configured', lambda: True)
+    cache.clear()
+    return ReplicaRouter()
+
+
+def _in_new_context(func):
+    return contextvars.copy_context().run(func)
+
+
+@pytest.mark.unit
+class TestReplicaRouter:
+    """ReplicaRouter read/write routing"""
+
+    def test_without_replica_uses_default_routing(self):
+        """
+        Given: No replica alias in DATABASES
+        When: A dashboard model is read
+        Then: Should leave routing to Django (default database)
+        """
+        assert ReplicaRouter().db_for_read(FilterDimension) is None
+
+    def test_reads_go_to_replica_and_writes_to_primary(self, replica):
+        """
+        Given: A configured replica
+        When: Dashboard and upload models are read and written
+        Then: Should read from the replica, write to the primary, and keep other apps on the primary
+        """
+        assert replica.db_for_read(FilterDimension) == 'replica'
+        assert replica.db_for_read(UploadedData) == 'replica'
+        assert replica.db_for_write(UploadedData) == 'default'
+        assert replica.db_for_read(User) is None
+
+    def test_reads_inside_primary_transaction_stay_on_primary(self, replica, monkeypatch):
+        """
+        Given: An open transaction on the primary (e.g. refreshing rollups during an upload)
+        When: A dashboard model is read
+        Then: Should read from the primary so the transaction's own writes are visible
+        """
+        monkeypatch.setattr(connections['default'], 'in_atomic_block', True)
+
+        assert replica.db_for_read(FilterDimension) == 'default'
+
+    def test_use_primary_pins_reads_in_block(self, replica):
+        """
+        Given: A use_primary() block
+        When: A dashboard model is read inside and after it
+        Then: Should read from the primary inside only
+        """
+        with use_primary():
+            assert replica.db_for_read(FilterDimension) == 'default'
+
+        assert replica.db_for_read(FilterDimension) == 'replica'
+
+    def test_recent_writer_reads_from_primary(self, replica):
+        """
+        Given: A user whose upload just committed
+        When: That user and another user are authenticated on later requests
+        Then: Should pin only the uploading user's reads to the primary
+        """
+        pin_user_to_primary(7)
+
+        def read_as(user_id):
+            route_user_reads(user_id)
+            return replica.db_for_read(UploadedData)
+
+        assert _in_new_context(lambda: read_as(7)) == 'default'
+        assert _in_new_context(lambda: read_as(8)) == 'replica'
+
+    def test_replica_is_never_migrated(self, replica):
+        """
+        Given: A configured replica
+        When: Django asks whether to migrate on each alias
+        Then: Should refuse the replica and defer on the primary
+        """
+        assert replica.allow_migrate('replica', 'dashboard') is False
+        assert replica.allow_migrate('default', 'dashboard') is None
+
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+REDIS_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://cache'}}
+
+
+@pytest.mark.unit
+class TestReplicaCacheCheck:
+    """Startup check that read-your-writes pins are visible to every worker"""
+
+    @override_settings(CACHES=LOCMEM_CACHE, DEBUG=False)
+    def test_replica_with_per_process_cache_fails(self, replica):
+        """
+        Given: A configured replica and the per-process memory cache
+        When: The app starts outside DEBUG
+        Then: Should raise ImproperlyConfigured
+        """
+        with pytest.raises(ImproperlyConfigured, match='REDIS_URL'):
+            check_replica_cache()
+
+    @pytest.mark.parametrize('cache_settings, debug, with_replica', [
+        (REDIS_CACHE, False, True),
+        (LOCMEM_CACHE, True, True),
+        (LOCMEM_CACHE, False, False),
+    ])
+    def test_shared_cache_debug_or_no_replica_starts(self, monkeypatch, cache_settings, debug, with_replica):
+        """
+        Given: A shared cache, DEBUG (single process) or no replica
+        When: The app starts
+        Then: Should not raise
+        """
+        monkeypatch.setattr(db_routers, 'replica_configured', lambda: with_replica)
+
+        with override_settings(CACHES=cache_settings, DEBUG=debug):
+            check_replica_cache()
+
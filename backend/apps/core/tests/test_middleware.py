@@ -0,0 +1,157 @@
+"""
+Unit tests for CompressionMiddleware
+"""
+import asyncio
+import gzip
+import json
+
+import pytest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import AsyncRequestFactory, RequestFactory
+
+from apps.core import middleware
+from apps.core.middleware import ASGIStreamingMiddleware, CompressionMiddleware, select_encoding
+
+
+LARGE_JSON = json.dumps([{'학과': '컴퓨터공학과', 'year': 2024}] * 200).encode('utf-8')
+
+
+def _process(body, accept_encoding, content_type='application/json', streaming=False):
+    request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+    if streaming:
+        response = StreamingHttpResponse(iter([body]), content_type=content_type)
+    else:
+        response = HttpResponse(body, content_type=content_type)
+        response['ETag'] = '"abc"'
+    return CompressionMiddleware(lambda request: response)(request)
+
+
+@pytest.mark.unit
+class TestSelectEncoding:
+    """Accept-Encoding negotiation"""
+
+    def test_prefers_brotli_when_available(self, monkeypatch):
+        """
+        Given: Client accepts gzip and br
+        When: brotli is installed / not installed
+        Then: Should choose br / gzip
+        """
+        monkeypatch.setattr(middleware, 'brotli', object())
+        assert select_encoding('gzip, deflate, br') == 'br'
+
+        monkeypatch.setattr(middleware, 'brotli', None)
+        assert select_encoding('gzip, deflate, br') == 'gzip'
+
+    def test_respects_q_values(self, monkeypatch):
+        """
+        Given: Client weights or refuses codings with q-values
+        When: Encoding is selected
+        Then: Should follow the weights and return None when all are refused
+        """
+        monkeypatch.setattr(middleware, 'brotli', object())
+
+        assert select_encoding('br;q=0.5, gzip;q=1.0') == 'gzip'
+        assert select_encoding('br;q=0, gzip;q=0') is None
+        assert select_encoding('identity') is None
+        assert select_encoding('*') == 'br'
+
+
+@pytest.mark.unit
+class TestCompressionMiddleware:
+    """Compression of JSON responses"""
+
+    def test_large_json_is_gzipped_and_etag_weakened(self, monkeypatch):
+        """
+        Given: JSON response above the size threshold
+        When: Client accepts gzip
+        Then: Should gzip the body, set Vary and weaken the ETag
+        """
+        monkeypatch.setattr(middleware, 'brotli', None)
+
+        response = _process(LARGE_JSON, 'gzip')
+
+        assert response['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(response.content) == LARGE_JSON
+        assert response['Content-Length'] == str(len(response.content))
+        assert response['ETag'] == 'W/"abc"'
+        assert 'Accept-Encoding' in response['Vary']
+
+    def test_small_or_non_json_responses_are_untouched(self):
+        """
+        Given: A small JSON response and a large HTML response
+        When: Client accepts gzip
+        Then: Should leave both uncompressed
+        """
+        assert not _process(b'{"a":1}', 'gzip').has_header('Content-Encoding')
+        assert not _process(LARGE_JSON, 'gzip', content_type='text/html').has_header('Content-Encoding')
+
+    def test_streaming_ndjson_is_compressed(self, monkeypatch):
+        """
+        Given: Streaming NDJSON response
+        When: Client accepts gzip
+        Then: Should compress the stream regardless of size
+        """
+        monkeypatch.setattr(middleware, 'brotli', None)
+
+        response = _process(b'{"a":1}\n', 'gzip', content_type='application/x-ndjson', streaming=True)
+
+        assert response['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(b''.join(response.streaming_content)) == b'{"a":1}\n'
+
+    def test_brotli_round_trip(self):
+        """
+        Given: brotli is installed
+        When: Client accepts br
+        Then: Should brotli-compress the body
+        """
+        brotli = pytest.importorskip('brotli')
+
+        response = _process(LARGE_JSON, 'br, gzip')
+
+        assert response['Content-Encoding'] == 'br'
+        assert brotli.decompress(response.content) == LARGE_JSON
+
+
+@pytest.mark.unit
+class TestASGIStreamingMiddleware:
+    """Synchronous streaming responses under ASGI"""
+
+    def test_sync_iterator_is_streamed_in_batches(self, monkeypatch):
+        """
+        Given: A streaming response over a synchronous generator, served through ASGI
+        When: The response is consumed asynchronously
+        Then: Should pull the generator in batches instead of collecting it all up front
+        """
+        monkeypatch.setattr(middleware, 'ASGI_STREAMING_BATCH_SIZE', 10)
+        produced = []
+
+        def rows():
+            for n in range(100):
+                produced.append(n)
+                yield b'{"n":%d}\n' % n
+
+        request = AsyncRequestFactory().get('/')
+        response = StreamingHttpResponse(rows(), content_type='application/x-ndjson')
+        response = ASGIStreamingMiddleware(lambda request: response)(request)
+
+        async def first_chunk():
+            content = response.__aiter__()
+            chunk = await content.__anext__()
+            await content.aclose()
+            return chunk
+
+        assert response.is_async
+        assert asyncio.run(first_chunk()) == b'{"n":0}\n'
+        assert len(produced) < 100
+
+    def test_wsgi_requests_are_untouched(self):
+        """
+        Given: A streaming response served through WSGI
+        When: Processed
+        Then: Should keep the synchronous iterator
+        """
+        response = StreamingHttpResponse(iter([b'a']), content_type='text/csv')
+        response = ASGIStreamingMiddleware(lambda request: response)(RequestFactory().get('/'))
+
+        assert not response.is_async
+        assert b''.join(response.streaming_content) == b'a'
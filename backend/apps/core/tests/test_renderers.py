@@ -0,0 +1,207 @@
+"""
+Unit tests for custom renderers
+"""
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.renderers import (
+    ArrowStreamRenderer,
+    CSVRenderer,
+    NDJSONRenderer,
+    ORJSONRenderer,
+    XLSXRenderer,
+)
+
+
+PAYLOAD = {
+    'count': 2,
+    'data': [
+        {'id': 1, 'year': 2024, '학과': '컴퓨터공학과', 'Impact_Factor': 3.9, '총연구비': Decimal('1500')},
+        {'id': 2, 'year': None, '학과': '수학과\u2028', 'Impact_Factor': None, '총연구비': Decimal('0')},
+    ],
+    'statistics': {'by_program': {'학사': 7, None: 1}},
+    'updated_at': datetime(2025, 1, 1, 9, 30, 0, 123456, tzinfo=timezone.utc),
+}
+
+
+@pytest.mark.unit
+class TestORJSONRenderer:
+    """ORJSONRenderer output compatibility"""
+
+    def test_output_matches_drf_json_renderer(self):
+        """
+        Given: Payload with Korean keys, None keys, Decimal, datetime and U+2028
+        When: Rendered by ORJSONRenderer and DRF's JSONRenderer
+        Then: Should produce identical bytes
+        """
+        assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+    def test_indent_request_falls_back_to_json_renderer(self):
+        """
+        Given: Client asks for indented JSON
+        When: Rendered by ORJSONRenderer
+        Then: Should return DRF's indented output
+        """
+        rendered = ORJSONRenderer().render({'a': 1}, 'application/json; indent=2')
+
+        assert rendered == b'{\n  "a": 1\n}'
+
+    def test_ndjson_line_is_compact_utf8(self):
+        """
+        Given: One row with a Korean value
+        When: Rendered as an NDJSON line
+        Then: Should be one UTF-8 JSON document followed by a newline
+        """
+        line = NDJSONRenderer.render_line({'학과': '수학과'})
+
+        assert line.endswith(b'\n')
+        assert json.loads(line) == {'학과': '수학과'}
+        assert '수학과'.encode('utf-8') in line
+
+
+@pytest.mark.unit
+class TestArrowStreamRenderer:
+    """ArrowStreamRenderer IPC stream output"""
+
+    def test_stream_round_trip_in_batches(self):
+        """
+        Given: Rows with a NULL-only column and values of other types in a later batch
+        When: Streamed in batches of two rows with the columns' value types
+        Then: Should read back as one table with the declared types and every value kept
+        """
+        pa = pytest.importorskip('pyarrow')
+        rows = [
+            {'id': 1, 'year': 2023, '학과': '컴퓨터공학과', 'IF': 2, 'note': None},
+            {'id': 2, 'year': None, '학과': '수학과', 'IF': 3, 'note': None},
+            {'id': 3, 'year': 2024, '학과': 7, 'IF': 3.7, 'note': {'x': [1]}},
+        ]
+        types = {'id': 'integer', 'year': 'integer', '학과': 'string', 'IF': 'number'}
+
+        chunks = list(ArrowStreamRenderer.stream(
+            iter(rows), ['id', 'year', '학과', 'IF', 'note'], batch_size=2, types=types,
+        ))
+        reader = pa.ipc.open_stream(b''.join(chunks))
+        table = reader.read_all()
+
+        assert table.schema.field('year').type == pa.int64()
+        assert table.schema.field('IF').type == pa.float64()
+        assert table.schema.field('note').type == pa.string()
+        assert table.to_pydict() == {
+            'id': [1, 2, 3],
+            'year': [2023, None, 2024],
+            '학과': ['컴퓨터공학과', '수학과', '7'],
+            'IF': [2.0, 3.0, 3.7],
+            'note': [None, None, '{"x": [1]}'],
+        }
+
+    @pytest.mark.parametrize('value', [3.7, 'N/A', True])
+    def test_value_outside_declared_type_raises(self, value):
+        """
+        Given: An integer column and a later value that is not an integer
+        When: The batch holding the value is streamed
+        Then: Should raise ValueError instead of truncating the value or sending null
+        """
+        pytest.importorskip('pyarrow')
+        rows = [{'n': 2}, {'n': 3}, {'n': value}]
+
+        chunks = ArrowStreamRenderer.stream(rows, types={'n': 'integer'}, batch_size=2)
+
+        with pytest.raises(ValueError, match="'n'"):
+            list(chunks)
+
+    def test_empty_rows_produce_schema_only_stream(self):
+        """
+        Given: No rows
+        When: Streamed with a column list
+        Then: Should produce a valid stream with an empty table
+        """
+        pa = pytest.importorskip('pyarrow')
+
+        table = pa.ipc.open_stream(b''.join(ArrowStreamRenderer.stream([], ['id']))).read_all()
+
+        assert table.column_names == ['id']
+        assert table.num_rows == 0
+
+    def test_render_uses_data_list_of_payload(self):
+        """
+        Given: A list response payload
+        When: Rendered without streaming
+        Then: Should render the rows under 'data'
+        """
+        pa = pytest.importorskip('pyarrow')
+
+        rendered = ArrowStreamRenderer().render({'count': 1, 'data': [{'id': 1}]})
+
+        assert pa.ipc.open_stream(rendered).read_all().to_pydict() == {'id': [1]}
+
+    def test_render_widens_types_over_all_rows(self):
+        """
+        Given: A payload whose later rows do not fit the types of the first row
+        When: Rendered without streaming
+        Then: Should widen integers with numbers to float and other mixes to text
+        """
+        pa = pytest.importorskip('pyarrow')
+        rows = [{'a': 2, 'b': 2}, {'a': 3, 'b': 3}, {'a': 3.7, 'b': 'N/A'}]
+
+        rendered = ArrowStreamRenderer().render({'count': 3, 'data': rows})
+
+        assert pa.ipc.open_stream(rendered).read_all().to_pydict() == {
+            'a': [2.0, 3.0, 3.7],
+            'b': ['2', '3', 'N/A'],
+        }
+
+
+@pytest.mark.unit
+class TestCSVRenderer:
+    """CSVRenderer streamed output"""
+
+    def test_stream_writes_bom_header_and_rows_in_chunks(self, monkeypatch):
+        """
+        Given: Rows with missing keys, nested values and a small chunk size
+        When: Streamed with a column list
+        Then: Should yield several chunks that parse back to the declared columns
+        """
+        monkeypatch.setattr(CSVRenderer, 'chunk_size', 16)
+        rows = [
+            {'id': 1, '학과': '컴퓨터공학과', 'tags': ['a', 'b']},
+            {'id': 2, '학과': '수학과, 통계'},
+        ]
+
+        chunks = list(CSVRenderer.stream(iter(rows), ['id', '학과', 'tags']))
+        text = b''.join(chunks).decode('utf-8')
+
+        assert len(chunks) > 1
+        assert text.startswith('\ufeff')
+        assert list(csv.reader(io.StringIO(text[1:]))) == [
+            ['id', '학과', 'tags'],
+            ['1', '컴퓨터공학과', '["a", "b"]'],
+            ['2', '수학과, 통계', ''],
+        ]
+
+
+@pytest.mark.unit
+class TestXLSXRenderer:
+    """XLSXRenderer write-only workbook output"""
+
+    def test_rows_continue_on_new_sheet_past_row_limit(self, monkeypatch):
+        """
+        Given: Three rows and a two-row sheet limit
+        When: Written as a workbook
+        Then: Should repeat the header on a second sheet for the remaining row
+        """
+        openpyxl = pytest.importorskip('openpyxl')
+        monkeypatch.setattr(XLSXRenderer, 'max_rows_per_sheet', 2)
+        output = io.BytesIO()
+
+        XLSXRenderer.write(output, iter([{'id': 1}, {'id': 2}, {'id': 3, '비고': 'x\x07'}]), ['id', '비고'])
+
+        workbook = openpyxl.load_workbook(output)
+        assert workbook.sheetnames == ['data', 'data_2']
+        assert list(workbook['data'].values) == [('id', '비고'), (1, None), (2, None)]
+        assert list(workbook['data_2'].values) == [('id', '비고'), (3, 'x')]
@@ -0,0 +1,60 @@
+"""
+Unit tests for AsyncAPIView
+"""
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.core.views import AsyncAPIView
+
+
+class EchoView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request):
+        return Response({'method': 'get'})
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+def _call(request):
+    return async_to_sync(_await)(EchoView.as_view()(request))
+
+
+@pytest.mark.unit
+class TestAsyncAPIView:
+    """DRF request handling around coroutine handlers"""
+
+    def test_async_handler_response_is_finalized(self):
+        """
+        Given: An authenticated request to a view with an async get()
+        When: The view is called
+        Then: Should be a coroutine view and return the rendered-ready DRF response
+        """
+        request = APIRequestFactory().get('/echo/')
+        force_authenticate(request, user=type('User', (), {'is_authenticated': True})())
+
+        response = _call(request)
+
+        assert EchoView.view_is_async
+        assert response.status_code == 200
+        assert response.data == {'method': 'get'}
+        assert response.accepted_renderer is not None
+
+    def test_permission_denied_is_handled_before_handler(self):
+        """
+        Given: An anonymous request
+        When: The view is called
+        Then: Should return DRF's error response from the synchronous permission checks
+        """
+        request = APIRequestFactory().get('/echo/')
+        force_authenticate(request, user=AnonymousUser())
+
+        response = _call(request)
+
+        assert response.status_code in (401, 403)
@@ -0,0 +1,11 @@
+"""
+URL configuration for operational endpoints.
+"""
+from django.urls import path
+from .views import DatabasePoolView
+
+app_name = 'core'
+
+urlpatterns = [
+    path('db-pool/', DatabasePoolView.as_view(), name='db-pool'),
+]
@@ -0,0 +1,61 @@
+"""
+Async support for DRF API views and operational endpoints.
+"""
+import inspect
+
+from asgiref.sync import sync_to_async
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .permissions import IsAdminUser
+from .postgresql_pool.pool import pool_stats
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are coroutines (async def get(...)).
+
+    Django runs the view on the event loop under ASGI (and through
+    async_to_sync under WSGI). Authentication, permissions and throttling
+    stay synchronous and run in the request thread via sync_to_async, so
+    existing authentication classes and mixins overriding initial() or
+    finalize_response() keep working unchanged.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class DatabasePoolView(APIView):
+    """
+    GET /api/health/db-pool/
+
+    Connection pool metrics of the worker process that served the request
+    (admin only). Each gunicorn worker has its own pools.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response({'pools': pool_stats()})
@@ -0,0 +1,106 @@
+"""
+Aggregations over dashboard list rows.
+
+Rows are the dicts produced by DashboardRepository (columns plus the
+metadata spread), so the same functions serve the per-endpoint queries
+and the bootstrap endpoint, which aggregates one shared scan per data type.
+"""
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+def to_int(value: Any) -> int:
+    """총연구비 등 숫자 metadata를 int로 변환 (변환 불가 시 0)."""
+    if not value:
+        return 0
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+def summarize_research_projects(rows: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    연구 과제 수(과제번호 기준 중복 제거)와 총 연구비 합계.
+    
+    Returns:
+        Tuple[int, int]: (unique project count, total budget)
+    """
+    unique_projects = set()
+    total_budget = 0
+    
+    for row in rows:
+        project_number = row.get('과제번호')
+        if project_number:
+            unique_projects.add(project_number)
+        total_budget += to_int(row.get('총연구비', 0))
+    
+    return len(unique_projects), total_budget
+
+
+def summarize_publication_trends(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    연도별 논문 수 집계 (연도 오름차순, 연도 없음은 마지막).
+    
+    Returns:
+        List[Dict]: [{'year': int, 'count': int}]
+    """
+    counts = {}
+    for row in rows:
+        counts[row.get('year')] = counts.get(row.get('year'), 0) + 1
+    
+    return [
+        {'year': year, 'count': counts[year]}
+        for year in sorted(counts, key=lambda year: (year is None, year or 0))
+    ]
+
+
+def summarize_research_by_department(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    학과별 연구 프로젝트 수와 총 연구비.
+    
+    Returns:
+        List[Dict]: [{'department', 'project_count', 'total_budget'}]
+    """
+    dept_data = {}
+    for row in rows:
+        dept = row.get('department')
+        if dept not in dept_data:
+            dept_data[dept] = {'count': 0, 'total_budget': 0}
+        
+        dept_data[dept]['count'] += 1
+        dept_data[dept]['total_budget'] += to_int(row.get('총연구비', 0))
+    
+    return [
+        {
+            'department': dept,
+            'project_count': data['count'],
+            'total_budget': data['total_budget'],
+        }
+        for dept, data in dept_data.items()
+    ]
+
+
+def summarize_student_statistics(rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    학생 통계 (총학생수, 과정구분/학적상태별 분포).
+    
+    Returns:
+        Dict: {'total_students', 'by_program', 'by_status'}
+    """
+    total_students = 0
+    program_counts = {}
+    status_counts = {}
+    
+    for row in rows:
+        total_students += 1
+        program = row.get('과정구분', 'Unknown')
+        status = row.get('학적상태', 'Unknown')
+        
+        program_counts[program] = program_counts.get(program, 0) + 1
+        status_counts[status] = status_counts.get(status, 0) + 1
+    
+    return {
+        'total_students': total_students,
+        'by_program': program_counts,
+        'by_status': status_counts,
+    }
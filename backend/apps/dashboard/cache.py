@@ -0,0 +1,261 @@
+"""
+Result cache for dashboard responses.
+
+Entries are keyed by endpoint, request parameters and the dataset versions
+the result depends on, so an upload makes every dependent entry unreachable
+without explicit invalidation. Backed by Django's cache framework
+(DASHBOARD_RESULT_CACHE alias, 'default' unless configured).
+
+Misses are single-flight: concurrent requests for the same key in one
+process wait for a single computation, and processes sharing the cache
+backend coordinate through a cache.add() lock so only one of them computes.
+
+Stale-while-revalidate: the latest result per (endpoint, params) is also
+kept regardless of version. For DASHBOARD_STALE_WHILE_REVALIDATE seconds
+after a dataset changes, a miss on the new version serves that previous
+result and recomputes in a background thread pool, so requests right
+after an upload never wait for an aggregation. Requests that received a
+stale result are flagged through StaleTracker so views can skip validators.
+"""
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Callable, Dict, Optional, Set
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import close_old_connections
+from django.utils import timezone
+
+
+RESULT_CACHE_ALIAS = getattr(settings, 'DASHBOARD_RESULT_CACHE', 'default')
+
+RESULT_CACHE_TIMEOUT = getattr(settings, 'DASHBOARD_RESULT_CACHE_TIMEOUT', 60 * 60)
+
+# Cross-process single-flight lock (only effective with a shared cache backend)
+RESULT_CACHE_LOCK = getattr(settings, 'DASHBOARD_RESULT_CACHE_LOCK', True)
+
+# Upper bound on how long a computation may hold the lock / others wait for it
+RESULT_CACHE_LOCK_TIMEOUT = getattr(settings, 'DASHBOARD_RESULT_CACHE_LOCK_TIMEOUT', 30)
+
+# Seconds after a dataset change during which the previous result may be served (0 = off).
+# Off unless a settings module opts in: the uploader would otherwise see pre-upload numbers.
+STALE_WHILE_REVALIDATE = getattr(settings, 'DASHBOARD_STALE_WHILE_REVALIDATE', 0)
+
+# Background refresh threads per process
+REFRESH_MAX_WORKERS = getattr(settings, 'DASHBOARD_REFRESH_MAX_WORKERS', 2)
+
+LOCK_POLL_INTERVAL = 0.05
+
+
+def _params_digest(params: Dict[str, Any]) -> str:
+    return hashlib.sha1(
+        json.dumps(params, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+
+
+def make_cache_key(endpoint: str, versions: Dict[str, int], params: Dict[str, Any]) -> str:
+    """
+    Cache key for one dashboard result.
+
+    Args:
+        endpoint: Logical endpoint name (e.g. 'summary')
+        versions: {data_type: dataset version} the result depends on
+        params: Request parameters (filters, fields)
+    """
+    version_part = ','.join(f'{data_type}={versions[data_type]}' for data_type in sorted(versions))
+    return f'dashboard:result:{endpoint}:{version_part}:{_params_digest(params)}'
+
+
+def make_latest_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """Cache key of the most recent result for endpoint/params, any version."""
+    return f'dashboard:result:{endpoint}:latest:{_params_digest(params)}'
+
+
+class StaleTracker:
+    """Per-request flag set when a stale result was served."""
+
+    def __init__(self):
+        self.stale = False
+
+
+_stale_tracker: ContextVar[Optional[StaleTracker]] = ContextVar('dashboard_stale_tracker', default=None)
+
+
+def track_stale_results() -> StaleTracker:
+    """Start tracking stale results for the current request context."""
+    tracker = StaleTracker()
+    _stale_tracker.set(tracker)
+    return tracker
+
+
+def _mark_stale() -> None:
+    tracker = _stale_tracker.get()
+    if tracker is not None:
+        tracker.stale = True
+
+
+class _Flight:
+    """One in-progress computation that other threads can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ResultCache:
+    """Version-keyed dashboard result cache with single-flight misses."""
+
+    def __init__(
+        self,
+        alias: str = RESULT_CACHE_ALIAS,
+        timeout: int = RESULT_CACHE_TIMEOUT,
+        cross_process_lock: bool = RESULT_CACHE_LOCK,
+        lock_timeout: int = RESULT_CACHE_LOCK_TIMEOUT,
+        stale_while_revalidate: int = STALE_WHILE_REVALIDATE,
+    ):
+        self.alias = alias
+        self.timeout = timeout
+        self.cross_process_lock = cross_process_lock
+        self.lock_timeout = lock_timeout
+        self.stale_while_revalidate = stale_while_revalidate
+        self._flights: Dict[str, _Flight] = {}
+        # Keys with a background refresh queued or running (guarded by _flights_lock)
+        self._pending_refresh: Set[str] = set()
+        self._flights_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def get_or_compute(
+        self,
+        endpoint: str,
+        versions: Dict[str, int],
+        params: Dict[str, Any],
+        compute: Callable[[], Any],
+        changed_at: Optional[datetime] = None,
+    ) -> Any:
+        """
+        Return the cached result, computing it once on a miss.
+
+        Args:
+            changed_at: When the newest of the dataset versions was created;
+                enables serving the previous result within the stale window
+        """
+        key = make_cache_key(endpoint, versions, params)
+        latest_key = make_latest_key(endpoint, params)
+
+        result = self.backend.get(key)
+        if result is not None:
+            return result
+
+        if self._within_stale_window(changed_at):
+            stale = self.backend.get(latest_key)
+            if stale is not None:
+                self._schedule_refresh(key, latest_key, compute)
+                _mark_stale()
+                return stale
+
+        return self._single_flight(key, latest_key, compute)
+
+    def _within_stale_window(self, changed_at: Optional[datetime]) -> bool:
+        if not self.stale_while_revalidate or changed_at is None:
+            return False
+        if timezone.is_naive(changed_at):
+            # dataset_versions.updated_at is TIMESTAMP (UTC session time zone)
+            changed_at = timezone.make_aware(changed_at, dt_timezone.utc)
+        return timezone.now() - changed_at <= timedelta(seconds=self.stale_while_revalidate)
+
+    def _single_flight(self, key: str, latest_key: str, compute: Callable[[], Any]) -> Any:
+        """Compute key once per process; concurrent callers share the outcome."""
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self._compute_once(key, latest_key, compute)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _compute_once(self, key: str, latest_key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Compute and store a result, letting only one process compute per key.
+
+        Processes that lose the lock poll the cache until the winner stores
+        the result; if the lock expires first they compute it themselves.
+        """
+        lock_key = f'{key}:lock'
+        locked = False
+
+        if self.cross_process_lock:
+            deadline = time.monotonic() + self.lock_timeout
+            while True:
+                locked = self.backend.add(lock_key, 1, self.lock_timeout)
+                if locked or time.monotonic() >= deadline:
+                    break
+                time.sleep(LOCK_POLL_INTERVAL)
+                result = self.backend.get(key)
+                if result is not None:
+                    return result
+
+        try:
+            # Another process may have stored the result before we got the lock
+            result = self.backend.get(key) if locked else None
+            if result is None:
+                result = compute()
+                self.backend.set_many({key: result, latest_key: result}, self.timeout)
+            return result
+        finally:
+            if locked:
+                self.backend.delete(lock_key)
+
+    def _schedule_refresh(self, key: str, latest_key: str, compute: Callable[[], Any]) -> None:
+        """Recompute key in the background unless this process is already on it."""
+        with self._flights_lock:
+            # A queued refresh has no flight yet; test-and-add so concurrent stale hits submit once
+            if key in self._flights or key in self._pending_refresh:
+                return
+            self._pending_refresh.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=REFRESH_MAX_WORKERS,
+                    thread_name_prefix='dashboard-refresh',
+                )
+
+        self._executor.submit(self._refresh, key, latest_key, compute)
+
+    def _refresh(self, key: str, latest_key: str, compute: Callable[[], Any]) -> None:
+        close_old_connections()
+        try:
+            self._single_flight(key, latest_key, compute)
+        except Exception:
+            # The next request retries; a failed refresh must not surface anywhere
+            pass
+        finally:
+            with self._flights_lock:
+                self._pending_refresh.discard(key)
+            close_old_connections()
+
+
+result_cache = ResultCache()
@@ -0,0 +1,293 @@
+"""
+In-process columnar cache of uploaded datasets.
+
+Each worker loads a data type from uploaded_data once per dataset version
+into NumPy arrays (categorical codes for string columns, typed arrays for
+numeric metadata) and answers dashboard aggregations with vectorized
+masks and bincount instead of scanning the table on every request.
+"""
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from django.db import connections, router, transaction
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.db.models.fields.json import KeyTransform
+
+from apps.data_upload.models import DatasetVersion, UploadedData
+from .aggregations import to_int
+
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for NULL years in the int64 year column
+YEAR_NULL = np.iinfo(np.int64).min
+
+# Categorical columns common to every data type
+CATEGORY_COLUMNS = ('semester', 'college', 'department')
+
+# Metadata keys loaded per data type: key -> value used when the key is missing
+METADATA_COLUMNS = {
+    'research': {'과제번호': None, '총연구비': 0},
+    'student': {'과정구분': 'Unknown', '학적상태': 'Unknown'},
+}
+
+# Metadata keys stored as int64 (converted like the Python aggregations)
+NUMERIC_METADATA = {'총연구비'}
+
+LOAD_CHUNK_SIZE = 5000
+
+
+class CategoricalColumn:
+    """String column stored as int32 codes into a category list (-1 = NULL)."""
+
+    def __init__(self, codes: np.ndarray, categories: List[Any]):
+        self.codes = codes
+        self.categories = categories
+        self._index = {value: code for code, value in enumerate(categories)}
+
+    @classmethod
+    def from_values(cls, values: List[Any]) -> 'CategoricalColumn':
+        """Encode values in order of first appearance."""
+        index = {}
+        codes = np.empty(len(values), dtype=np.int32)
+        for position, value in enumerate(values):
+            if value is None:
+                codes[position] = -1
+            else:
+                codes[position] = index.setdefault(value, len(index))
+        return cls(codes, list(index))
+
+    def equals(self, value: Any) -> np.ndarray:
+        """Boolean mask of rows equal to value."""
+        code = self._index.get(value)
+        if code is None:
+            return np.zeros(len(self.codes), dtype=bool)
+        return self.codes == code
+
+    def value_of(self, code: int) -> Any:
+        """Decode a category code."""
+        return None if code < 0 else self.categories[code]
+
+
+class ColumnarDataset:
+    """
+    One data type at one dataset version, held as columns.
+    
+    token is the version's dataset_versions.version_token; it tells this
+    database's version N apart from another database's (empty if unknown).
+    """
+
+    def __init__(self, data_type: str, version: int, columns: Dict[str, Any], token: str = ''):
+        self.data_type = data_type
+        self.version = version
+        self.columns = columns
+        self.token = token
+        self.size = len(columns['id'])
+
+    def mask(
+        self,
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+    ) -> np.ndarray:
+        """Boolean row mask with the repository's filter semantics."""
+        mask = np.ones(self.size, dtype=bool)
+
+        if year:
+            mask &= self.columns['year'] == year
+        if semester and semester != 'all':
+            mask &= self.columns['semester'].equals(semester)
+        if college and college != 'all':
+            mask &= self.columns['college'].equals(college)
+        if department:
+            mask &= self.columns['department'].equals(department)
+
+        return mask
+
+    def value_counts(self, column: str, mask: np.ndarray) -> Dict[Any, int]:
+        """Row counts per category value (first-appearance order)."""
+        categorical = self.columns[column]
+        counts = np.bincount(categorical.codes[mask] + 1, minlength=len(categorical.categories) + 1)
+        return {
+            categorical.value_of(code - 1): int(count)
+            for code, count in enumerate(counts)
+            if count
+        }
+
+    def group_sum(self, column: str, values: str, mask: np.ndarray) -> Dict[Any, int]:
+        """Sum of a numeric column per category value (first-appearance order)."""
+        categorical = self.columns[column]
+        sums = np.bincount(
+            categorical.codes[mask] + 1,
+            weights=self.columns[values][mask],
+            minlength=len(categorical.categories) + 1,
+        )
+        present = np.bincount(categorical.codes[mask] + 1, minlength=len(categorical.categories) + 1)
+        return {
+            categorical.value_of(code - 1): int(total)
+            for code, (total, count) in enumerate(zip(sums, present))
+            if count
+        }
+
+    def distinct_truthy(self, column: str, mask: np.ndarray) -> int:
+        """Number of distinct non-empty category values."""
+        categorical = self.columns[column]
+        codes = np.unique(categorical.codes[mask])
+        return sum(1 for code in codes if categorical.value_of(int(code)))
+
+    def year_counts(self, mask: np.ndarray) -> List[Dict[str, Any]]:
+        """Row counts per year, ascending with NULL last."""
+        years, counts = np.unique(self.columns['year'][mask], return_counts=True)
+        trends = [
+            {'year': int(year), 'count': int(count)}
+            for year, count in zip(years, counts)
+            if year != YEAR_NULL
+        ]
+        if len(years) and years[0] == YEAR_NULL:
+            trends.append({'year': None, 'count': int(counts[0])})
+        return trends
+
+
+def read_dataset_version(data_type: str, using: str) -> Tuple[int, str]:
+    """(version, version_token) of a data type, or (0, '') before its first upload."""
+    row = (
+        DatasetVersion.objects
+        .using(using)
+        .filter(data_type=data_type)
+        .values_list('version', 'version_token')
+        .first()
+    )
+    return row or (0, '')
+
+
+def load_columnar_dataset(data_type: str, using: Optional[str] = None) -> ColumnarDataset:
+    """
+    Load the current version of one data type from uploaded_data into columns.
+
+    The version and the rows are read in one REPEATABLE READ transaction, so
+    the dataset holds exactly the rows of the version it is labelled with
+    even if an upload commits while it loads. Only the filter columns and
+    the metadata keys used by aggregations are fetched (metadata -> key),
+    streamed through a server-side cursor.
+    """
+    using = using or router.db_for_read(UploadedData)
+    connection = connections[using]
+    with transaction.atomic(using=using):
+        if connection.vendor == 'postgresql' and len(connection.atomic_blocks) == 1:
+            # First statement of the transaction; a caller's open transaction keeps its own snapshot
+            with connection.cursor() as cursor:
+                cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ')
+        version, token = read_dataset_version(data_type, using)
+        columns = _load_columns(data_type, using)
+    
+    return ColumnarDataset(data_type, version, columns, token)
+
+
+def _load_columns(data_type: str, using: str) -> Dict[str, Any]:
+    """Fetch and encode the columns of one data type."""
+    metadata_columns = METADATA_COLUMNS.get(data_type, {})
+    annotations = {}
+    for index, key in enumerate(metadata_columns):
+        annotations[f'metadata_{index}'] = KeyTransform(key, 'metadata')
+        annotations[f'has_key_{index}'] = ExpressionWrapper(
+            Q(metadata__has_key=key),
+            output_field=BooleanField(),
+        )
+
+    queryset = (
+        UploadedData.objects
+        .using(using)
+        .filter(data_type=data_type)
+        .annotate(**annotations)
+        .order_by('id')
+        .values_list('id', 'year', *CATEGORY_COLUMNS, *annotations)
+    )
+
+    raw = {name: [] for name in ('id', 'year', *CATEGORY_COLUMNS, *metadata_columns)}
+    for row in queryset.iterator(chunk_size=LOAD_CHUNK_SIZE):
+        raw['id'].append(row[0])
+        raw['year'].append(YEAR_NULL if row[1] is None else row[1])
+        for offset, column in enumerate(CATEGORY_COLUMNS, start=2):
+            raw[column].append(row[offset])
+        for index, (key, default) in enumerate(metadata_columns.items()):
+            value = row[5 + 2 * index]
+            has_key = row[6 + 2 * index]
+            raw[key].append(value if has_key else default)
+
+    columns = {
+        'id': np.array(raw['id'], dtype=np.int64),
+        'year': np.array(raw['year'], dtype=np.int64),
+    }
+    for column in CATEGORY_COLUMNS:
+        columns[column] = CategoricalColumn.from_values(raw[column])
+    for key in metadata_columns:
+        if key in NUMERIC_METADATA:
+            columns[key] = np.array([to_int(value) for value in raw[key]], dtype=np.int64)
+        else:
+            columns[key] = CategoricalColumn.from_values(raw[key])
+
+    return columns
+
+
+class ColumnarCache:
+    """
+    Per-process cache of ColumnarDataset keyed by data type, invalidated by version.
+
+    Datasets are mapped from the shared snapshots (see snapshots.py) when
+    available, so workers hold references to the same page cache.
+    """
+
+    def __init__(self):
+        self._datasets: Dict[str, ColumnarDataset] = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def _lock_for(self, data_type: str) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(data_type, threading.Lock())
+
+    def get(self, data_type: str, version: int) -> ColumnarDataset:
+        """Return the dataset for version, loading it once if missing or stale."""
+        dataset = self._datasets.get(data_type)
+        if dataset is not None and dataset.version == version:
+            return dataset
+
+        with self._lock_for(data_type):
+            dataset = self._datasets.get(data_type)
+            if dataset is None or dataset.version != version:
+                dataset = self._load(data_type, version)
+                self._datasets[data_type] = dataset
+            return dataset
+
+    def _load(self, data_type: str, version: int) -> ColumnarDataset:
+        """
+        Map the shared snapshot of the current version if one exists,
+        otherwise load the current version and publish it.
+        
+        The dataset may be newer than version when an upload committed in
+        between; it is labelled with the version its rows belong to.
+        """
+        from .snapshots import load_snapshot, write_snapshot
+
+        using = router.db_for_read(UploadedData)
+        current_version, token = read_dataset_version(data_type, using)
+        if current_version == version:
+            dataset = load_snapshot(data_type, version, token)
+            if dataset is not None:
+                return dataset
+
+        dataset = load_columnar_dataset(data_type, using)
+        try:
+            write_snapshot(dataset)
+        except OSError as e:
+            logger.warning(f"Failed to write dashboard snapshot {data_type} v{dataset.version}: {e}")
+        return dataset
+
+    def clear(self) -> None:
+        self._datasets.clear()
+
+
+columnar_cache = ColumnarCache()
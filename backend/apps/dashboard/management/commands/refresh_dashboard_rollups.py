@@ -0,0 +1,18 @@
+"""
+Django management command to rebuild the dashboard rollup table.
+"""
+from django.core.management.base import BaseCommand
+from apps.dashboard.repositories import DashboardRepository
+from apps.dashboard.services import ALL_DATA_TYPES
+
+
+class Command(BaseCommand):
+    help = '대시보드 롤업 테이블을 모든 데이터 타입에 대해 다시 계산합니다'
+
+    def handle(self, *args, **options):
+        repository = DashboardRepository()
+        for data_type in ALL_DATA_TYPES:
+            count = repository.refresh_rollups(data_type)
+            self.stdout.write(f'   {data_type}: {count}')
+
+        self.stdout.write(self.style.SUCCESS('✅ 대시보드 롤업 갱신 완료'))
@@ -0,0 +1,16 @@
+"""
+Django management command to precompute dashboard cache entries.
+"""
+from django.core.management.base import BaseCommand
+from apps.dashboard.services import DashboardService
+
+
+class Command(BaseCommand):
+    help = '대시보드 캐시(필터, 연도별 요약, 단과대학별 KPI)를 미리 계산합니다'
+
+    def handle(self, *args, **options):
+        counts = DashboardService().warm_up()
+
+        self.stdout.write(self.style.SUCCESS('✅ 대시보드 캐시 워밍업 완료'))
+        for section, count in counts.items():
+            self.stdout.write(f'   {section}: {count}')
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FilterDimension',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('data_type', models.CharField(max_length=50)),
+                ('dimension', models.CharField(choices=[('year', 'Year'), ('college', 'College'), ('department', 'Department'), ('semester', 'Semester')], max_length=20)),
+                ('value', models.CharField(max_length=100)),
+                ('row_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'dashboard_filter_dimensions',
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardRollup',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('data_type', models.CharField(max_length=50)),
+                ('year', models.IntegerField(blank=True, null=True)),
+                ('semester', models.CharField(blank=True, max_length=10, null=True)),
+                ('college', models.CharField(blank=True, max_length=100, null=True)),
+                ('department', models.CharField(blank=True, max_length=100, null=True)),
+                ('metric_key', models.CharField(default='', max_length=50)),
+                ('metric_value', models.CharField(blank=True, max_length=255, null=True)),
+                ('row_count', models.IntegerField(default=0)),
+                ('budget_sum', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'dashboard_rollups',
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0002_dashboardrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatasetRowState',
+            fields=[
+                ('data_type', models.CharField(max_length=50)),
+                ('row_key', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('row_id', models.BigIntegerField()),
+            ],
+            options={
+                'db_table': 'dataset_row_state',
+                'managed': False,
+                'unique_together': {('data_type', 'row_key')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DatasetChange',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('data_type', models.CharField(max_length=50)),
+                ('version', models.BigIntegerField()),
+                ('row_key', models.CharField(max_length=64)),
+                ('op', models.CharField(choices=[('I', 'Insert'), ('D', 'Delete')], max_length=1)),
+            ],
+            options={
+                'db_table': 'dataset_changes',
+                'managed': False,
+            },
+        ),
+    ]
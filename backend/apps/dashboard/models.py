@@ -1 +1,115 @@
-# Dashboard app models
+"""
+Models for dashboard app.
+"""
+from django.db import models
+
+
+class FilterDimension(models.Model):
+    """Distinct filter values per data type (maintained on upload/delete)."""
+
+    DIMENSION_CHOICES = [
+        ('year', 'Year'),
+        ('college', 'College'),
+        ('department', 'Department'),
+        ('semester', 'Semester'),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    data_type = models.CharField(max_length=50)
+    dimension = models.CharField(max_length=20, choices=DIMENSION_CHOICES)
+    value = models.CharField(max_length=100)
+    row_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'dashboard_filter_dimensions'
+        managed = False
+        unique_together = [('data_type', 'dimension', 'value')]
+        indexes = [
+            models.Index(fields=['dimension']),
+        ]
+
+    def __str__(self):
+        return f"{self.data_type} - {self.dimension}={self.value}"
+
+
+class DashboardRollup(models.Model):
+    """
+    Pre-aggregated counts/sums per data type at the dashboard filter grain.
+
+    metric_key '' holds row counts and budget sums; other keys hold
+    per-value counts of a metadata field (e.g. 과정구분, 과제번호).
+    Refreshed by refresh_dashboard_rollups() on upload/delete.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    data_type = models.CharField(max_length=50)
+    year = models.IntegerField(null=True, blank=True)
+    semester = models.CharField(max_length=10, null=True, blank=True)
+    college = models.CharField(max_length=100, null=True, blank=True)
+    department = models.CharField(max_length=100, null=True, blank=True)
+    metric_key = models.CharField(max_length=50, default='')
+    metric_value = models.CharField(max_length=255, null=True, blank=True)
+    row_count = models.IntegerField(default=0)
+    budget_sum = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'dashboard_rollups'
+        managed = False
+        indexes = [
+            models.Index(fields=['data_type', 'metric_key', 'year']),
+        ]
+
+    def __str__(self):
+        return f"{self.data_type} - {self.year} {self.metric_key}={self.metric_value}"
+
+
+class DatasetRowState(models.Model):
+    """
+    Content key of every current row per data type (maintained on upload/delete).
+
+    row_key is an md5 of the row content plus an occurrence number, so rows
+    keep their key across full-replace uploads even though their ids change.
+    """
+
+    data_type = models.CharField(max_length=50)
+    row_key = models.CharField(max_length=64, primary_key=True)
+    row_id = models.BigIntegerField()
+
+    class Meta:
+        db_table = 'dataset_row_state'
+        managed = False
+        unique_together = [('data_type', 'row_key')]
+
+    def __str__(self):
+        return f"{self.data_type} - {self.row_key}"
+
+
+class DatasetChange(models.Model):
+    """
+    Row added ('I') or removed ('D') in a dataset version.
+
+    Written by record_dataset_changes() on upload/delete; versions older
+    than dataset_versions.changes_from have been pruned.
+    """
+
+    OP_CHOICES = [
+        ('I', 'Insert'),
+        ('D', 'Delete'),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    data_type = models.CharField(max_length=50)
+    version = models.BigIntegerField()
+    row_key = models.CharField(max_length=64)
+    op = models.CharField(max_length=1, choices=OP_CHOICES)
+
+    class Meta:
+        db_table = 'dataset_changes'
+        managed = False
+        indexes = [
+            models.Index(fields=['data_type', 'version']),
+        ]
+
+    def __str__(self):
+        return f"{self.data_type} v{self.version} {self.op} {self.row_key}"
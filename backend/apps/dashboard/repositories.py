@@ -1,14 +1,208 @@
 """
 Repository layer for dashboard - Data access layer.
 """
-from typing import List, Dict, Any, Optional
+import json
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
+from datetime import datetime
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connection, connections, router, transaction
 from django.db.models import Count, Avg, Sum, Q
-from apps.data_upload.models import UploadedData
+from django.db.models.fields.json import KeyTransform
+from apps.core.renderers import value_type, widen_type
+from apps.data_upload.models import UploadedData, DatasetVersion
+from .models import FilterDimension, DashboardRollup
+from .columnar import ColumnarDataset, columnar_cache
+from .aggregations import (
+    summarize_research_by_department,
+    summarize_research_projects,
+    summarize_student_statistics,
+)
+
+
+# Columns placed before the metadata spread in list rows, per data type
+ROW_COLUMNS = {
+    'kpi': ('id', 'year', 'semester', 'college', 'department'),
+    'publication': ('id', 'year', 'college', 'department'),
+    'research': ('id', 'year', 'department'),
+    'student': ('id', 'year', 'college', 'department'),
+}
+
+# Value types of the row columns (see apps.core.renderers.value_type)
+ROW_COLUMN_TYPES = {
+    'id': 'integer',
+    'year': 'integer',
+    'semester': 'string',
+    'college': 'string',
+    'department': 'string',
+}
+
+# Value types of JSONB values per jsonb_typeof(); integral numbers are integers
+JSONB_VALUE_TYPES = {
+    'boolean': 'boolean',
+    'number': 'number',
+    'string': 'string',
+    'object': 'string',
+    'array': 'string',
+}
+
+# Columns maintained in the filter dimension table
+FILTER_DIMENSIONS = ('year', 'college', 'department', 'semester')
+
+# Filters covered by the pre-aggregated sources (columnar cache, dashboard_rollups)
+AGGREGATE_GRAIN = ('year', 'semester', 'college', 'department')
+
+# Rows fetched per round trip when iterating list rows (server-side cursor)
+ROW_CHUNK_SIZE = getattr(settings, 'DASHBOARD_ROW_CHUNK_SIZE', 2000)
+
+USE_COLUMNAR_CACHE = getattr(settings, 'DASHBOARD_COLUMNAR_CACHE', True)
+
+# Aggregates are served from the columnar cache when it is enabled, so the rollup table is only
+# read when it is off. Uploads always keep it current, so either setting can be flipped at any time.
+USE_ROLLUPS = getattr(settings, 'DASHBOARD_USE_ROLLUPS', not USE_COLUMNAR_CACHE)
+
+# Dataset versions kept in the change log; older delta requests get a full reset
+CHANGES_KEEP_VERSIONS = getattr(settings, 'DASHBOARD_CHANGES_KEEP_VERSIONS', 50)
 
 
 class DashboardRepository:
     """Repository for dashboard data queries."""
     
+    def _filtered_queryset(
+        self,
+        data_type: str,
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+    ):
+        """데이터 타입과 공통 필터가 적용된 queryset."""
+        queryset = UploadedData.objects.filter(data_type=data_type)
+        
+        if year:
+            queryset = queryset.filter(year=year)
+        if semester and semester != 'all':
+            queryset = queryset.filter(semester=semester)
+        if college and college != 'all':
+            queryset = queryset.filter(college=college)
+        if department:
+            queryset = queryset.filter(department=department)
+        
+        return queryset
+    
+    def _use_rollups(self, **filters) -> bool:
+        """
+        요청된 필터가 롤업 grain으로 커버되는지 여부.
+        
+        컬럼형 캐시 다음 순서로 확인된다 (기본 설정에서는 컬럼형 캐시가 켜져 있으면 사용 안 함).
+        롤업은 PostgreSQL 함수로 갱신되므로 다른 DB에서는 원본 행을 사용한다.
+        """
+        if not USE_ROLLUPS or connection.vendor != 'postgresql':
+            return False
+        return all(key in AGGREGATE_GRAIN for key, value in filters.items() if value)
+    
+    def _use_columnar(self, **filters) -> bool:
+        """요청된 필터를 프로세스 내 컬럼형 캐시로 처리할 수 있는지 여부."""
+        if not USE_COLUMNAR_CACHE:
+            return False
+        return all(key in AGGREGATE_GRAIN for key, value in filters.items() if value)
+    
+    def _get_columnar(self, *data_types: str) -> Dict[str, ColumnarDataset]:
+        """현재 데이터셋 버전의 컬럼형 데이터셋 (버전이 바뀌면 다시 로드)."""
+        versions = self.get_dataset_versions(data_types)
+        return {
+            data_type: columnar_cache.get(data_type, version)
+            for data_type, (version, _) in versions.items()
+        }
+    
+    def _rollup_queryset(
+        self,
+        metric_key: str = '',
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+    ):
+        """공통 필터가 적용된 롤업 queryset."""
+        queryset = DashboardRollup.objects.filter(metric_key=metric_key)
+        
+        if year:
+            queryset = queryset.filter(year=year)
+        if semester and semester != 'all':
+            queryset = queryset.filter(semester=semester)
+        if college and college != 'all':
+            queryset = queryset.filter(college=college)
+        if department:
+            queryset = queryset.filter(department=department)
+        
+        return queryset
+    
+    @staticmethod
+    def _build_row(columns: Tuple[str, ...], values: tuple) -> Dict[str, Any]:
+        """values_list 튜플 (컬럼..., metadata)을 리스트 응답 행으로 변환."""
+        row = dict(zip(columns, values))
+        row.update(values[-1])
+        return row
+    
+    def _iter_queryset_rows(
+        self,
+        data_type: str,
+        queryset,
+        fields: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        queryset을 리스트 응답 행으로 순회.
+        
+        모델 인스턴스를 만들지 않고 values_list()로 필요한 컬럼과 metadata만 조회하며,
+        서버 사이드 커서로 chunk 단위로 가져온다.
+        
+        fields가 주어지면 SQL에서 해당 컬럼과 JSONB 키(metadata -> key)만 조회하므로
+        나머지 metadata는 detoast/직렬화/전송되지 않는다. id는 항상 포함된다.
+        
+        Args:
+            data_type: 데이터 타입
+            queryset: 필터가 적용된 UploadedData queryset
+            fields: 조회할 필드 목록 (None이면 전체 행)
+            chunk_size: 서버 사이드 커서 chunk 크기 (기본 ROW_CHUNK_SIZE)
+        """
+        chunk_size = chunk_size or ROW_CHUNK_SIZE
+        
+        if not fields:
+            columns = ROW_COLUMNS[data_type]
+            values = queryset.values_list(*columns, 'metadata')
+            for item in values.iterator(chunk_size=chunk_size):
+                yield self._build_row(columns, item)
+            return
+        
+        columns, metadata_keys = self._projection(data_type, fields)
+        # JSONB 키는 임의 문자열이므로 안전한 alias로 조회한 뒤 원래 이름으로 되돌린다
+        aliases = {f'projected_{index}': key for index, key in enumerate(metadata_keys)}
+        names = columns + tuple(aliases.values())
+        
+        values = queryset.annotate(**{
+            alias: KeyTransform(key, 'metadata') for alias, key in aliases.items()
+        }).values_list(*columns, *aliases)
+        
+        for item in values.iterator(chunk_size=chunk_size):
+            yield dict(zip(names, item))
+    
+    @staticmethod
+    def _projection(data_type: str, fields: List[str]) -> Tuple[Tuple[str, ...], List[str]]:
+        """?fields= 목록을 (행 컬럼, metadata 키)로 분리 (id는 항상 첫 컬럼)."""
+        columns = ('id',) + tuple(
+            field for field in ROW_COLUMNS[data_type]
+            if field in fields and field != 'id'
+        )
+        metadata_keys = [
+            field for field in dict.fromkeys(fields)
+            if field not in ROW_COLUMNS[data_type]
+        ]
+        return columns, metadata_keys
+    
+    def _iter_metadata(self, queryset) -> Iterator[Dict[str, Any]]:
+        """metadata 컬럼만 chunk 단위로 순회 (집계용)."""
+        return queryset.values_list('metadata', flat=True).iterator(chunk_size=ROW_CHUNK_SIZE)
+    
     def get_summary_statistics(
         self,
         year: Optional[int] = None,
@@ -26,6 +220,11 @@ class DashboardRepository:
         Returns:
             Dict: 요약 통계 정보
         """
+        if self._use_columnar(year=year, semester=semester, college=college):
+            return self._get_summary_from_columnar(year=year, semester=semester, college=college)
+        if self._use_rollups(year=year, semester=semester, college=college):
+            return self._get_summary_from_rollups(year=year, semester=semester, college=college)
+        
         # Base queryset
         queryset = UploadedData.objects.all()
         
@@ -45,44 +244,87 @@ class DashboardRepository:
         print(f"[DEBUG] Total publications in DB: {publication_count}")
         print(f"[DEBUG] Filters - year: {year}, semester: {semester}, college: {college}")
         
-        # Get research projects count (unique by 과제번호)
-        research_data = queryset.filter(data_type='research')
-        unique_projects = set()
-        total_research_budget = 0
-        
-        for item in research_data:
-            # Count unique projects by 과제번호
-            project_number = item.metadata.get('과제번호')
-            if project_number:
-                unique_projects.add(project_number)
-            
-            # Sum total research budget (총연구비)
-            budget = item.metadata.get('총연구비', 0)
-            if budget:
-                try:
-                    total_research_budget += int(budget)
-                except (ValueError, TypeError):
-                    pass
+        # Get research projects count (unique by 과제번호) and total budget (총연구비)
+        project_count, total_research_budget = summarize_research_projects(
+            self._iter_metadata(queryset.filter(data_type='research'))
+        )
         
-        print(f"[DEBUG] Research projects: {len(unique_projects)}, Budget: {total_research_budget}")
+        print(f"[DEBUG] Research projects: {project_count}, Budget: {total_research_budget}")
         
         return {
             'total_students': student_count,
             'total_publications': publication_count,
-            'total_research_projects': len(unique_projects),
+            'total_research_projects': project_count,
             'total_research_budget': total_research_budget,
         }
     
+    def _get_summary_from_columnar(
+        self,
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """컬럼형 캐시 기반 요약 통계 (get_summary_statistics와 동일한 결과)."""
+        datasets = self._get_columnar('student', 'publication', 'research')
+        masks = {
+            data_type: dataset.mask(year=year, semester=semester, college=college)
+            for data_type, dataset in datasets.items()
+        }
+        research = datasets['research']
+        
+        return {
+            'total_students': int(masks['student'].sum()),
+            'total_publications': int(masks['publication'].sum()),
+            'total_research_projects': research.distinct_truthy('과제번호', masks['research']),
+            'total_research_budget': int(research.columns['총연구비'][masks['research']].sum()),
+        }
+    
+    def _get_summary_from_rollups(
+        self,
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """롤업 테이블 기반 요약 통계 (get_summary_statistics와 동일한 결과)."""
+        totals = {
+            item['data_type']: item
+            for item in (
+                self._rollup_queryset(year=year, semester=semester, college=college)
+                .filter(data_type__in=['student', 'publication', 'research'])
+                .values('data_type')
+                .annotate(rows=Sum('row_count'), budget=Sum('budget_sum'))
+                .order_by()
+            )
+        }
+        project_count = (
+            self._rollup_queryset('과제번호', year=year, semester=semester, college=college)
+            .filter(data_type='research')
+            .values('metric_value')
+            .distinct()
+            .count()
+        )
+        
+        return {
+            'total_students': totals.get('student', {}).get('rows') or 0,
+            'total_publications': totals.get('publication', {}).get('rows') or 0,
+            'total_research_projects': project_count,
+            'total_research_budget': totals.get('research', {}).get('budget') or 0,
+        }
+    
     def get_kpi_data(
         self,
         year: Optional[int] = None,
         semester: Optional[str] = None,
         college: Optional[str] = None,
         department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         KPI 데이터 조회.
         
+        Args:
+            fields: 조회할 필드 목록 (None이면 metadata 전체 포함)
+            
         Returns:
             List[Dict]: KPI 데이터 리스트
         """
@@ -97,28 +339,21 @@ class DashboardRepository:
         if department:
             queryset = queryset.filter(department=department)
         
-        data = []
-        for item in queryset:
-            data.append({
-                'id': item.id,
-                'year': item.year,
-                'semester': item.semester,
-                'college': item.college,
-                'department': item.department,
-                **item.metadata,  # Spread metadata fields
-            })
-        
-        return data
+        return list(self._iter_queryset_rows('kpi', queryset, fields))
     
     def get_publication_data(
         self,
         year: Optional[int] = None,
         college: Optional[str] = None,
         department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         논문 데이터 조회.
         
+        Args:
+            fields: 조회할 필드 목록 (None이면 metadata 전체 포함)
+            
         Returns:
             List[Dict]: 논문 데이터 리스트
         """
@@ -131,17 +366,7 @@ class DashboardRepository:
         if department:
             queryset = queryset.filter(department=department)
         
-        data = []
-        for item in queryset:
-            data.append({
-                'id': item.id,
-                'year': item.year,
-                'college': item.college,
-                'department': item.department,
-                **item.metadata,
-            })
-        
-        return data
+        return list(self._iter_queryset_rows('publication', queryset, fields))
     
     def get_publication_trends(
         self,
@@ -154,6 +379,23 @@ class DashboardRepository:
         Returns:
             List[Dict]: 연도별 논문 수
         """
+        if self._use_columnar(college=college, department=department):
+            dataset = self._get_columnar('publication')['publication']
+            return dataset.year_counts(dataset.mask(college=college, department=department))
+        
+        if self._use_rollups(college=college, department=department):
+            trends = (
+                self._rollup_queryset(college=college, department=department)
+                .filter(data_type='publication')
+                .values('year')
+                .annotate(count=Sum('row_count'))
+                .order_by('year')
+            )
+            return [
+                {'year': item['year'], 'count': item['count']}
+                for item in trends
+            ]
+        
         queryset = UploadedData.objects.filter(data_type='publication')
         
         if college and college != 'all':
@@ -178,10 +420,14 @@ class DashboardRepository:
         self,
         year: Optional[int] = None,
         department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         연구 프로젝트 데이터 조회.
         
+        Args:
+            fields: 조회할 필드 목록 (None이면 metadata 전체 포함)
+            
         Returns:
             List[Dict]: 연구 프로젝트 데이터 리스트
         """
@@ -192,16 +438,7 @@ class DashboardRepository:
         if department:
             queryset = queryset.filter(department=department)
         
-        data = []
-        for item in queryset:
-            data.append({
-                'id': item.id,
-                'year': item.year,
-                'department': item.department,
-                **item.metadata,
-            })
-        
-        return data
+        return list(self._iter_queryset_rows('research', queryset, fields))
     
     def get_research_by_department(
         self,
@@ -213,45 +450,60 @@ class DashboardRepository:
         Returns:
             List[Dict]: 학과별 프로젝트 수와 총 연구비
         """
+        if self._use_columnar(year=year):
+            dataset = self._get_columnar('research')['research']
+            mask = dataset.mask(year=year)
+            counts = dataset.value_counts('department', mask)
+            budgets = dataset.group_sum('department', '총연구비', mask)
+            return [
+                {
+                    'department': dept,
+                    'project_count': count,
+                    'total_budget': budgets[dept],
+                }
+                for dept, count in counts.items()
+            ]
+        
+        if self._use_rollups(year=year):
+            dept_data = (
+                self._rollup_queryset(year=year)
+                .filter(data_type='research')
+                .values('department')
+                .annotate(count=Sum('row_count'), total_budget=Sum('budget_sum'))
+                .order_by('department')
+            )
+            return [
+                {
+                    'department': item['department'],
+                    'project_count': item['count'],
+                    'total_budget': item['total_budget'],
+                }
+                for item in dept_data
+            ]
+        
         queryset = UploadedData.objects.filter(data_type='research')
         
         if year:
             queryset = queryset.filter(year=year)
         
         # Group by department
-        dept_data = {}
-        for item in queryset:
-            dept = item.department
-            if dept not in dept_data:
-                dept_data[dept] = {'count': 0, 'total_budget': 0}
-            
-            dept_data[dept]['count'] += 1
-            
-            budget = item.metadata.get('총연구비', 0)
-            if budget:
-                try:
-                    dept_data[dept]['total_budget'] += int(budget)
-                except (ValueError, TypeError):
-                    pass
-        
-        return [
-            {
-                'department': dept,
-                'project_count': data['count'],
-                'total_budget': data['total_budget'],
-            }
-            for dept, data in dept_data.items()
-        ]
+        return summarize_research_by_department(
+            self._iter_queryset_rows('research', queryset)
+        )
     
     def get_student_data(
         self,
         year: Optional[int] = None,
         college: Optional[str] = None,
         department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         학생 데이터 조회.
         
+        Args:
+            fields: 조회할 필드 목록 (None이면 metadata 전체 포함)
+            
         Returns:
             List[Dict]: 학생 데이터 리스트
         """
@@ -264,17 +516,7 @@ class DashboardRepository:
         if department:
             queryset = queryset.filter(department=department)
         
-        data = []
-        for item in queryset:
-            data.append({
-                'id': item.id,
-                'year': item.year,
-                'college': item.college,
-                'department': item.department,
-                **item.metadata,
-            })
-        
-        return data
+        return list(self._iter_queryset_rows('student', queryset, fields))
     
     def get_student_statistics(
         self,
@@ -287,6 +529,18 @@ class DashboardRepository:
         Returns:
             Dict: 학생 통계 (총학생수, 과정별 분포 등)
         """
+        if self._use_columnar(year=year, college=college):
+            dataset = self._get_columnar('student')['student']
+            mask = dataset.mask(year=year, college=college)
+            return {
+                'total_students': int(mask.sum()),
+                'by_program': dataset.value_counts('과정구분', mask),
+                'by_status': dataset.value_counts('학적상태', mask),
+            }
+        
+        if self._use_rollups(year=year, college=college):
+            return self._get_student_statistics_from_rollups(year=year, college=college)
+        
         queryset = UploadedData.objects.filter(data_type='student')
         
         if year:
@@ -294,29 +548,75 @@ class DashboardRepository:
         if college and college != 'all':
             queryset = queryset.filter(college=college)
         
-        total_students = queryset.count()
-        
-        # Count by 과정구분
-        program_counts = {}
-        status_counts = {}
+        # Count by 과정구분 / 학적상태
+        return summarize_student_statistics(self._iter_metadata(queryset))
+    
+    def _get_student_statistics_from_rollups(
+        self,
+        year: Optional[int] = None,
+        college: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """롤업 테이블 기반 학생 통계 (get_student_statistics와 동일한 결과)."""
+        total_students = (
+            self._rollup_queryset(year=year, college=college)
+            .filter(data_type='student')
+            .aggregate(total=Sum('row_count'))['total']
+        ) or 0
         
-        for item in queryset:
-            program = item.metadata.get('과정구분', 'Unknown')
-            status = item.metadata.get('학적상태', 'Unknown')
-            
-            program_counts[program] = program_counts.get(program, 0) + 1
-            status_counts[status] = status_counts.get(status, 0) + 1
+        distributions = {'과정구분': {}, '학적상태': {}}
+        for metric_key, counts in distributions.items():
+            grouped = (
+                self._rollup_queryset(metric_key, year=year, college=college)
+                .filter(data_type='student')
+                .values_list('metric_value')
+                .annotate(count=Sum('row_count'))
+                .order_by()
+            )
+            for value, count in grouped:
+                counts[value] = count
         
         return {
             'total_students': total_students,
-            'by_program': program_counts,
-            'by_status': status_counts,
+            'by_program': distributions['과정구분'],
+            'by_status': distributions['학적상태'],
         }
     
     def get_available_filters(self) -> Dict[str, List[str]]:
         """
         사용 가능한 필터 옵션 조회.
         
+        업로드/삭제 시 갱신되는 필터 차원 테이블에서 조회하므로 비용은 행 수가 아닌
+        고유 값 수에 비례한다. 차원 테이블이 비어 있으면 원본 테이블을 스캔한다.
+        
+        Returns:
+            Dict: 필터 옵션 리스트
+        """
+        dimensions = list(
+            FilterDimension.objects
+            .filter(row_count__gt=0)
+            .values_list('data_type', 'dimension', 'value')
+        )
+        if not dimensions:
+            return self._scan_available_filters()
+        
+        values = {dimension: set() for dimension in FILTER_DIMENSIONS}
+        for data_type, dimension, value in dimensions:
+            # 학기 옵션은 KPI 데이터 기준
+            if dimension == 'semester' and data_type != 'kpi':
+                continue
+            values[dimension].add(value)
+        
+        return {
+            'years': sorted((int(y) for y in values['year'] if y), reverse=True),
+            'colleges': sorted(c for c in values['college'] if c),
+            'departments': sorted(d for d in values['department'] if d),
+            'semesters': sorted(s for s in values['semester'] if s),
+        }
+    
+    def _scan_available_filters(self) -> Dict[str, List[str]]:
+        """
+        원본 테이블 스캔으로 필터 옵션 조회 (차원 테이블 미초기화 시 사용).
+        
         Returns:
             Dict: 필터 옵션 리스트
         """
@@ -358,3 +658,552 @@ class DashboardRepository:
             'departments': [d for d in departments if d],
             'semesters': [s for s in semesters if s],
         }
+    
+    def get_dataset_versions(
+        self,
+        data_types: Iterable[str],
+    ) -> Dict[str, Tuple[int, Optional[datetime]]]:
+        """
+        데이터 타입별 데이터셋 버전 조회.
+        
+        Args:
+            data_types: 조회할 데이터 타입 목록
+            
+        Returns:
+            Dict: {data_type: (version, updated_at)} - 버전 정보가 없으면 (0, None)
+        """
+        data_types = list(data_types)
+        versions = {data_type: (0, None) for data_type in data_types}
+        
+        rows = (
+            DatasetVersion.objects
+            .filter(data_type__in=data_types)
+            .values_list('data_type', 'version', 'updated_at')
+        )
+        for data_type, version, updated_at in rows:
+            versions[data_type] = (version, updated_at)
+        
+        return versions
+    
+    def get_changes(self, data_type: str, since: int) -> Dict[str, Any]:
+        """
+        since 버전 이후 추가/삭제된 행 조회 (델타 동기화).
+        
+        행은 내용 기반 키(row_key)로 식별되며, 내용이 바뀐 행은 이전 키 삭제 + 새 키 추가로
+        나타난다. since 이후 추가됐다가 다시 삭제된 행처럼 상쇄되는 변경은 제외된다.
+        
+        since가 변경 로그 보존 범위보다 오래됐거나(또는 PostgreSQL이 아니면) reset=True와
+        함께 현재 전체 행을 added로 반환하며, 클라이언트는 로컬 사본을 교체해야 한다.
+        
+        읽기 DB(복제본)에서 조회하며, 복제본이 아직 since 버전에 도달하지 않았으면
+        기본 DB에서 다시 조회한다.
+        
+        Args:
+            data_type: 데이터 타입
+            since: 클라이언트가 가진 데이터셋 버전 (0이면 전체)
+            
+        Returns:
+            Dict: {'version', 'reset', 'added': [row_key 포함 행], 'removed': [row_key]}
+            
+        Raises:
+            ValueError: since가 현재 버전보다 큰 경우
+        """
+        using = router.db_for_read(UploadedData)
+        try:
+            return self._read_changes(data_type, since, using)
+        except ValueError:
+            if using == DEFAULT_DB_ALIAS:
+                raise
+            # A lagging replica may not have replayed the version the client already has
+            return self._read_changes(data_type, since, DEFAULT_DB_ALIAS)
+    
+    def _read_changes(self, data_type: str, since: int, using: str) -> Dict[str, Any]:
+        """
+        using DB에서 since 이후 변경 조회 (get_changes 참고).
+        
+        버전과 변경/행은 하나의 REPEATABLE READ 트랜잭션에서 읽으므로, 조회 중에 업로드가
+        커밋되어도 반환되는 행은 반환되는 version과 일치한다. 행 잠금은 잡지 않는다.
+        """
+        database = connections[using]
+        if database.vendor != 'postgresql':
+            version = (
+                DatasetVersion.objects.using(using)
+                .filter(data_type=data_type)
+                .values_list('version', flat=True)
+                .first()
+            ) or 0
+            if since > version:
+                raise ValueError(f"since ({since}) is ahead of the current version ({version})")
+            queryset = self._filtered_queryset(data_type).using(using).order_by('id')
+            rows = self._iter_queryset_rows(data_type, queryset)
+            return {
+                'version': version,
+                'reset': True,
+                'added': [{'row_key': str(row['id']), **row} for row in rows],
+                'removed': [],
+            }
+        
+        with transaction.atomic(using=using), database.cursor() as cursor:
+            if len(database.atomic_blocks) == 1:
+                # First statement of the transaction; a caller's open transaction keeps its own snapshot
+                cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ')
+            cursor.execute(
+                'SELECT version, changes_from FROM dataset_versions WHERE data_type = %s',
+                [data_type],
+            )
+            version, changes_from = cursor.fetchone() or (0, 0)
+            if since > version:
+                raise ValueError(f"since ({since}) is ahead of the current version ({version})")
+            
+            reset = since < changes_from
+            columns = ROW_COLUMNS[data_type]
+            select_rows = f"""
+                SELECT s.row_key, {', '.join(f'u.{column}' for column in columns)}, u.metadata
+                FROM dataset_row_state s
+                JOIN uploaded_data u ON u.id = s.row_id
+                WHERE s.data_type = %s
+            """
+            
+            if reset:
+                cursor.execute(f'{select_rows} ORDER BY u.id', [data_type])
+                added = cursor.fetchall()
+                removed = []
+            else:
+                net_changes = """
+                    WITH ops AS (
+                        SELECT
+                            row_key,
+                            (array_agg(op ORDER BY version, id))[1] AS first_op,
+                            (array_agg(op ORDER BY version DESC, id DESC))[1] AS last_op
+                        FROM dataset_changes
+                        WHERE data_type = %s AND version > %s
+                        GROUP BY row_key
+                    )
+                """
+                cursor.execute(
+                    f"""{net_changes}
+                    {select_rows}
+                      AND s.row_key IN (SELECT row_key FROM ops WHERE first_op = 'I' AND last_op = 'I')
+                    ORDER BY u.id
+                    """,
+                    [data_type, since, data_type],
+                )
+                added = cursor.fetchall()
+                cursor.execute(
+                    f"""{net_changes}
+                    SELECT row_key FROM ops WHERE first_op = 'D' AND last_op = 'D' ORDER BY row_key
+                    """,
+                    [data_type, since],
+                )
+                removed = [row_key for (row_key,) in cursor.fetchall()]
+        
+        return {
+            'version': version,
+            'reset': reset,
+            'added': [self._build_change_row(columns, item) for item in added],
+            'removed': removed,
+        }
+    
+    @classmethod
+    def _build_change_row(cls, columns: Tuple[str, ...], item: tuple) -> Dict[str, Any]:
+        """(row_key, 컬럼..., metadata) 튜플을 row_key가 포함된 리스트 응답 행으로 변환."""
+        row_key, *values = item
+        metadata = values[-1]
+        if isinstance(metadata, str):
+            # Raw cursors return jsonb as text with Django's psycopg2 backend
+            values[-1] = json.loads(metadata)
+        return {'row_key': row_key, **cls._build_row(columns, tuple(values))}
+    
+    def get_report_page(
+        self,
+        data_type: str,
+        year: Optional[int] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        after_id: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        리포트 한 페이지 조회 (DB 레벨 LIMIT/OFFSET 또는 keyset 페이지네이션).
+        
+        Args:
+            data_type: 데이터 타입
+            year: 연도 필터
+            college: 단과대학 필터
+            department: 학과 필터
+            limit: 페이지당 항목 수
+            offset: 건너뛸 항목 수 (after_id가 없을 때만 사용)
+            after_id: keyset 커서 - 이 ID 이후의 행부터 조회
+            fields: 조회할 필드 목록 (None이면 metadata 전체 포함)
+            
+        Returns:
+            List[Dict]: id 오름차순 리포트 행
+        """
+        queryset = self._filtered_queryset(
+            data_type,
+            year=year,
+            college=college,
+            department=department,
+        ).order_by('id')
+        
+        if after_id is not None:
+            queryset = queryset.filter(id__gt=after_id)[:limit]
+        else:
+            queryset = queryset[offset:offset + limit]
+        
+        return list(self._iter_queryset_rows(data_type, queryset, fields))
+    
+    def count_report_rows(
+        self,
+        data_type: str,
+        year: Optional[int] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+    ) -> int:
+        """
+        리포트 전체 행 수 조회.
+        
+        Returns:
+            int: 필터에 해당하는 행 수
+        """
+        return self._filtered_queryset(
+            data_type,
+            year=year,
+            college=college,
+            department=department,
+        ).count()
+    
+    def iter_rows(
+        self,
+        data_type: str,
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        chunk_size: int = 2000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        리스트 행을 서버 사이드 커서로 순회 (스트리밍 응답용).
+        
+        Args:
+            data_type: 데이터 타입
+            fields: 조회할 필드 목록 (None이면 metadata 전체 포함)
+            chunk_size: 커서에서 한 번에 가져올 행 수
+            
+        Returns:
+            Iterator[Dict]: 리스트 응답과 동일한 형태의 행
+        """
+        queryset = self._filtered_queryset(
+            data_type,
+            year=year,
+            semester=semester,
+            college=college,
+            department=department,
+        ).order_by('id')
+        
+        return self._iter_queryset_rows(data_type, queryset, fields, chunk_size=chunk_size)
+    
+    def get_row_columns(
+        self,
+        data_type: str,
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        iter_rows()가 생성하는 행의 전체 컬럼 목록 (고정 스키마가 필요한 바이너리 포맷용).
+        
+        fields가 없으면 행 컬럼 뒤에 필터된 행들의 metadata 키를 처음 등장한 순서대로 붙인다.
+        PostgreSQL에서는 jsonb_object_keys()로 키만 조회하고, 다른 DB에서는 metadata를 순회한다.
+        
+        Returns:
+            List[str]: 컬럼명 목록
+        """
+        if fields:
+            columns, metadata_keys = self._projection(data_type, fields)
+            return [*columns, *metadata_keys]
+        
+        queryset = self._filtered_queryset(
+            data_type,
+            year=year,
+            semester=semester,
+            college=college,
+            department=department,
+        )
+        columns = list(ROW_COLUMNS[data_type])
+        
+        # Raw SQL bypasses the database router; run it where the queryset would
+        database = connections[queryset.db]
+        if database.vendor == 'postgresql':
+            sql, params = queryset.values_list('id', 'metadata').query.sql_with_params()
+            with database.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    SELECT key
+                    FROM ({sql}) AS rows (id, metadata), jsonb_object_keys(rows.metadata) AS key
+                    GROUP BY key
+                    ORDER BY MIN(rows.id), key
+                    """,
+                    params,
+                )
+                metadata_keys = [key for (key,) in cursor.fetchall()]
+        else:
+            metadata_keys = {}
+            for metadata in self._iter_metadata(queryset.order_by('id')):
+                metadata_keys.update(dict.fromkeys(metadata))
+        
+        return list(dict.fromkeys([*columns, *metadata_keys]))
+    
+    def get_row_types(
+        self,
+        data_type: str,
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, str]:
+        """
+        iter_rows() 행의 컬럼별 값 타입 (get_row_columns()와 같은 순서, Arrow 스키마용).
+        
+        행 컬럼은 모델 타입을, metadata 키는 필터된 행들에 나타난 모든 값의 타입을 넓혀서
+        정한다 (정수+실수는 number, 그 밖의 혼합은 string). 같은 이름의 행 컬럼을 덮어쓰는
+        metadata 키는 두 타입을 함께 넓힌다. PostgreSQL에서는 jsonb_typeof()로 DB에서 집계한다.
+        
+        Returns:
+            Dict[str, str]: {컬럼명: 'boolean' | 'integer' | 'number' | 'string'}
+        """
+        queryset = self._filtered_queryset(
+            data_type,
+            year=year,
+            semester=semester,
+            college=college,
+            department=department,
+        )
+        metadata_types = self._metadata_value_types(queryset)
+        
+        if fields:
+            columns, metadata_keys = self._projection(data_type, fields)
+            return {
+                **{column: ROW_COLUMN_TYPES[column] for column in columns},
+                **{key: metadata_types.get(key) or 'string' for key in metadata_keys},
+            }
+        
+        types = {column: ROW_COLUMN_TYPES[column] for column in ROW_COLUMNS[data_type]}
+        for key, kind in metadata_types.items():
+            types[key] = widen_type(types.get(key), kind) or 'string'
+        return types
+    
+    def _metadata_value_types(self, queryset) -> Dict[str, Optional[str]]:
+        """metadata 키별 값 타입 (키가 처음 등장한 순서, 값이 모두 null이면 None)."""
+        # Raw SQL bypasses the database router; run it where the queryset would
+        database = connections[queryset.db]
+        if database.vendor != 'postgresql':
+            types = {}
+            for metadata in self._iter_metadata(queryset.order_by('id')):
+                for key, value in metadata.items():
+                    types[key] = widen_type(types.get(key), value_type(value))
+            return types
+        
+        sql, params = queryset.values_list('id', 'metadata').query.sql_with_params()
+        with database.cursor() as cursor:
+            # Numbers written without a fraction/exponent decode to Python ints
+            cursor.execute(
+                f"""
+                SELECT key,
+                       array_agg(DISTINCT jsonb_typeof(value)),
+                       bool_and(CASE WHEN jsonb_typeof(value) = 'number'
+                                     THEN value::text ~ '^-?[0-9]+$'
+                                          AND value::numeric BETWEEN -9223372036854775808 AND 9223372036854775807
+                                     ELSE true END)
+                FROM ({sql}) AS rows (id, metadata), jsonb_each(rows.metadata) AS item (key, value)
+                GROUP BY key
+                ORDER BY MIN(rows.id), key
+                """,
+                params,
+            )
+            rows = cursor.fetchall()
+        
+        types = {}
+        for key, jsonb_types, integral in rows:
+            kind = None
+            for jsonb_type in jsonb_types:
+                if jsonb_type == 'number' and integral:
+                    kind = widen_type(kind, 'integer')
+                else:
+                    kind = widen_type(kind, JSONB_VALUE_TYPES.get(jsonb_type))
+            types[key] = kind
+        return types
+    
+    def get_columns(
+        self,
+        data_type: str,
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        리스트 데이터를 컬럼 배열 형태로 조회 (?layout=columnar).
+        
+        행 dict를 만들지 않고 values_list 튜플에서 바로 컬럼 리스트에 추가한다.
+        행마다 없는 metadata 키는 None으로 채운다.
+        
+        Returns:
+            Dict: {'columns': [컬럼명], 'data': {컬럼명: [값]}} - 행 순서는 리스트 응답과 동일
+        """
+        queryset = self._filtered_queryset(
+            data_type,
+            year=year,
+            semester=semester,
+            college=college,
+            department=department,
+        )
+        
+        if fields:
+            columns, metadata_keys = self._projection(data_type, fields)
+            names = [*columns, *metadata_keys]
+            data = {name: [] for name in names}
+            for row in self._iter_queryset_rows(data_type, queryset, fields):
+                for name in names:
+                    data[name].append(row[name])
+            return {'columns': names, 'data': data}
+        
+        columns = ROW_COLUMNS[data_type]
+        data = {column: [] for column in columns}
+        fixed = [data[column] for column in columns]
+        count = 0
+        
+        values = queryset.values_list(*columns, 'metadata')
+        for item in values.iterator(chunk_size=ROW_CHUNK_SIZE):
+            for column_values, value in zip(fixed, item):
+                column_values.append(value)
+            count += 1
+            
+            # Columns filled for this row; shadowing keys overwrite a row column instead
+            filled = len(columns)
+            for key, value in item[-1].items():
+                column_values = data.get(key)
+                if column_values is None:
+                    column_values = data[key] = [None] * (count - 1)
+                    column_values.append(value)
+                    filled += 1
+                elif len(column_values) == count:
+                    # metadata key shadowing a row column (same as the row dict update)
+                    column_values[-1] = value
+                else:
+                    column_values.append(value)
+                    filled += 1
+            
+            if filled != len(data):
+                for column_values in data.values():
+                    if len(column_values) < count:
+                        column_values.append(None)
+        
+        return {'columns': list(data), 'data': data}
+    
+    @transaction.atomic
+    def refresh_filter_dimensions(self, data_type: str) -> int:
+        """
+        데이터 타입의 필터 차원 값과 행 수를 다시 계산.
+        
+        업로드/삭제가 커밋되기 전에 같은 트랜잭션에서 호출된다.
+        
+        Args:
+            data_type: 변경된 데이터 타입
+            
+        Returns:
+            int: 저장된 차원 값 수
+        """
+        queryset = UploadedData.objects.filter(data_type=data_type)
+        
+        instances = []
+        for dimension in FILTER_DIMENSIONS:
+            grouped = (
+                queryset
+                .exclude(**{f'{dimension}__isnull': True})
+                .values_list(dimension)
+                .annotate(row_count=Count('id'))
+                .order_by()
+            )
+            instances.extend(
+                FilterDimension(
+                    data_type=data_type,
+                    dimension=dimension,
+                    value=str(value),
+                    row_count=row_count,
+                )
+                for value, row_count in grouped
+            )
+        
+        FilterDimension.objects.filter(data_type=data_type).delete()
+        FilterDimension.objects.bulk_create(instances, batch_size=500)
+        return len(instances)
+    
+    @transaction.atomic
+    def refresh_rollups(self, data_type: str) -> int:
+        """
+        데이터 타입의 롤업 행을 다시 계산 (refresh_dashboard_rollups 함수 호출).
+        
+        업로드/삭제가 커밋되기 전에 같은 트랜잭션에서 호출된다.
+        
+        Args:
+            data_type: 변경된 데이터 타입
+            
+        USE_ROLLUPS는 읽기 경로만 결정하므로 설정과 무관하게 항상 갱신한다.
+        
+        Returns:
+            int: 저장된 롤업 행 수 (PostgreSQL이 아니면 0)
+        """
+        if connection.vendor != 'postgresql':
+            return 0
+        
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT refresh_dashboard_rollups(%s)', [data_type])
+            return cursor.fetchone()[0]
+    
+    def record_changes(self, data_type: str, version: int) -> int:
+        """
+        새 데이터셋 버전의 행 추가/삭제를 변경 로그에 기록 (record_dataset_changes 함수 호출).
+        
+        업로드/삭제가 커밋되기 전에 버전 증가 후 같은 트랜잭션에서 호출된다.
+        CHANGES_KEEP_VERSIONS보다 오래된 변경은 함께 삭제된다.
+        
+        Args:
+            data_type: 변경된 데이터 타입
+            version: 새 데이터셋 버전
+            
+        Returns:
+            int: 기록된 변경 행 수 (PostgreSQL이 아니면 0)
+        """
+        if connection.vendor != 'postgresql':
+            return 0
+        
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT record_dataset_changes(%s, %s, %s)',
+                [data_type, version, CHANGES_KEEP_VERSIONS],
+            )
+            return cursor.fetchone()[0]
+    
+    def publish_columnar_snapshot(self, data_type: str, version: int) -> None:
+        """
+        새 데이터셋 버전의 컬럼형 스냅샷을 작성하고 현재 프로세스 캐시에 적재.
+        
+        커밋 이후 (transaction.on_commit) 호출되어, 다른 워커는 DB를 다시
+        스캔하지 않고 공유 스냅샷을 메모리 매핑한다.
+        
+        Args:
+            data_type: 변경된 데이터 타입
+            version: 커밋된 데이터셋 버전
+        """
+        if not USE_COLUMNAR_CACHE:
+            return
+        
+        columnar_cache.get(data_type, version)
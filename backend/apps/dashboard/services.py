@@ -1,11 +1,159 @@
 """
 Service layer for dashboard - Business logic.
 """
-from typing import Dict, List, Any, Optional
+import asyncio
+import contextvars
+import logging
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+from apps.core.db_routers import use_primary
+from .cache import result_cache
 from .repositories import DashboardRepository
 
 
+logger = logging.getLogger(__name__)
+
+
+# Report type -> data type mapping
+REPORT_TYPE_MAPPING = {
+    'performance': 'kpi',
+    'publications': 'publication',
+    'research': 'research',
+    'students': 'student',
+}
+
+# Data types behind the summary statistics
+SUMMARY_DATA_TYPES = ('student', 'publication', 'research')
+
+ALL_DATA_TYPES = ('kpi', 'publication', 'research', 'student')
+
+# Response layouts for list/trend data: row objects or column arrays
+LAYOUT_ROWS = 'rows'
+LAYOUT_COLUMNAR = 'columnar'
+LAYOUTS = (LAYOUT_ROWS, LAYOUT_COLUMNAR)
+
+# Report types whose rows ignore the college filter
+REPORT_IGNORES_COLLEGE = {'research'}
+
+REPORT_COUNT_CACHE_TIMEOUT = getattr(settings, 'DASHBOARD_REPORT_COUNT_CACHE_TIMEOUT', 60 * 60)
+
+# Largest ?limit= accepted by the paginated report endpoint
+REPORT_MAX_PAGE_SIZE = getattr(settings, 'DASHBOARD_REPORT_MAX_PAGE_SIZE', 100)
+
+STREAM_CHUNK_SIZE = getattr(settings, 'DASHBOARD_STREAM_CHUNK_SIZE', 2000)
+
+# Worker threads for independent bootstrap sections (1 = run sequentially)
+BOOTSTRAP_MAX_WORKERS = getattr(settings, 'DASHBOARD_BOOTSTRAP_MAX_WORKERS', 4)
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+# Independent section queries of a response ({name: callable}) and the function assembling their results
+Sections = Tuple[Dict[str, Callable[[], Any]], Callable[[Dict[str, Any]], Dict[str, Any]]]
+
+
+def _run_in_thread(func: Callable[[], Any]) -> Any:
+    """Run a task in a worker thread with the request-style DB connection lifecycle."""
+    close_old_connections()
+    try:
+        return func()
+    finally:
+        close_old_connections()
+
+
+def run_concurrently(tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    독립적인 작업들을 스레드 풀에서 동시에 실행.
+    
+    Args:
+        tasks: {name: 인자 없는 callable}
+        
+    Returns:
+        Dict: {name: 결과} - 작업 중 예외는 그대로 전파된다
+    """
+    if BOOTSTRAP_MAX_WORKERS <= 1 or len(tasks) <= 1:
+        return {name: func() for name, func in tasks.items()}
+    
+    executor = _get_executor()
+    # Each task runs in a copy of the request context (stale-result tracking)
+    futures = {
+        name: executor.submit(contextvars.copy_context().run, _run_in_thread, func)
+        for name, func in tasks.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+
+def run_sequentially(tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """작업들을 현재 스레드에서 순서대로 실행. Returns: {name: 결과}"""
+    return {name: func() for name, func in tasks.items()}
+
+
+async def gather_concurrently(tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    run_concurrently()의 비동기 버전: 독립적인 동기 조회를 스레드에서 동시에 실행하고
+    이벤트 루프를 막지 않고 기다린다.
+    
+    Args:
+        tasks: {name: 인자 없는 callable}
+        
+    Returns:
+        Dict: {name: 결과} - 작업 중 예외는 그대로 전파된다
+    """
+    loop = asyncio.get_running_loop()
+    # Each task runs in a copy of the request context (stale-result tracking)
+    futures = [
+        loop.run_in_executor(None, contextvars.copy_context().run, _run_in_thread, func)
+        for func in tasks.values()
+    ]
+    return dict(zip(tasks, await asyncio.gather(*futures)))
+
+
+def to_columnar(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    행 리스트를 컬럼 배열 형태로 변환 (?layout=columnar).
+    
+    Returns:
+        Dict: {'columns': [컬럼명], 'data': {컬럼명: [값]}}
+    """
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    return {
+        'columns': columns,
+        'data': {column: [row.get(column) for row in rows] for column in columns},
+    }
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(BOOTSTRAP_MAX_WORKERS, 1),
+            thread_name_prefix='dashboard',
+        )
+    return _executor
+
+
+def schedule_warm_up() -> None:
+    """
+    대시보드 캐시 워밍업을 백그라운드 스레드에서 실행 (업로드 커밋 후 호출).
+    
+    워밍업 실패는 로그만 남기고 요청 처리에는 영향을 주지 않는다.
+    """
+    def warm_up():
+        try:
+            # Runs right after the commit; the replica may not have the new rows yet
+            with use_primary():
+                counts = DashboardService().warm_up()
+            logger.info(f"Dashboard cache warmed: {counts}")
+        except Exception as e:
+            logger.warning(f"Dashboard cache warm-up failed: {e}")
+    
+    _get_executor().submit(_run_in_thread, warm_up)
+
+
 class DashboardService:
     """Service for dashboard business logic."""
     
@@ -29,10 +177,15 @@ class DashboardService:
         Returns:
             Dict: 요약 정보
         """
-        statistics = self.repository.get_summary_statistics(
-            year=year,
-            semester=semester,
-            college=college,
+        statistics = self._cached(
+            'summary',
+            SUMMARY_DATA_TYPES,
+            {'year': year, 'semester': semester, 'college': college},
+            lambda: self.repository.get_summary_statistics(
+                year=year,
+                semester=semester,
+                college=college,
+            ),
         )
         
         return {
@@ -48,6 +201,8 @@ class DashboardService:
         semester: Optional[str] = None,
         college: Optional[str] = None,
         department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        layout: str = LAYOUT_ROWS,
     ) -> Dict[str, Any]:
         """
         KPI 데이터 조회.
@@ -55,16 +210,37 @@ class DashboardService:
         Returns:
             Dict: KPI 데이터
         """
-        data = self.repository.get_kpi_data(
-            year=year,
-            semester=semester,
-            college=college,
-            department=department,
+        listing = self._cached(
+            'kpi',
+            ('kpi',),
+            {
+                'year': year,
+                'semester': semester,
+                'college': college,
+                'department': department,
+                'fields': fields,
+                'layout': layout,
+            },
+            lambda: self._get_listing(
+                'kpi',
+                layout,
+                lambda: self.repository.get_kpi_data(
+                    year=year,
+                    semester=semester,
+                    college=college,
+                    department=department,
+                    fields=fields,
+                ),
+                fields=fields,
+                year=year,
+                semester=semester,
+                college=college,
+                department=department,
+            ),
         )
         
         return {
-            'count': len(data),
-            'data': data,
+            **listing,
             'filters': {
                 'year': year,
                 'semester': semester,
@@ -78,6 +254,8 @@ class DashboardService:
         year: Optional[int] = None,
         college: Optional[str] = None,
         department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        layout: str = LAYOUT_ROWS,
     ) -> Dict[str, Any]:
         """
         논문 데이터 조회.
@@ -85,34 +263,76 @@ class DashboardService:
         Returns:
             Dict: 논문 데이터 및 추이
         """
-        # Get list data
-        data = self.repository.get_publication_data(
-            year=year,
-            college=college,
-            department=department,
-        )
-        
-        # Get trends (yearly)
-        trends = self.repository.get_publication_trends(
-            college=college,
-            department=department,
-        )
+        tasks, combine = self._publication_sections(year, college, department, fields, layout)
+        return combine(run_sequentially(tasks))
+    
+    async def aget_publication_data(
+        self,
+        year: Optional[int] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        layout: str = LAYOUT_ROWS,
+    ) -> Dict[str, Any]:
+        """get_publication_data()의 비동기 버전 (목록과 추이를 동시에 조회)."""
+        tasks, combine = self._publication_sections(year, college, department, fields, layout)
+        return combine(await gather_concurrently(tasks))
+    
+    def _publication_sections(
+        self,
+        year: Optional[int],
+        college: Optional[str],
+        department: Optional[str],
+        fields: Optional[List[str]],
+        layout: str,
+    ) -> Sections:
+        """논문 응답의 독립 조회 (목록, 연도별 추이)와 결과 조립 함수."""
+        tasks = {
+            'listing': lambda: self._get_listing(
+                'publication',
+                layout,
+                lambda: self.repository.get_publication_data(
+                    year=year,
+                    college=college,
+                    department=department,
+                    fields=fields,
+                ),
+                fields=fields,
+                year=year,
+                college=college,
+                department=department,
+            ),
+            'trends': lambda: self._cached(
+                'publication_trends',
+                ('publication',),
+                {'college': college, 'department': department},
+                lambda: self.repository.get_publication_trends(
+                    college=college,
+                    department=department,
+                ),
+            ),
+        }
         
-        return {
-            'count': len(data),
-            'data': data,
-            'trends': trends,
-            'filters': {
-                'year': year,
-                'college': college,
-                'department': department,
+        def combine(results: Dict[str, Any]) -> Dict[str, Any]:
+            trends = results['trends']
+            return {
+                **results['listing'],
+                'trends': to_columnar(trends) if layout == LAYOUT_COLUMNAR else trends,
+                'filters': {
+                    'year': year,
+                    'college': college,
+                    'department': department,
+                }
             }
-        }
+        
+        return tasks, combine
     
     def get_research_data(
         self,
         year: Optional[int] = None,
         department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        layout: str = LAYOUT_ROWS,
     ) -> Dict[str, Any]:
         """
         연구 프로젝트 데이터 조회.
@@ -120,32 +340,71 @@ class DashboardService:
         Returns:
             Dict: 연구 데이터 및 학과별 통계
         """
-        # Get list data
-        data = self.repository.get_research_data(
-            year=year,
-            department=department,
-        )
-        
-        # Get department statistics
-        dept_stats = self.repository.get_research_by_department(
-            year=year,
-        )
+        tasks, combine = self._research_sections(year, department, fields, layout)
+        return combine(run_sequentially(tasks))
+    
+    async def aget_research_data(
+        self,
+        year: Optional[int] = None,
+        department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        layout: str = LAYOUT_ROWS,
+    ) -> Dict[str, Any]:
+        """get_research_data()의 비동기 버전 (목록과 학과별 통계를 동시에 조회)."""
+        tasks, combine = self._research_sections(year, department, fields, layout)
+        return combine(await gather_concurrently(tasks))
+    
+    def _research_sections(
+        self,
+        year: Optional[int],
+        department: Optional[str],
+        fields: Optional[List[str]],
+        layout: str,
+    ) -> Sections:
+        """연구 응답의 독립 조회 (목록, 학과별 통계)와 결과 조립 함수."""
+        tasks = {
+            'listing': lambda: self._get_listing(
+                'research',
+                layout,
+                lambda: self.repository.get_research_data(
+                    year=year,
+                    department=department,
+                    fields=fields,
+                ),
+                fields=fields,
+                year=year,
+                department=department,
+            ),
+            'by_department': lambda: self._cached(
+                'research_by_department',
+                ('research',),
+                {'year': year},
+                lambda: self.repository.get_research_by_department(
+                    year=year,
+                ),
+            ),
+        }
         
-        return {
-            'count': len(data),
-            'data': data,
-            'by_department': dept_stats,
-            'filters': {
-                'year': year,
-                'department': department,
+        def combine(results: Dict[str, Any]) -> Dict[str, Any]:
+            dept_stats = results['by_department']
+            return {
+                **results['listing'],
+                'by_department': to_columnar(dept_stats) if layout == LAYOUT_COLUMNAR else dept_stats,
+                'filters': {
+                    'year': year,
+                    'department': department,
+                }
             }
-        }
+        
+        return tasks, combine
     
     def get_student_data(
         self,
         year: Optional[int] = None,
         college: Optional[str] = None,
         department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        layout: str = LAYOUT_ROWS,
     ) -> Dict[str, Any]:
         """
         학생 데이터 조회.
@@ -153,29 +412,138 @@ class DashboardService:
         Returns:
             Dict: 학생 데이터 및 통계
         """
-        # Get list data
-        data = self.repository.get_student_data(
+        tasks, combine = self._student_sections(year, college, department, fields, layout)
+        return combine(run_sequentially(tasks))
+    
+    async def aget_student_data(
+        self,
+        year: Optional[int] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        layout: str = LAYOUT_ROWS,
+    ) -> Dict[str, Any]:
+        """get_student_data()의 비동기 버전 (목록과 통계를 동시에 조회)."""
+        tasks, combine = self._student_sections(year, college, department, fields, layout)
+        return combine(await gather_concurrently(tasks))
+    
+    def _student_sections(
+        self,
+        year: Optional[int],
+        college: Optional[str],
+        department: Optional[str],
+        fields: Optional[List[str]],
+        layout: str,
+    ) -> Sections:
+        """학생 응답의 독립 조회 (목록, 통계)와 결과 조립 함수."""
+        tasks = {
+            'listing': lambda: self._get_listing(
+                'student',
+                layout,
+                lambda: self.repository.get_student_data(
+                    year=year,
+                    college=college,
+                    department=department,
+                    fields=fields,
+                ),
+                fields=fields,
+                year=year,
+                college=college,
+                department=department,
+            ),
+            'statistics': lambda: self._cached(
+                'student_statistics',
+                ('student',),
+                {'year': year, 'college': college},
+                lambda: self.repository.get_student_statistics(
+                    year=year,
+                    college=college,
+                ),
+            ),
+        }
+        
+        def combine(results: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                **results['listing'],
+                'statistics': results['statistics'],
+                'filters': {
+                    'year': year,
+                    'college': college,
+                    'department': department,
+                }
+            }
+        
+        return tasks, combine
+    
+    def _get_listing(
+        self,
+        data_type: str,
+        layout: str,
+        fetch_rows: Callable[[], List[Dict[str, Any]]],
+        fields: Optional[List[str]] = None,
+        **filters,
+    ) -> Dict[str, Any]:
+        """
+        리스트 데이터 조회 (layout에 따라 행 리스트 또는 컬럼 배열).
+        
+        Returns:
+            Dict: rows - {'count', 'data': [행]}, columnar - {'count', 'columns', 'data': {컬럼: [값]}}
+        """
+        if layout == LAYOUT_COLUMNAR:
+            columnar = self.repository.get_columns(data_type, fields=fields, **filters)
+            return {'count': len(columnar['data'].get('id', [])), **columnar}
+        
+        data = fetch_rows()
+        return {'count': len(data), 'data': data}
+    
+    def iter_data_rows(
+        self,
+        data_type: str,
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        리스트 데이터 행 스트리밍 (NDJSON 응답용).
+        
+        Returns:
+            Iterator[Dict]: 서버 사이드 커서로 생성되는 행
+        """
+        return self.repository.iter_rows(
+            data_type,
             year=year,
+            semester=semester,
             college=college,
             department=department,
+            fields=fields,
+            chunk_size=STREAM_CHUNK_SIZE,
         )
+    
+    def get_row_types(
+        self,
+        data_type: str,
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, str]:
+        """
+        iter_data_rows() 행의 컬럼별 값 타입 (Arrow 스트림 스키마용).
         
-        # Get statistics
-        statistics = self.repository.get_student_statistics(
+        Returns:
+            Dict[str, str]: 컬럼명 순서대로 {컬럼명: 값 타입}
+        """
+        return self.repository.get_row_types(
+            data_type,
             year=year,
+            semester=semester,
             college=college,
+            department=department,
+            fields=fields,
         )
-        
-        return {
-            'count': len(data),
-            'data': data,
-            'statistics': statistics,
-            'filters': {
-                'year': year,
-                'college': college,
-                'department': department,
-            }
-        }
     
     def get_available_filters(self) -> Dict[str, List[str]]:
         """
@@ -184,7 +552,118 @@ class DashboardService:
         Returns:
             Dict: 필터 옵션 리스트
         """
-        return self.repository.get_available_filters()
+        return self._cached(
+            'filters',
+            ALL_DATA_TYPES,
+            {},
+            self.repository.get_available_filters,
+        )
+    
+    def _cached(
+        self,
+        endpoint: str,
+        data_types: Iterable[str],
+        params: Dict[str, Any],
+        compute: Callable[[], Any],
+        allow_stale: bool = True,
+    ) -> Any:
+        """
+        데이터셋 버전을 키에 포함한 결과 캐시 조회 (없으면 계산 후 저장).
+        
+        동일한 키에 대한 동시 요청은 한 번만 계산하고 결과를 공유한다. 데이터셋이 바뀐
+        직후에는 이전 버전의 결과를 반환하고 백그라운드에서 다시 계산할 수 있다.
+        
+        Args:
+            endpoint: 캐시 구분용 엔드포인트 이름
+            data_types: 결과가 의존하는 데이터 타입
+            params: 요청 파라미터
+            compute: 캐시 미스 시 결과를 계산하는 callable
+            allow_stale: False이면 데이터셋 변경 직후에도 이전 버전 결과를 반환하지 않음
+        """
+        dataset_versions = self.repository.get_dataset_versions(data_types)
+        versions = {data_type: version for data_type, (version, _) in dataset_versions.items()}
+        timestamps = [updated_at for _, updated_at in dataset_versions.values() if updated_at]
+        
+        return result_cache.get_or_compute(
+            endpoint,
+            versions,
+            params,
+            compute,
+            changed_at=max(timestamps) if timestamps and allow_stale else None,
+        )
+    
+    def warm_up(self) -> Dict[str, int]:
+        """
+        자주 쓰이는 대시보드 응답을 미리 계산해 캐시에 적재.
+        
+        필터 목록, 연도별 요약(전체 포함), 단과대학별 KPI를 계산한다. 요약 계산이
+        컬럼형 데이터셋도 함께 적재하므로 이후 집계 요청은 DB 스캔 없이 처리된다.
+        
+        Returns:
+            Dict: 항목별 계산한 응답 수
+        """
+        filters = self.get_available_filters()
+        
+        years = [None] + list(filters.get('years', []))
+        for year in years:
+            self.get_summary(year=year)
+        
+        colleges = [None] + list(filters.get('colleges', []))
+        for college in colleges:
+            self.get_kpi_data(college=college)
+        
+        return {
+            'filters': 1,
+            'summary': len(years),
+            'kpi': len(colleges),
+        }
+    
+    def get_changes(self, data_type: str, since: int = 0) -> Dict[str, Any]:
+        """
+        since 버전 이후 추가/삭제된 행 조회 (로컬 사본을 유지하는 클라이언트의 델타 동기화).
+        
+        Args:
+            data_type: 'kpi', 'publication', 'research', 'student'
+            since: 클라이언트가 마지막으로 받은 version (0이면 전체)
+            
+        Returns:
+            Dict: {'type', 'since', 'version', 'reset', 'added', 'removed'} -
+                다음 요청의 since로 version을 사용한다
+            
+        Raises:
+            ValueError: 알 수 없는 데이터 타입이거나 since가 음수/현재 버전보다 큰 경우
+        """
+        if data_type not in ALL_DATA_TYPES:
+            raise ValueError(f"Invalid data type: {data_type}")
+        if since < 0:
+            raise ValueError("since must be a non-negative dataset version")
+        
+        changes = self._cached(
+            'changes',
+            (data_type,),
+            {'type': data_type, 'since': since},
+            lambda: self.repository.get_changes(data_type, since),
+            # Clients sync right after an upload; a previous-version delta would be a no-op
+            allow_stale=False,
+        )
+        
+        return {
+            'type': data_type,
+            'since': since,
+            **changes,
+        }
+    
+    def get_dataset_versions(
+        self,
+        data_types: Iterable[str],
+    ) -> Dict[str, Tuple[int, Optional[datetime]]]:
+        """
+        데이터 타입별 데이터셋 버전 조회 (ETag/Last-Modified 계산용).
+        
+        Returns:
+            Dict: {data_type: (version, updated_at)}
+        """
+        return self.repository.get_dataset_versions(data_types)
     
     def get_report_data(
         self,
@@ -194,10 +673,15 @@ class DashboardService:
         department: Optional[str] = None,
         page: int = 1,
         limit: int = 20,
+        cursor: Optional[int] = None,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         상세 리포트 데이터 조회 (페이지네이션 포함).
         
+        페이지 조회는 DB에서 LIMIT/OFFSET(또는 cursor가 주어지면 id keyset)으로 수행되며,
+        전체 건수는 데이터셋 버전을 키로 캐시된다.
+        
         Args:
             report_type: 'performance', 'publications', 'research', 'students'
             year: 연도 필터
@@ -205,52 +689,44 @@ class DashboardService:
             department: 학과 필터
             page: 페이지 번호
             limit: 페이지당 항목 수
+            cursor: 이전 페이지 마지막 행의 id (keyset 페이지네이션)
+            fields: 조회할 필드 목록 (None이면 metadata 전체 포함)
             
         Returns:
             Dict: 페이지네이션된 리포트 데이터
         """
         # Map report type to data type
-        type_mapping = {
-            'performance': 'kpi',
-            'publications': 'publication',
-            'research': 'research',
-            'students': 'student',
-        }
-        
-        data_type = type_mapping.get(report_type)
+        data_type = REPORT_TYPE_MAPPING.get(report_type)
         if not data_type:
             raise ValueError(f"Invalid report type: {report_type}")
+        if page < 1 or not 1 <= limit <= REPORT_MAX_PAGE_SIZE:
+            raise ValueError(f"Invalid pagination: page must be >= 1 and limit between 1 and {REPORT_MAX_PAGE_SIZE}")
         
-        # Get data based on type
-        if data_type == 'kpi':
-            result = self.get_kpi_data(year=year, college=college, department=department)
-            data = result['data']
-        elif data_type == 'publication':
-            result = self.get_publication_data(year=year, college=college, department=department)
-            data = result['data']
-        elif data_type == 'research':
-            result = self.get_research_data(year=year, department=department)
-            data = result['data']
-        elif data_type == 'student':
-            result = self.get_student_data(year=year, college=college, department=department)
-            data = result['data']
-        else:
-            data = []
-        
-        # Apply pagination
-        total = len(data)
-        start = (page - 1) * limit
-        end = start + limit
-        paginated_data = data[start:end]
+        filters = {
+            'year': year,
+            'college': None if data_type in REPORT_IGNORES_COLLEGE else college,
+            'department': department,
+        }
+        
+        data = self.repository.get_report_page(
+            data_type,
+            limit=limit,
+            offset=(page - 1) * limit,
+            after_id=cursor,
+            fields=fields,
+            **filters,
+        )
+        total = self._get_report_count(data_type, **filters)
         
         return {
             'report_type': report_type,
-            'data': paginated_data,
+            'data': data,
             'pagination': {
                 'page': page,
                 'limit': limit,
                 'total': total,
                 'pages': (total + limit - 1) // limit,  # Ceiling division
+                'next_cursor': data[-1]['id'] if len(data) == limit else None,
             },
             'filters': {
                 'year': year,
@@ -258,3 +734,141 @@ class DashboardService:
                 'department': department,
             }
         }
+    
+    def iter_report_rows(
+        self,
+        report_type: str,
+        year: Optional[int] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+        """
+        리포트 전체 행 스트리밍 (CSV/XLSX 내보내기용).
+        
+        행은 서버 사이드 커서로 chunk 단위로 조회되므로 리포트 크기와 무관하게
+        메모리 사용량이 일정하다.
+        
+        Args:
+            report_type: 'performance', 'publications', 'research', 'students'
+            year: 연도 필터
+            college: 단과대학 필터
+            department: 학과 필터
+            fields: 조회할 필드 목록 (None이면 metadata 전체 포함)
+            
+        Returns:
+            Tuple[List[str], Iterator[Dict]]: (컬럼명 목록, 행 iterator)
+        """
+        data_type = REPORT_TYPE_MAPPING.get(report_type)
+        if not data_type:
+            raise ValueError(f"Invalid report type: {report_type}")
+        
+        filters = {
+            'year': year,
+            'college': None if data_type in REPORT_IGNORES_COLLEGE else college,
+            'department': department,
+            'fields': fields,
+        }
+        columns = self.repository.get_row_columns(data_type, **filters)
+        rows = self.repository.iter_rows(data_type, chunk_size=STREAM_CHUNK_SIZE, **filters)
+        
+        return columns, rows
+    
+    def _get_report_count(self, data_type: str, **filters) -> int:
+        """
+        리포트 전체 건수 (데이터셋 버전 기준 캐시).
+        
+        Returns:
+            int: 필터에 해당하는 행 수
+        """
+        version, _ = self.repository.get_dataset_versions([data_type])[data_type]
+        cache_key = 'dashboard:report_count:{}:v{}:{}'.format(
+            data_type,
+            version,
+            ':'.join(f'{key}={value}' for key, value in sorted(filters.items())),
+        )
+        
+        total = cache.get(cache_key)
+        if total is None:
+            total = self.repository.count_report_rows(data_type, **filters)
+            cache.set(cache_key, total, REPORT_COUNT_CACHE_TIMEOUT)
+        
+        return total
+    
+    def get_bootstrap_data(
+        self,
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        대시보드 초기 로딩에 필요한 모든 섹션을 한 번에 조회.
+        
+        각 섹션은 개별 엔드포인트와 동일한 결과를 반환한다. 섹션의 집계는 개별
+        엔드포인트와 같은 결과 캐시를 공유하고, 서로 독립적인 조회는 동시에 실행된다.
+        
+        Returns:
+            Dict: summary, kpi, publications, research, students, filters 섹션
+        """
+        tasks, combine = self._bootstrap_sections(year, semester, college, department)
+        return combine(run_concurrently(tasks))
+    
+    async def aget_bootstrap_data(
+        self,
+        year: Optional[int] = None,
+        semester: Optional[str] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """get_bootstrap_data()의 비동기 버전 (스레드를 점유하지 않고 섹션 조회를 기다림)."""
+        tasks, combine = self._bootstrap_sections(year, semester, college, department)
+        return combine(await gather_concurrently(tasks))
+    
+    def _bootstrap_sections(
+        self,
+        year: Optional[int],
+        semester: Optional[str],
+        college: Optional[str],
+        department: Optional[str],
+    ) -> Sections:
+        """
+        초기 로딩 응답의 독립 조회와 결과 조립 함수.
+        
+        각 섹션은 개별 엔드포인트와 같은 서비스 호출(결과 캐시 포함)로 만들고,
+        섹션 안의 독립 조회까지 펼쳐서 모두 동시에 실행한다.
+        """
+        sections = {
+            'publications': self._publication_sections(year, college, department, None, LAYOUT_ROWS),
+            'research': self._research_sections(year, department, None, LAYOUT_ROWS),
+            'students': self._student_sections(year, college, department, None, LAYOUT_ROWS),
+        }
+        
+        tasks = {
+            'summary': lambda: self.get_summary(
+                year=year,
+                semester=semester,
+                college=college,
+            ),
+            'kpi': lambda: self.get_kpi_data(
+                year=year,
+                semester=semester,
+                college=college,
+                department=department,
+            ),
+            'filters': self.get_available_filters,
+        }
+        for section, (section_tasks, _) in sections.items():
+            for name, func in section_tasks.items():
+                tasks[f'{section}.{name}'] = func
+        
+        def combine(results: Dict[str, Any]) -> Dict[str, Any]:
+            response = {'summary': results['summary'], 'kpi': results['kpi']}
+            for section, (section_tasks, combine_section) in sections.items():
+                response[section] = combine_section(
+                    {name: results[f'{section}.{name}'] for name in section_tasks}
+                )
+            response['filters'] = results['filters']
+            return response
+        
+        return tasks, combine
@@ -0,0 +1,138 @@
+"""
+Immutable on-disk snapshots of columnar datasets.
+
+After an upload the new dataset version is written once as a set of .npy
+files under <DASHBOARD_SNAPSHOT_DIR>/<data_type>/v<version>-<token>/, where
+token is the version's dataset_versions.version_token: version numbers
+restart after a database reset or restore and collide between databases
+sharing the directory, the token does not. Workers map
+the arrays read-only (np.load mmap_mode='r'), so the pages are shared
+through the OS page cache instead of being copied into every gunicorn
+worker. A version directory is written to a temporary directory and
+renamed into place, so readers only ever see complete snapshots.
+"""
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+import numpy as np
+from django.conf import settings
+
+from .columnar import CategoricalColumn, ColumnarDataset
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = getattr(settings, 'DASHBOARD_SNAPSHOT_DIR', None)
+
+# Older versions kept on disk for workers that still map them
+SNAPSHOT_KEEP_VERSIONS = getattr(settings, 'DASHBOARD_SNAPSHOT_KEEP_VERSIONS', 2)
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def snapshot_path(data_type: str, version: int, token: str) -> Optional[str]:
+    """
+    Directory of one dataset version (None when snapshots are disabled or
+    the version has no token to identify it by).
+    """
+    if not SNAPSHOT_DIR or not token:
+        return None
+    return os.path.join(SNAPSHOT_DIR, data_type, f'v{version}-{token}')
+
+
+def _parse_version(name: str) -> Optional[int]:
+    """Version of a snapshot directory name (None for temporary and token-less names)."""
+    version, _, token = name[1:].partition('-')
+    if not name.startswith('v') or not version.isdigit() or not token:
+        return None
+    return int(version)
+
+
+def write_snapshot(dataset: ColumnarDataset) -> Optional[str]:
+    """
+    Write dataset as an immutable snapshot directory.
+
+    Returns the snapshot path, or None when snapshots are disabled. Writing
+    a version that already exists is a no-op.
+    """
+    path = snapshot_path(dataset.data_type, dataset.version, dataset.token)
+    if path is None or os.path.isdir(path):
+        return path
+
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = tempfile.mkdtemp(prefix='.tmp-', dir=parent)
+
+    try:
+        manifest = {
+            'data_type': dataset.data_type,
+            'version': dataset.version,
+            'token': dataset.token,
+            'columns': {},
+        }
+        for position, (name, column) in enumerate(dataset.columns.items()):
+            filename = f'{position}.npy'
+            if isinstance(column, CategoricalColumn):
+                np.save(os.path.join(tmp_path, filename), column.codes)
+                manifest['columns'][name] = {'file': filename, 'categories': column.categories}
+            else:
+                np.save(os.path.join(tmp_path, filename), column)
+                manifest['columns'][name] = {'file': filename}
+
+        with open(os.path.join(tmp_path, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+
+        # Atomic publish; another process may have published the same version first
+        os.rename(tmp_path, path)
+    except OSError:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not os.path.isdir(path):
+            raise
+
+    _prune_versions(dataset.data_type, dataset.version)
+    return path
+
+
+def load_snapshot(data_type: str, version: int, token: str) -> Optional[ColumnarDataset]:
+    """Map a snapshot read-only, or None if it has not been written."""
+    path = snapshot_path(data_type, version, token)
+    if path is None:
+        return None
+
+    try:
+        with open(os.path.join(path, MANIFEST_NAME), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+
+    columns = {}
+    for name, spec in manifest['columns'].items():
+        array = np.load(os.path.join(path, spec['file']), mmap_mode='r')
+        if 'categories' in spec:
+            columns[name] = CategoricalColumn(array, spec['categories'])
+        else:
+            columns[name] = array
+
+    return ColumnarDataset(data_type, version, columns, token)
+
+
+def _prune_versions(data_type: str, current_version: int) -> None:
+    """
+    Remove snapshots older than the last SNAPSHOT_KEEP_VERSIONS versions,
+    and token-less v<version> directories written before version tokens.
+
+    Unlinking files a worker still maps is safe on POSIX; the pages stay
+    valid until the worker switches to the new version.
+    """
+    parent = os.path.join(SNAPSHOT_DIR, data_type)
+    for name in os.listdir(parent):
+        if name.startswith('.tmp-'):
+            continue
+        version = _parse_version(name)
+        if version is None or version <= current_version - SNAPSHOT_KEEP_VERSIONS:
+            shutil.rmtree(os.path.join(parent, name), ignore_errors=True)
+            logger.info(f"Removed dashboard snapshot {data_type} {name}")
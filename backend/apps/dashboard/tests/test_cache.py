@@ -0,0 +1,201 @@
+"""
+Unit tests for the dashboard result cache
+"""
+import threading
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.dashboard.cache import ResultCache, make_cache_key, track_stale_results
+
+
+@pytest.fixture
+def result_cache():
+    """ResultCache on the default (local memory) cache"""
+    cache.clear()
+    return ResultCache(alias='default', timeout=60, lock_timeout=2, stale_while_revalidate=60)
+
+
+@pytest.mark.unit
+class TestResultCacheSingleFlight:
+    """ResultCache.get_or_compute() request coalescing"""
+
+    def test_concurrent_misses_compute_once(self, result_cache):
+        """
+        Given: Eight threads requesting the same uncached result
+        When: They call get_or_compute() at the same time
+        Then: Should compute once and return the same result to every thread
+        """
+        calls = []
+        start = threading.Barrier(8)
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return {'total_students': 3}
+
+        def request():
+            start.wait()
+            results.append(result_cache.get_or_compute('summary', {'student': 1}, {'year': 2024}, compute))
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{'total_students': 3}] * 8
+
+    def test_waiters_receive_the_leader_error(self, result_cache):
+        """
+        Given: A computation that fails
+        When: Two threads request it concurrently
+        Then: Should raise the error in both and leave nothing cached
+        """
+        start = threading.Barrier(2)
+        errors = []
+
+        def compute():
+            time.sleep(0.1)
+            raise RuntimeError('db down')
+
+        def request():
+            start.wait()
+            try:
+                result_cache.get_or_compute('summary', {'student': 1}, {}, compute)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=request) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == ['db down', 'db down']
+        assert cache.get(make_cache_key('summary', {'student': 1}, {})) is None
+
+    def test_waits_for_result_of_process_holding_the_lock(self, result_cache):
+        """
+        Given: Another process holds the lock for the key
+        When: It stores the result while this process waits
+        Then: Should return the stored result without computing
+        """
+        key = make_cache_key('summary', {'student': 1}, {})
+        cache.add(f'{key}:lock', 1, 60)
+        threading.Timer(0.2, lambda: cache.set(key, {'total_students': 5}, 60)).start()
+
+        result = result_cache.get_or_compute(
+            'summary', {'student': 1}, {}, lambda: pytest.fail('should not compute'),
+        )
+
+        assert result == {'total_students': 5}
+
+    def test_computes_after_stale_lock_expires(self, result_cache):
+        """
+        Given: A lock left behind by a process that never stores the result
+        When: The lock timeout passes
+        Then: Should compute the result itself
+        """
+        result_cache.lock_timeout = 0.2
+        key = make_cache_key('summary', {'student': 1}, {})
+        cache.add(f'{key}:lock', 1, 60)
+
+        result = result_cache.get_or_compute('summary', {'student': 1}, {}, lambda: {'total_students': 1})
+
+        assert result == {'total_students': 1}
+
+
+@pytest.mark.unit
+class TestResultCacheStaleWhileRevalidate:
+    """Serving the previous version while recomputing in the background"""
+
+    def test_serves_previous_version_and_refreshes_in_background(self, result_cache):
+        """
+        Given: A cached result for version 1 and a dataset that just changed to version 2
+        When: Version 2 is requested
+        Then: Should return the version 1 result immediately and store version 2 in the background
+        """
+        result_cache.get_or_compute('summary', {'student': 1}, {}, lambda: {'total_students': 1})
+        refreshed = threading.Event()
+
+        def compute():
+            refreshed.set()
+            return {'total_students': 2}
+
+        tracker = track_stale_results()
+        result = result_cache.get_or_compute(
+            'summary', {'student': 2}, {}, compute, changed_at=timezone.now(),
+        )
+
+        assert result == {'total_students': 1}
+        assert tracker.stale is True
+        assert refreshed.wait(2)
+        result_cache._executor.shutdown(wait=True)
+        assert cache.get(make_cache_key('summary', {'student': 2}, {})) == {'total_students': 2}
+
+    def test_queued_refresh_is_scheduled_once(self, result_cache):
+        """
+        Given: A version change whose background refresh is queued but not started yet
+        When: Version 2 is requested again before the refresh runs
+        Then: Should submit a single refresh, and allow a new one once it has finished (here: failed)
+        """
+        result_cache.get_or_compute('summary', {'student': 1}, {}, lambda: {'total_students': 1})
+        executor = result_cache._executor = MagicMock()
+
+        def compute():
+            raise RuntimeError('db down')
+
+        def request():
+            return result_cache.get_or_compute(
+                'summary', {'student': 2}, {}, compute, changed_at=timezone.now(),
+            )
+
+        request()
+        request()
+
+        assert executor.submit.call_count == 1
+        refresh, *args = executor.submit.call_args.args
+        worker = threading.Thread(target=refresh, args=args)
+        worker.start()
+        worker.join()
+        request()
+        assert executor.submit.call_count == 2
+
+    def test_computes_synchronously_outside_stale_window(self, result_cache):
+        """
+        Given: A cached result for version 1 and a dataset changed long ago
+        When: Version 2 is requested
+        Then: Should compute the new result in the request
+        """
+        result_cache.get_or_compute('summary', {'student': 1}, {}, lambda: {'total_students': 1})
+        tracker = track_stale_results()
+
+        result = result_cache.get_or_compute(
+            'summary', {'student': 2}, {}, lambda: {'total_students': 2},
+            changed_at=timezone.now() - timedelta(hours=1),
+        )
+
+        assert result == {'total_students': 2}
+        assert tracker.stale is False
+
+    def test_naive_change_time_is_treated_as_utc(self, result_cache):
+        """
+        Given: A naive UTC change time (TIMESTAMP column) within the stale window
+        When: Version 2 is requested
+        Then: Should serve the previous result instead of failing on the comparison
+        """
+        result_cache.get_or_compute('summary', {'student': 1}, {}, lambda: {'total_students': 1})
+
+        result = result_cache.get_or_compute(
+            'summary', {'student': 2}, {}, lambda: {'total_students': 2},
+            changed_at=timezone.now().replace(tzinfo=None),
+        )
+
+        assert result == {'total_students': 1}
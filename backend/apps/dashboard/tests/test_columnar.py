@@ -0,0 +1,259 @@
+"""
+Unit tests for the columnar dataset cache
+"""
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+from apps.dashboard.aggregations import (
+    summarize_publication_trends,
+    summarize_research_by_department,
+    summarize_research_projects,
+)
+from apps.dashboard.columnar import (
+    YEAR_NULL,
+    CategoricalColumn,
+    ColumnarCache,
+    ColumnarDataset,
+    load_columnar_dataset,
+)
+
+
+RESEARCH_ROWS = [
+    {'year': 2023, 'semester': None, 'college': '공과대학', 'department': '컴퓨터공학과', '과제번호': 'P1', '총연구비': '100'},
+    {'year': 2023, 'semester': None, 'college': '공과대학', 'department': '컴퓨터공학과', '과제번호': 'P1', '총연구비': 50},
+    {'year': 2024, 'semester': None, 'college': '자연과학대학', 'department': '수학과', '과제번호': None, '총연구비': 'n/a'},
+    {'year': None, 'semester': None, 'college': None, 'department': '수학과', '과제번호': 'P2', '총연구비': 30},
+]
+
+
+def build_research_dataset(rows, version=1, token=None):
+    columns = {
+        'id': np.arange(len(rows), dtype=np.int64),
+        'year': np.array([YEAR_NULL if row['year'] is None else row['year'] for row in rows], dtype=np.int64),
+        '총연구비': np.array([int(row['총연구비']) if str(row['총연구비']).isdigit() else 0 for row in rows], dtype=np.int64),
+    }
+    for column in ('semester', 'college', 'department', '과제번호'):
+        columns[column] = CategoricalColumn.from_values([row[column] for row in rows])
+    return ColumnarDataset('research', version, columns, f'token{version}' if token is None else token)
+
+
+@pytest.mark.unit
+class TestColumnarDataset:
+    """ColumnarDataset aggregation primitives"""
+
+    def test_aggregations_match_row_aggregations(self):
+        """
+        Given: Research rows with duplicate project numbers, NULL year and non-numeric budget
+        When: Aggregated through the columnar dataset
+        Then: Should match the row-based aggregation functions
+        """
+        dataset = build_research_dataset(RESEARCH_ROWS)
+        mask = dataset.mask()
+
+        projects, budget = summarize_research_projects(RESEARCH_ROWS)
+        assert dataset.distinct_truthy('과제번호', mask) == projects
+        assert int(dataset.columns['총연구비'][mask].sum()) == budget
+        assert dataset.year_counts(mask) == summarize_publication_trends(RESEARCH_ROWS)
+
+        by_department = {
+            item['department']: (item['project_count'], item['total_budget'])
+            for item in summarize_research_by_department(RESEARCH_ROWS)
+        }
+        counts = dataset.value_counts('department', mask)
+        budgets = dataset.group_sum('department', '총연구비', mask)
+        assert {dept: (counts[dept], budgets[dept]) for dept in counts} == by_department
+
+    def test_mask_filters_like_repository(self):
+        """
+        Given: Research dataset
+        When: Masked by year, by college 'all' and by an unknown college
+        Then: Should ignore 'all' and match nothing for unknown values
+        """
+        dataset = build_research_dataset(RESEARCH_ROWS)
+
+        assert dataset.mask(year=2023).sum() == 2
+        assert dataset.mask(college='all').sum() == len(RESEARCH_ROWS)
+        assert dataset.mask(college='없는대학').sum() == 0
+
+
+@pytest.mark.unit
+class TestColumnarCache:
+    """ColumnarCache version invalidation"""
+
+    def test_reloads_only_when_version_changes(self):
+        """
+        Given: Empty cache
+        When: Same version is requested twice, then a newer version
+        Then: Should load once per version
+        """
+        cache = ColumnarCache()
+        current = {'version': 1}
+
+        with patch('apps.dashboard.snapshots.SNAPSHOT_DIR', None), patch(
+            'apps.dashboard.columnar.read_dataset_version',
+            side_effect=lambda data_type, using: (current['version'], f"token{current['version']}"),
+        ), patch(
+            'apps.dashboard.columnar.load_columnar_dataset',
+            side_effect=lambda data_type, using: build_research_dataset(RESEARCH_ROWS, current['version']),
+        ) as mock_load:
+            assert cache.get('research', 1).version == 1
+            assert cache.get('research', 1).version == 1
+            current['version'] = 2
+            assert cache.get('research', 2).version == 2
+
+        assert mock_load.call_count == 2
+
+    def test_dataset_is_labelled_with_the_version_it_was_loaded_at(self):
+        """
+        Given: An upload committed after the request read version 1
+        When: Version 1 is requested from an empty cache
+        Then: Should return the loaded version 2 dataset rather than label it as version 1
+        """
+        cache = ColumnarCache()
+
+        with patch('apps.dashboard.snapshots.SNAPSHOT_DIR', None), patch(
+            'apps.dashboard.columnar.read_dataset_version', return_value=(2, 'token2'),
+        ), patch(
+            'apps.dashboard.columnar.load_columnar_dataset',
+            return_value=build_research_dataset(RESEARCH_ROWS, 2),
+        ):
+            dataset = cache.get('research', 1)
+
+        assert (dataset.version, dataset.token) == (2, 'token2')
+
+
+@pytest.mark.unit
+class TestLoadColumnarDataset:
+    """load_columnar_dataset() consistency"""
+
+    def _load(self, atomic_blocks):
+        calls = []
+        connection = MagicMock(vendor='postgresql', atomic_blocks=atomic_blocks)
+        connection.cursor.return_value.__enter__.return_value.execute.side_effect = calls.append
+
+        @contextmanager
+        def atomic(using):
+            calls.append(f'BEGIN {using}')
+            atomic_blocks.append(object())
+            yield
+            atomic_blocks.pop()
+            calls.append('COMMIT')
+
+        def read_version(data_type, using):
+            calls.append('read version')
+            return 7, 'abc'
+
+        def load_columns(data_type, using):
+            calls.append('read rows')
+            return {'id': np.arange(3, dtype=np.int64)}
+
+        with patch('apps.dashboard.columnar.connections', {'replica': connection}), \
+                patch('apps.dashboard.columnar.transaction.atomic', atomic), \
+                patch('apps.dashboard.columnar.read_dataset_version', read_version), \
+                patch('apps.dashboard.columnar._load_columns', load_columns):
+            dataset = load_columnar_dataset('research', using='replica')
+        return dataset, calls
+
+    def test_version_and_rows_are_read_in_one_repeatable_read_transaction(self):
+        """
+        Given: No open transaction
+        When: A data type is loaded
+        Then: Should read the version and the rows in one REPEATABLE READ transaction
+        """
+        dataset, calls = self._load([])
+
+        assert calls == [
+            'BEGIN replica',
+            'SET TRANSACTION ISOLATION LEVEL REPEATABLE READ',
+            'read version',
+            'read rows',
+            'COMMIT',
+        ]
+        assert (dataset.version, dataset.token, dataset.size) == (7, 'abc', 3)
+
+    def test_load_inside_open_transaction_keeps_its_isolation(self):
+        """
+        Given: A caller's transaction is already open (e.g. in tests)
+        When: A data type is loaded
+        Then: Should not try to change the isolation level mid-transaction
+        """
+        _, calls = self._load([object()])
+
+        assert 'SET TRANSACTION ISOLATION LEVEL REPEATABLE READ' not in calls
+
+
+@pytest.mark.unit
+class TestColumnarSnapshots:
+    """Memory-mapped snapshot write/load"""
+
+    def test_snapshot_round_trip_is_memory_mapped(self, tmp_path):
+        """
+        Given: Research dataset written as a snapshot
+        When: The same version is loaded
+        Then: Should map the arrays read-only and aggregate identically
+        """
+        from apps.dashboard import snapshots
+
+        dataset = build_research_dataset(RESEARCH_ROWS, version=3)
+
+        with patch.object(snapshots, 'SNAPSHOT_DIR', str(tmp_path)):
+            path = snapshots.write_snapshot(dataset)
+            loaded = snapshots.load_snapshot('research', 3, 'token3')
+            missing = snapshots.load_snapshot('research', 4, 'token4')
+
+        assert path == str(tmp_path / 'research' / 'v3-token3')
+        assert missing is None
+        assert loaded.token == 'token3'
+        assert isinstance(loaded.columns['year'], np.memmap)
+        assert isinstance(loaded.columns['department'].codes, np.memmap)
+        mask = loaded.mask(year=2023)
+        assert loaded.value_counts('department', mask) == dataset.value_counts('department', dataset.mask(year=2023))
+        assert loaded.distinct_truthy('과제번호', loaded.mask()) == 2
+
+    def test_old_versions_are_pruned(self, tmp_path):
+        """
+        Given: Snapshots for versions 1 to 3
+        When: Keeping the last 2 versions
+        Then: Should remove version 1 only
+        """
+        from apps.dashboard import snapshots
+
+        with patch.object(snapshots, 'SNAPSHOT_DIR', str(tmp_path)), \
+                patch.object(snapshots, 'SNAPSHOT_KEEP_VERSIONS', 2):
+            for version in (1, 2, 3):
+                snapshots.write_snapshot(build_research_dataset(RESEARCH_ROWS, version))
+
+        assert sorted(p.name for p in (tmp_path / 'research').iterdir()) == ['v2-token2', 'v3-token3']
+
+    def test_snapshot_of_another_database_is_not_loaded(self, tmp_path):
+        """
+        Given: A version 3 snapshot written by another database (or before a restore)
+        When: This database's version 3, with a different token, is loaded
+        Then: Should not map the foreign snapshot
+        """
+        from apps.dashboard import snapshots
+
+        with patch.object(snapshots, 'SNAPSHOT_DIR', str(tmp_path)):
+            snapshots.write_snapshot(build_research_dataset(RESEARCH_ROWS, 3, token='otherdb'))
+
+            assert snapshots.load_snapshot('research', 3, 'thisdb') is None
+            assert snapshots.snapshot_path('research', 3, '') is None
+
+    def test_token_less_snapshots_are_pruned(self, tmp_path):
+        """
+        Given: v<version> directories written before version tokens
+        When: A new snapshot is written
+        Then: Should remove the token-less directories
+        """
+        from apps.dashboard import snapshots
+
+        (tmp_path / 'research' / 'v2').mkdir(parents=True)
+        (tmp_path / 'research' / 'v3').mkdir()
+
+        with patch.object(snapshots, 'SNAPSHOT_DIR', str(tmp_path)):
+            snapshots.write_snapshot(build_research_dataset(RESEARCH_ROWS, 1))
+
+        assert [p.name for p in (tmp_path / 'research').iterdir()] == ['v1-token1']
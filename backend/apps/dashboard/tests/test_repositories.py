@@ -0,0 +1,401 @@
+"""
+Unit tests for DashboardRepository
+"""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from unittest.mock import MagicMock, patch
+
+from apps.authentication.models import User
+from apps.core.renderers import ArrowStreamRenderer
+from apps.dashboard.repositories import DashboardRepository
+from apps.data_upload.models import DataUploadLog, UploadedData
+from apps.data_upload.repositories import DataUploadRepository
+
+# Columns the list endpoints put before the metadata spread, as serialized from model instances
+SERIALIZED_COLUMNS = {
+    'kpi': ('id', 'year', 'semester', 'college', 'department'),
+    'publication': ('id', 'year', 'college', 'department'),
+    'research': ('id', 'year', 'department'),
+    'student': ('id', 'year', 'college', 'department'),
+}
+
+LIST_METHODS = {
+    'kpi': 'get_kpi_data',
+    'publication': 'get_publication_data',
+    'research': 'get_research_data',
+    'student': 'get_student_data',
+}
+
+
+@pytest.fixture
+def repository():
+    """DashboardRepository instance"""
+    return DashboardRepository()
+
+
+@pytest.mark.unit
+class TestDashboardRepositoryFilterDimensions:
+    """Filter options served from dashboard_filter_dimensions"""
+
+    def test_filters_are_built_from_dimension_rows(self, repository):
+        """
+        Given: Dimension rows of several data types, including a non-KPI semester
+        When: get_available_filters is called
+        Then: Should merge values across types, sort years descending and take semesters from KPI only
+        """
+        rows = [
+            ('publication', 'year', '2023'),
+            ('kpi', 'year', '2024'),
+            ('student', 'year', '2023'),
+            ('kpi', 'college', '공과대학'),
+            ('publication', 'college', '경영대학'),
+            ('publication', 'department', '컴퓨터공학과'),
+            ('kpi', 'semester', '1학기'),
+            ('student', 'semester', '2학기'),
+        ]
+
+        with patch('apps.dashboard.repositories.FilterDimension') as MockDimension, \
+                patch.object(repository, '_scan_available_filters') as scan:
+            MockDimension.objects.filter.return_value.values_list.return_value = rows
+            result = repository.get_available_filters()
+
+        MockDimension.objects.filter.assert_called_once_with(row_count__gt=0)
+        scan.assert_not_called()
+        assert result == {
+            'years': [2024, 2023],
+            'colleges': ['경영대학', '공과대학'],
+            'departments': ['컴퓨터공학과'],
+            'semesters': ['1학기'],
+        }
+
+    def test_empty_dimension_table_falls_back_to_scan(self, repository):
+        """
+        Given: No dimension rows yet (table not populated since deployment)
+        When: get_available_filters is called
+        Then: Should scan uploaded_data instead
+        """
+        scanned = {'years': [2024], 'colleges': [], 'departments': [], 'semesters': []}
+
+        with patch('apps.dashboard.repositories.FilterDimension') as MockDimension, \
+                patch.object(repository, '_scan_available_filters', return_value=scanned):
+            MockDimension.objects.filter.return_value.values_list.return_value = []
+            result = repository.get_available_filters()
+
+        assert result is scanned
+
+    def test_refresh_replaces_dimension_rows_of_type(self, repository, db):
+        """
+        Given: Grouped value counts per dimension of the uploaded rows
+        When: refresh_filter_dimensions is called for a data type
+        Then: Should replace only that type's rows with stringified values and counts
+        """
+        grouped = {
+            'year': [(2024, 10), (2023, 4)],
+            'college': [('공과대학', 14)],
+            'department': [],
+            'semester': [('1학기', 14)],
+        }
+
+        def values_list(dimension):
+            chain = MagicMock()
+            chain.annotate.return_value.order_by.return_value = grouped[dimension]
+            return chain
+
+        with patch('apps.dashboard.repositories.UploadedData') as MockData, \
+                patch('apps.dashboard.repositories.FilterDimension') as MockDimension:
+            MockDimension.side_effect = lambda **kwargs: kwargs
+            MockData.objects.filter.return_value.exclude.return_value.values_list.side_effect = values_list
+            count = repository.refresh_filter_dimensions('kpi')
+
+        MockData.objects.filter.assert_called_once_with(data_type='kpi')
+        MockDimension.objects.filter.assert_called_once_with(data_type='kpi')
+        MockDimension.objects.filter.return_value.delete.assert_called_once()
+        instances = MockDimension.objects.bulk_create.call_args.args[0]
+        assert count == 4
+        assert instances == [
+            {'data_type': 'kpi', 'dimension': 'year', 'value': '2024', 'row_count': 10},
+            {'data_type': 'kpi', 'dimension': 'year', 'value': '2023', 'row_count': 4},
+            {'data_type': 'kpi', 'dimension': 'college', 'value': '공과대학', 'row_count': 14},
+            {'data_type': 'kpi', 'dimension': 'semester', 'value': '1학기', 'row_count': 14},
+        ]
+
+
+@pytest.mark.unit
+class TestDashboardRepositoryAggregateSources:
+    """Which pre-aggregated source backs the dashboard aggregates"""
+
+    def test_default_settings_read_columnar_cache_but_keep_rollups_current(self, repository, db):
+        """
+        Given: Default settings (columnar cache on, DASHBOARD_USE_ROLLUPS unset)
+        When: The summary is requested and an upload refreshes the rollups
+        Then: Should answer from the columnar cache and still rebuild the rollup rows
+        """
+        with patch.object(repository, '_get_summary_from_columnar', return_value={}) as columnar, \
+                patch.object(repository, '_get_summary_from_rollups') as rollups, \
+                patch('apps.dashboard.repositories.connection') as mock_connection:
+            mock_connection.vendor = 'postgresql'
+            cursor = mock_connection.cursor.return_value.__enter__.return_value
+            cursor.fetchone.return_value = (7,)
+            repository.get_summary_statistics(year=2024)
+            refreshed = repository.refresh_rollups('student')
+
+        columnar.assert_called_once()
+        rollups.assert_not_called()
+        assert refreshed == 7
+        cursor.execute.assert_called_once_with('SELECT refresh_dashboard_rollups(%s)', ['student'])
+
+
+@pytest.mark.unit
+class TestDashboardRepositoryChangesRouting:
+    """Where get_changes reads from"""
+
+    def test_lagging_replica_falls_back_to_primary(self, repository):
+        """
+        Given: A replica that has not replayed the client's version yet
+        When: get_changes is called
+        Then: Should read the changes again from the primary
+        """
+        changes = {'version': 5, 'reset': False, 'added': [], 'removed': []}
+
+        with patch('apps.dashboard.repositories.router') as mock_router, \
+                patch.object(repository, '_read_changes', side_effect=[ValueError('ahead'), changes]) as read:
+            mock_router.db_for_read.return_value = 'replica'
+            result = repository.get_changes('publication', 5)
+
+        assert result is changes
+        assert [call.args for call in read.call_args_list] == [
+            ('publication', 5, 'replica'),
+            ('publication', 5, 'default'),
+        ]
+
+    def test_since_ahead_of_primary_raises(self, repository):
+        """
+        Given: Reads routed to the primary
+        When: since is ahead of the current version
+        Then: Should raise ValueError without retrying
+        """
+        with patch('apps.dashboard.repositories.router') as mock_router, \
+                patch.object(repository, '_read_changes', side_effect=ValueError('ahead')) as read:
+            mock_router.db_for_read.return_value = 'default'
+            with pytest.raises(ValueError):
+                repository.get_changes('publication', 9)
+
+        read.assert_called_once()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(connection.vendor != 'postgresql', reason='Changes are recorded by a PostgreSQL function')
+@pytest.mark.django_db
+class TestDashboardRepositoryChanges:
+    """Delta sync from the dataset change log"""
+
+    def test_changes_since_version_without_row_locks(self, repository, supabase_schema, db):
+        """
+        Given: Two recorded dataset versions, the second replacing one row
+        When: Changes since each version are read
+        Then: Should return the net added/removed rows without locking dataset_versions
+        """
+        user = User.objects.create(username='changes_user', password_hash='!')
+        log = DataUploadLog.objects.create(user_id=user.id, filename='changes.xlsx', status='success')
+        upload_repository = DataUploadRepository()
+
+        def record(*titles):
+            UploadedData.objects.filter(data_type='publication').delete()
+            UploadedData.objects.bulk_create(
+                UploadedData(upload_log_id=log.id, data_type='publication', year=2024, metadata={'논문제목': title})
+                for title in titles
+            )
+            version = upload_repository.bump_dataset_version('publication')
+            repository.record_changes('publication', version)
+            return version
+
+        first = record('A', 'B')
+        second = record('A', 'C')
+
+        with CaptureQueriesContext(connection) as queries:
+            everything = repository.get_changes('publication', first - 1)
+            delta = repository.get_changes('publication', first)
+
+        assert everything['version'] == second
+        assert sorted(row['논문제목'] for row in everything['added']) == ['A', 'C']
+        assert [row['논문제목'] for row in delta['added']] == ['C']
+        assert len(delta['removed']) == 1
+        assert delta['removed'][0] not in {row['row_key'] for row in everything['added']}
+        assert not any('FOR SHARE' in query['sql'] for query in queries.captured_queries)
+        with pytest.raises(ValueError):
+            repository.get_changes('publication', second + 1)
+
+
+def _serialize(data_type, item):
+    """A list row as previously built from an UploadedData instance."""
+    return {
+        **{column: getattr(item, column) for column in SERIALIZED_COLUMNS[data_type]},
+        **item.metadata,
+    }
+
+
+def _serialize_fields(data_type, item, fields):
+    """A ?fields= row as previously built with values() and metadata -> key."""
+    row = {'id': item.id}
+    row.update({
+        column: getattr(item, column)
+        for column in SERIALIZED_COLUMNS[data_type]
+        if column in fields and column != 'id'
+    })
+    row.update({
+        key: item.metadata.get(key)
+        for key in fields
+        if key not in SERIALIZED_COLUMNS[data_type]
+    })
+    return row
+
+
+@pytest.fixture
+def list_rows(supabase_schema, db):
+    """Rows of every data type with nested, numeric, null and column-shadowing metadata."""
+    user = User.objects.create(username='rows_user', password_hash='!')
+    log = DataUploadLog.objects.create(user_id=user.id, filename='rows.xlsx', status='success')
+    metadata = [
+        {'논문제목': '딥러닝', 'Impact_Factor': 3.7, '저자': ['김', '이'], '상세': {'권': 12, '호': None},
+         '인용수': 2, '점수': 2, '공개': True},
+        {'논문제목': None, 'Impact_Factor': 'N/A', 'year': '2023학년도', '인용수': 3, '점수': 3.5, '공개': None},
+        {},
+    ]
+    UploadedData.objects.bulk_create(
+        UploadedData(
+            upload_log_id=log.id, data_type=data_type, year=2024 if index else None,
+            semester='1학기', college='공과대학', department='컴퓨터공학과', metadata=values,
+        )
+        for data_type in LIST_METHODS
+        for index, values in enumerate(metadata)
+    )
+    return {
+        data_type: list(UploadedData.objects.filter(data_type=data_type).order_by('id'))
+        for data_type in LIST_METHODS
+    }
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(connection.vendor != 'postgresql', reason='Rows are read through JSONB key extraction')
+@pytest.mark.django_db
+class TestDashboardRepositoryRowShaping:
+    """List rows built from values_list tuples"""
+
+    @pytest.mark.parametrize('data_type', list(LIST_METHODS))
+    def test_list_rows_match_serialized_instances(self, repository, list_rows, data_type):
+        """
+        Given: Rows with nested, numeric, null and column-shadowing metadata keys
+        When: The data type's list endpoint rows are built
+        Then: Should equal the instance-serialized rows, including key order and metadata overriding columns
+        """
+        rows = getattr(repository, LIST_METHODS[data_type])()
+        expected = [_serialize(data_type, item) for item in list_rows[data_type]]
+
+        assert sorted(rows, key=lambda row: row['id']) == expected
+        assert [list(row) for row in sorted(rows, key=lambda row: row['id'])] == [list(row) for row in expected]
+        assert expected[1]['year'] == '2023학년도'
+
+    @pytest.mark.parametrize('fields', [
+        ['논문제목'],
+        ['department', 'Impact_Factor', '저자', '상세'],
+        ['year', '없는키', 'id'],
+    ])
+    def test_projected_rows_match_serialized_instances(self, repository, list_rows, fields):
+        """
+        Given: Publication rows
+        When: Rows are built with a ?fields= projection
+        Then: Should contain id, the requested columns and metadata keys (None when missing) like before
+        """
+        rows = repository.get_publication_data(fields=fields)
+        expected = [_serialize_fields('publication', item, fields) for item in list_rows['publication']]
+
+        assert sorted(rows, key=lambda row: row['id']) == expected
+
+    def test_streamed_report_and_columnar_rows_agree(self, repository, list_rows):
+        """
+        Given: Publication rows
+        When: Rows are streamed, paged and returned as columns
+        Then: Should carry the same values as the list rows
+        """
+        expected = [_serialize('publication', item) for item in list_rows['publication']]
+
+        streamed = list(repository.iter_rows('publication', chunk_size=2))
+        paged = repository.get_report_page('publication', limit=10)
+        columnar = repository.get_columns('publication')
+
+        assert streamed == expected
+        assert paged == expected
+        # Columns are the union of keys, so a row's absent keys come back as None
+        rebuilt = [
+            {name: values[index] for name, values in columnar['data'].items() if values[index] is not None}
+            for index in range(len(expected))
+        ]
+        assert rebuilt == [{key: value for key, value in row.items() if value is not None} for row in expected]
+
+    def test_columns_stay_aligned_when_metadata_shadows_a_column(self, repository, list_rows):
+        """
+        Given: A row whose metadata overrides a row column and omits a key earlier rows had
+        When: Rows are returned as columns
+        Then: Should pad the omitted key with None so later rows stay on their own index
+        """
+        log_id = list_rows['kpi'][0].upload_log_id
+        UploadedData.objects.filter(data_type='kpi').delete()
+        UploadedData.objects.bulk_create(
+            UploadedData(upload_log_id=log_id, data_type='kpi', year=2024, metadata=values)
+            for values in ({'점수': 1, '등급': 'A'}, {'year': '2023학년도', '점수': 2}, {'점수': 3, '등급': 'C'})
+        )
+
+        columnar = repository.get_columns('kpi')
+
+        assert columnar['data']['점수'] == [1, 2, 3]
+        assert columnar['data']['등급'] == ['A', None, 'C']
+        assert columnar['data']['year'] == [2024, '2023학년도', 2024]
+
+    def test_row_types_widen_over_all_rows(self, repository, list_rows):
+        """
+        Given: Metadata keys whose value types differ between rows
+        When: The row value types are computed
+        Then: Should widen integers with numbers to number and other mixes to string, over every row
+        """
+        types = repository.get_row_types('publication')
+
+        assert types == {
+            'id': 'integer',
+            'year': 'string',
+            'college': 'string',
+            'department': 'string',
+            '논문제목': 'string',
+            'Impact_Factor': 'string',
+            '저자': 'string',
+            '상세': 'string',
+            '인용수': 'integer',
+            '점수': 'number',
+            '공개': 'boolean',
+        }
+        assert list(types) == repository.get_row_columns('publication')
+        assert repository.get_row_types('research', fields=['인용수', '없는키']) == {
+            'id': 'integer', '인용수': 'integer', '없는키': 'string',
+        }
+
+    def test_arrow_stream_keeps_every_value(self, repository, list_rows):
+        """
+        Given: Rows whose later values do not fit the types of the first row
+        When: Streamed as Arrow with the row value types in batches of one row
+        Then: Should read back every value (numbers widened, mixed values as text) and no extra nulls
+        """
+        pa = pytest.importorskip('pyarrow')
+
+        chunks = ArrowStreamRenderer.stream(
+            repository.iter_rows('publication'),
+            types=repository.get_row_types('publication'),
+            batch_size=1,
+        )
+        table = pa.ipc.open_stream(b''.join(chunks)).read_all().to_pydict()
+
+        assert table['점수'] == [2.0, 3.5, None]
+        assert table['인용수'] == [2, 3, None]
+        assert table['Impact_Factor'] == ['3.7', 'N/A', None]
+        assert table['year'] == [None, '2023학년도', '2024']
+        assert table['상세'] == ['{"권": 12, "호": null}', None, None]
+
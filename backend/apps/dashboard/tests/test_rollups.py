@@ -0,0 +1,116 @@
+"""
+Integration tests for the dashboard rollup table
+
+Builds the rollups with refresh_dashboard_rollups() and checks that the
+rollup-backed aggregates match the ones computed from the raw rows.
+"""
+import pytest
+from django.db import connection
+from unittest.mock import patch
+
+from apps.authentication.models import User
+from apps.dashboard.repositories import DashboardRepository
+from apps.data_upload.models import DataUploadLog, UploadedData
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(connection.vendor != 'postgresql', reason='Rollups are refreshed by a PostgreSQL function'),
+]
+
+FILTERS = [
+    {},
+    {'year': 2024},
+    {'college': '공과대학'},
+    {'year': 2023, 'college': '경영대학'},
+    {'year': 2024, 'semester': '1학기'},
+]
+
+
+@pytest.fixture
+def repository(supabase_schema, db):
+    """Repository over student/research rows with freshly built rollups."""
+    user = User.objects.create(username='rollup_user', password_hash='!')
+    log = DataUploadLog.objects.create(user_id=user.id, filename='rollups.xlsx', status='success')
+
+    students = [
+        ('공과대학', 2024, '1학기', {'과정구분': '학사', '학적상태': '재학'}),
+        ('공과대학', 2024, '1학기', {'과정구분': '석사', '학적상태': '재학'}),
+        ('공과대학', 2023, '2학기', {'과정구분': '학사', '학적상태': '휴학'}),
+        ('경영대학', 2023, '1학기', {'과정구분': '박사'}),
+        ('경영대학', 2024, None, {}),
+    ]
+    research = [
+        ('공과대학', 2024, {'과제번호': 'R-1', '총연구비': 1000}),
+        ('공과대학', 2024, {'과제번호': 'R-1', '총연구비': '250'}),
+        ('공과대학', 2023, {'과제번호': 'R-2', '총연구비': ' 40 '}),
+        ('경영대학', 2023, {'과제번호': 'R-3', '총연구비': '미정'}),
+        ('경영대학', 2024, {'과제번호': '', '총연구비': 7}),
+    ]
+    UploadedData.objects.bulk_create(
+        [
+            UploadedData(upload_log_id=log.id, data_type='student', college=college, year=year,
+                         semester=semester, department='학과', metadata=metadata)
+            for college, year, semester, metadata in students
+        ] + [
+            UploadedData(upload_log_id=log.id, data_type='research', college=college, year=year,
+                         department='학과', metadata=metadata)
+            for college, year, metadata in research
+        ] + [
+            UploadedData(upload_log_id=log.id, data_type='publication', college='공과대학', year=2024,
+                         semester='1학기', department='학과', metadata={}),
+        ]
+    )
+
+    repository = DashboardRepository()
+    for data_type in ('student', 'research', 'publication'):
+        repository.refresh_rollups(data_type)
+    with patch('apps.dashboard.repositories.USE_COLUMNAR_CACHE', False), \
+            patch('apps.dashboard.repositories.USE_ROLLUPS', True):
+        yield repository
+
+
+def _from_rows(method, **filters):
+    """Compute an aggregate from the raw uploaded_data rows."""
+    with patch('apps.dashboard.repositories.USE_ROLLUPS', False):
+        return method(**filters)
+
+
+@pytest.mark.django_db
+class TestDashboardRollups:
+    """Rollup-backed aggregates"""
+
+    @pytest.mark.parametrize('filters', FILTERS)
+    def test_summary_from_rollups_matches_rows(self, repository, filters):
+        """
+        Given: Student, research and publication rows and their rollups
+        When: The summary is computed from the rollups
+        Then: Should equal the summary computed from the rows (duplicate and empty 과제번호, non-numeric budgets)
+        """
+        expected = _from_rows(repository.get_summary_statistics, **filters)
+
+        assert repository._get_summary_from_rollups(**filters) == expected
+
+    @pytest.mark.parametrize('filters', [
+        {key: value for key, value in filters.items() if key != 'semester'} for filters in FILTERS
+    ])
+    def test_student_statistics_from_rollups_match_rows(self, repository, filters):
+        """
+        Given: Student rows with missing 과정구분/학적상태 keys and their rollups
+        When: Student statistics are computed from the rollups
+        Then: Should equal the statistics computed from the rows, counting missing keys as Unknown
+        """
+        expected = _from_rows(repository.get_student_statistics, **filters)
+
+        assert repository._get_student_statistics_from_rollups(**filters) == expected
+
+    def test_aggregates_are_read_from_rollups_when_columnar_cache_is_off(self, repository):
+        """
+        Given: Columnar cache disabled and rollups enabled
+        When: The summary is requested
+        Then: Should answer from the rollup table
+        """
+        with patch.object(repository, '_get_summary_from_rollups', return_value={'total_students': 5}) as rollups:
+            result = repository.get_summary_statistics(year=2024)
+
+        rollups.assert_called_once_with(year=2024, semester=None, college=None)
+        assert result == {'total_students': 5}
@@ -0,0 +1,439 @@
+"""
+Unit tests for DashboardService
+"""
+import asyncio
+import threading
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+
+from apps.dashboard.services import DashboardService
+
+
+@pytest.fixture
+def mock_dashboard_repository():
+    """Mock DashboardRepository fixture"""
+    repository = MagicMock()
+    repository.get_dataset_versions.side_effect = lambda data_types: {
+        data_type: (1, None) for data_type in data_types
+    }
+    return repository
+
+
+@pytest.fixture
+def dashboard_service(mock_dashboard_repository):
+    """DashboardService with injected mock repository"""
+    cache.clear()
+    service = DashboardService()
+    service.repository = mock_dashboard_repository
+    return service
+
+
+@pytest.fixture
+def repository_rows(mock_dashboard_repository):
+    """Mock repository results for every dashboard section"""
+    repository = mock_dashboard_repository
+    repository.get_summary_statistics.return_value = {'total_students': 1}
+    repository.get_kpi_data.return_value = [{'id': 4}]
+    repository.get_publication_data.return_value = [{'id': 1, 'year': 2023}]
+    repository.get_publication_trends.return_value = [{'year': 2023, 'count': 1}]
+    repository.get_research_data.return_value = [{'id': 2, 'year': 2023}]
+    repository.get_research_by_department.return_value = [{'department': 'A', 'count': 1}]
+    repository.get_student_data.return_value = [{'id': 3, 'year': 2023}]
+    repository.get_student_statistics.return_value = {'by_program': {'학사': 1}}
+    repository.get_available_filters.return_value = {'years': [2023]}
+    return repository
+
+
+@pytest.mark.unit
+class TestDashboardServiceReport:
+    """DashboardService.get_report_data() unit tests"""
+
+    def test_report_page_is_fetched_from_database(self, dashboard_service, mock_dashboard_repository):
+        """
+        Given: Publication report with 45 matching rows
+        When: Page 2 is requested with limit 20
+        Then: Should request exactly one page with OFFSET 20 and paginate by count
+        """
+        mock_dashboard_repository.get_report_page.return_value = [{'id': i} for i in range(21, 41)]
+        mock_dashboard_repository.count_report_rows.return_value = 45
+
+        result = dashboard_service.get_report_data('publications', page=2, limit=20)
+
+        mock_dashboard_repository.get_report_page.assert_called_once_with(
+            'publication', limit=20, offset=20, after_id=None, fields=None,
+            year=None, college=None, department=None,
+        )
+        assert result['pagination'] == {
+            'page': 2, 'limit': 20, 'total': 45, 'pages': 3, 'next_cursor': 40,
+        }
+
+    def test_report_count_is_cached_per_dataset_version(self, dashboard_service, mock_dashboard_repository):
+        """
+        Given: Same report requested twice at the same dataset version
+        When: get_report_data is called for two different pages
+        Then: Should run the count query only once
+        """
+        mock_dashboard_repository.get_report_page.return_value = []
+        mock_dashboard_repository.count_report_rows.return_value = 10
+
+        dashboard_service.get_report_data('students', page=1, limit=5)
+        dashboard_service.get_report_data('students', page=2, limit=5)
+
+        mock_dashboard_repository.count_report_rows.assert_called_once()
+
+    def test_research_report_ignores_college_and_uses_cursor(self, dashboard_service, mock_dashboard_repository):
+        """
+        Given: Research report with college filter and keyset cursor
+        When: get_report_data is called
+        Then: Should drop the college filter and page after the cursor id
+        """
+        mock_dashboard_repository.get_report_page.return_value = []
+        mock_dashboard_repository.count_report_rows.return_value = 0
+
+        dashboard_service.get_report_data('research', college='공과대학', cursor=100)
+
+        _, kwargs = mock_dashboard_repository.get_report_page.call_args
+        assert kwargs['college'] is None
+        assert kwargs['after_id'] == 100
+
+    def test_invalid_report_type_raises_value_error(self, dashboard_service):
+        """
+        Given: Unknown report type
+        When: get_report_data is called
+        Then: Should raise ValueError
+        """
+        with pytest.raises(ValueError):
+            dashboard_service.get_report_data('unknown')
+
+    @pytest.mark.parametrize('page,limit', [(1, 0), (1, -5), (0, 20), (-1, 20), (1, 10_000)])
+    def test_invalid_pagination_raises_value_error(self, dashboard_service, mock_dashboard_repository, page, limit):
+        """
+        Given: A zero, negative or oversized page/limit
+        When: get_report_data is called
+        Then: Should raise ValueError without querying
+        """
+        with pytest.raises(ValueError):
+            dashboard_service.get_report_data('publications', page=page, limit=limit)
+
+        mock_dashboard_repository.get_report_page.assert_not_called()
+
+
+@pytest.mark.unit
+class TestDashboardServiceReportExport:
+    """DashboardService.iter_report_rows() unit tests"""
+
+    def test_export_streams_all_rows_with_column_list(self, dashboard_service, mock_dashboard_repository):
+        """
+        Given: Research report export with a college filter
+        When: iter_report_rows is called
+        Then: Should return the column list and the cursor iterator without the college filter
+        """
+        rows = iter([{'id': 1}])
+        mock_dashboard_repository.get_row_columns.return_value = ['id', 'year', 'department']
+        mock_dashboard_repository.iter_rows.return_value = rows
+
+        columns, result = dashboard_service.iter_report_rows('research', year=2024, college='공과대학')
+
+        assert columns == ['id', 'year', 'department']
+        assert result is rows
+        mock_dashboard_repository.iter_rows.assert_called_once_with(
+            'research', chunk_size=2000, year=2024, college=None, department=None, fields=None,
+        )
+
+    def test_invalid_report_type_raises_value_error(self, dashboard_service, mock_dashboard_repository):
+        """
+        Given: Unknown report type
+        When: iter_report_rows is called
+        Then: Should raise ValueError before querying
+        """
+        with pytest.raises(ValueError):
+            dashboard_service.iter_report_rows('unknown')
+
+        mock_dashboard_repository.iter_rows.assert_not_called()
+
+
+@pytest.mark.unit
+class TestDashboardServiceChanges:
+    """DashboardService.get_changes() unit tests"""
+
+    def test_returns_repository_delta_with_request_echo(self, dashboard_service, mock_dashboard_repository):
+        """
+        Given: Repository delta for publications since version 3
+        When: get_changes is called
+        Then: Should return the delta with the requested type and since
+        """
+        mock_dashboard_repository.get_changes.return_value = {
+            'version': 5, 'reset': False, 'added': [{'row_key': 'a:1', 'id': 10}], 'removed': ['b:1'],
+        }
+
+        result = dashboard_service.get_changes('publication', since=3)
+
+        mock_dashboard_repository.get_changes.assert_called_once_with('publication', 3)
+        assert result == {
+            'type': 'publication', 'since': 3, 'version': 5, 'reset': False,
+            'added': [{'row_key': 'a:1', 'id': 10}], 'removed': ['b:1'],
+        }
+
+    def test_previous_version_delta_is_not_served_stale(self, dashboard_service, mock_dashboard_repository):
+        """
+        Given: A cached delta for version 4 and a dataset that just changed to version 5
+        When: The same since is requested
+        Then: Should compute the version 5 delta instead of serving the previous one
+        """
+        from django.utils import timezone
+        mock_dashboard_repository.get_dataset_versions.side_effect = lambda data_types: {'publication': (4, timezone.now())}
+        mock_dashboard_repository.get_changes.return_value = {'version': 4, 'reset': False, 'added': [], 'removed': []}
+        dashboard_service.get_changes('publication', since=4)
+
+        mock_dashboard_repository.get_dataset_versions.side_effect = lambda data_types: {'publication': (5, timezone.now())}
+        mock_dashboard_repository.get_changes.return_value = {'version': 5, 'reset': False, 'added': [], 'removed': ['b:1']}
+        result = dashboard_service.get_changes('publication', since=4)
+
+        assert result['version'] == 5
+
+    @pytest.mark.parametrize('data_type,since', [('unknown', 0), ('student', -1)])
+    def test_invalid_request_raises_value_error(self, dashboard_service, mock_dashboard_repository, data_type, since):
+        """
+        Given: Unknown data type or negative since
+        When: get_changes is called
+        Then: Should raise ValueError without querying
+        """
+        with pytest.raises(ValueError):
+            dashboard_service.get_changes(data_type, since=since)
+
+        mock_dashboard_repository.get_changes.assert_not_called()
+
+
+@pytest.mark.unit
+class TestDashboardServiceBootstrap:
+    """DashboardService.get_bootstrap_data() unit tests"""
+
+    @pytest.fixture(autouse=True)
+    def sequential(self):
+        with patch('apps.dashboard.services.BOOTSTRAP_MAX_WORKERS', 1):
+            yield
+
+    def test_bootstrap_sections_match_individual_endpoints(self, dashboard_service, repository_rows):
+        """
+        Given: Repository results for every section
+        When: Bootstrap data is requested for 2023
+        Then: Each section should equal the response of its standalone service call
+        """
+        result = dashboard_service.get_bootstrap_data(year=2023)
+
+        assert result == {
+            'summary': dashboard_service.get_summary(year=2023),
+            'kpi': dashboard_service.get_kpi_data(year=2023),
+            'publications': dashboard_service.get_publication_data(year=2023),
+            'research': dashboard_service.get_research_data(year=2023),
+            'students': dashboard_service.get_student_data(year=2023),
+            'filters': dashboard_service.get_available_filters(),
+        }
+
+    def test_bootstrap_reuses_cached_aggregates(self, dashboard_service, repository_rows):
+        """
+        Given: Summary and publication trends already computed by their endpoints
+        When: Bootstrap data is requested with the same filters
+        Then: Should serve those aggregates from the result cache instead of recomputing them
+        """
+        dashboard_service.get_summary(college='공과대학')
+        dashboard_service.get_publication_data(college='공과대학')
+
+        dashboard_service.get_bootstrap_data(college='공과대학')
+
+        repository_rows.get_summary_statistics.assert_called_once_with(
+            year=None, semester=None, college='공과대학',
+        )
+        repository_rows.get_publication_trends.assert_called_once_with(
+            college='공과대학', department=None,
+        )
+
+    def test_bootstrap_runs_section_queries_concurrently(self, dashboard_service, repository_rows):
+        """
+        Given: A thread pool and three aggregates that only finish when all of them have started
+        When: Bootstrap data is requested
+        Then: Should run the aggregates of different sections at the same time
+        """
+        barrier = threading.Barrier(3, timeout=5)
+
+        def arrive(result):
+            def compute(**kwargs):
+                barrier.wait()
+                return result
+            return compute
+
+        repository_rows.get_publication_trends.side_effect = arrive([])
+        repository_rows.get_research_by_department.side_effect = arrive([])
+        repository_rows.get_student_statistics.side_effect = arrive({})
+
+        with patch('apps.dashboard.services.BOOTSTRAP_MAX_WORKERS', 4):
+            result = dashboard_service.get_bootstrap_data(year=2023)
+
+        assert result['publications']['trends'] == []
+        assert result['students']['statistics'] == {}
+
+
+@pytest.mark.unit
+class TestDashboardServiceResultCache:
+    """Version-keyed result cache and warm-up"""
+
+    def test_summary_is_cached_per_dataset_version(self, dashboard_service, mock_dashboard_repository):
+        """
+        Given: Summary statistics for version 1
+        When: Summary is requested twice, then again after the versions change
+        Then: Should compute once per version
+        """
+        mock_dashboard_repository.get_summary_statistics.return_value = {'total_students': 3}
+
+        dashboard_service.get_summary(year=2024)
+        result = dashboard_service.get_summary(year=2024)
+
+        assert result['summary'] == {'total_students': 3}
+        assert mock_dashboard_repository.get_summary_statistics.call_count == 1
+
+        mock_dashboard_repository.get_dataset_versions.side_effect = lambda data_types: {
+            data_type: (2, None) for data_type in data_types
+        }
+        dashboard_service.get_summary(year=2024)
+
+        assert mock_dashboard_repository.get_summary_statistics.call_count == 2
+
+    def test_filters_are_recomputed_when_any_data_type_changes(self, dashboard_service, mock_dashboard_repository):
+        """
+        Given: Filter options cached for the current dataset versions
+        When: Filters are requested again, then after only the KPI version changes
+        Then: Should read the dimension table once per combination of versions
+        """
+        mock_dashboard_repository.get_available_filters.return_value = {'years': [2024]}
+
+        dashboard_service.get_available_filters()
+        result = dashboard_service.get_available_filters()
+
+        assert result == {'years': [2024]}
+        assert mock_dashboard_repository.get_available_filters.call_count == 1
+        mock_dashboard_repository.get_dataset_versions.assert_called_with(
+            ('kpi', 'publication', 'research', 'student')
+        )
+
+        mock_dashboard_repository.get_dataset_versions.side_effect = lambda data_types: {
+            data_type: (2 if data_type == 'kpi' else 1, None) for data_type in data_types
+        }
+        dashboard_service.get_available_filters()
+
+        assert mock_dashboard_repository.get_available_filters.call_count == 2
+
+    def test_warm_up_precomputes_summary_filters_and_kpi(self, dashboard_service, mock_dashboard_repository):
+        """
+        Given: Filters with two years and one college
+        When: warm_up() runs and the same responses are requested afterwards
+        Then: Should compute summary per year, KPI per college and serve later requests from cache
+        """
+        mock_dashboard_repository.get_available_filters.return_value = {
+            'years': [2024, 2023],
+            'colleges': ['공과대학'],
+        }
+        mock_dashboard_repository.get_summary_statistics.return_value = {}
+        mock_dashboard_repository.get_kpi_data.return_value = []
+
+        counts = dashboard_service.warm_up()
+        dashboard_service.get_summary(year=2023)
+        dashboard_service.get_kpi_data(college='공과대학')
+        dashboard_service.get_available_filters()
+
+        assert counts == {'filters': 1, 'summary': 3, 'kpi': 2}
+        assert mock_dashboard_repository.get_summary_statistics.call_count == 3
+        assert mock_dashboard_repository.get_kpi_data.call_count == 2
+        assert mock_dashboard_repository.get_available_filters.call_count == 1
+
+
+@pytest.mark.unit
+class TestDashboardServiceColumnarLayout:
+    """?layout=columnar responses"""
+
+    def test_publications_columnar_layout(self, dashboard_service, mock_dashboard_repository):
+        """
+        Given: Column arrays from the repository and yearly trends
+        When: Publication data is requested with the columnar layout
+        Then: Should return the columns without building rows and reshape the trends
+        """
+        mock_dashboard_repository.get_columns.return_value = {
+            'columns': ['id', 'year'],
+            'data': {'id': [1, 2], 'year': [2023, 2024]},
+        }
+        mock_dashboard_repository.get_publication_trends.return_value = [
+            {'year': 2023, 'count': 1},
+            {'year': 2024, 'count': 1},
+        ]
+
+        result = dashboard_service.get_publication_data(college='공과대학', layout='columnar')
+
+        mock_dashboard_repository.get_columns.assert_called_once_with(
+            'publication', fields=None, year=None, college='공과대학', department=None,
+        )
+        mock_dashboard_repository.get_publication_data.assert_not_called()
+        assert result['count'] == 2
+        assert result['columns'] == ['id', 'year']
+        assert result['data'] == {'id': [1, 2], 'year': [2023, 2024]}
+        assert result['trends'] == {
+            'columns': ['year', 'count'],
+            'data': {'year': [2023, 2024], 'count': [1, 1]},
+        }
+
+    def test_to_columnar_fills_missing_keys(self):
+        """
+        Given: Rows with different keys
+        When: Converted with to_columnar()
+        Then: Should keep first-seen column order and fill gaps with None
+        """
+        from apps.dashboard.services import to_columnar
+
+        result = to_columnar([{'a': 1}, {'a': 2, 'b': 'x'}])
+
+        assert result == {'columns': ['a', 'b'], 'data': {'a': [1, 2], 'b': [None, 'x']}}
+
+
+@pytest.mark.unit
+class TestDashboardServiceAsync:
+    """Async (aget_) variants with concurrent section queries"""
+
+    def test_publication_sections_are_queried_concurrently(self, dashboard_service, mock_dashboard_repository):
+        """
+        Given: Listing and trend queries that each block until the other one has started
+        When: aget_publication_data is awaited
+        Then: Should run both queries at the same time and assemble the usual response
+        """
+        both_started = threading.Barrier(2, timeout=5)
+
+        def publication_rows(**filters):
+            both_started.wait()
+            return [{'id': 1, 'year': 2024}]
+
+        def publication_trends(**filters):
+            both_started.wait()
+            return [{'year': 2024, 'count': 1}]
+
+        mock_dashboard_repository.get_publication_data.side_effect = publication_rows
+        mock_dashboard_repository.get_publication_trends.side_effect = publication_trends
+
+        result = asyncio.run(dashboard_service.aget_publication_data(college='공과대학'))
+
+        assert result == {
+            'count': 1,
+            'data': [{'id': 1, 'year': 2024}],
+            'trends': [{'year': 2024, 'count': 1}],
+            'filters': {'year': None, 'college': '공과대학', 'department': None},
+        }
+
+    def test_async_bootstrap_matches_sync_result(self, dashboard_service, repository_rows):
+        """
+        Given: Repository results for every section
+        When: Bootstrap data is requested through the sync and async variants
+        Then: Should return identical responses
+        """
+        expected = dashboard_service.get_bootstrap_data(year=2023)
+        result = asyncio.run(dashboard_service.aget_bootstrap_data(year=2023))
+
+        assert result == expected
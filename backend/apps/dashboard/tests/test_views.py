@@ -0,0 +1,428 @@
+"""
+Unit tests for dashboard views (conditional GET)
+"""
+import inspect
+import json
+import pytest
+from asgiref.sync import async_to_sync
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.dashboard.views import ChangesView, PublicationsView, ReportExportView, ReportsView
+
+
+@pytest.fixture
+def factory():
+    """DRF request factory fixture"""
+    return APIRequestFactory()
+
+
+@pytest.fixture
+def user():
+    """Authenticated user stub (no database access)"""
+    user = MagicMock()
+    user.is_authenticated = True
+    return user
+
+
+@pytest.fixture
+def mock_service():
+    """Patch DashboardService used by the views"""
+    with patch('apps.dashboard.views.DashboardService') as MockService:
+        service = MockService.return_value
+        service.get_dataset_versions.return_value = {
+            'publication': (3, datetime(2025, 1, 1, tzinfo=timezone.utc)),
+        }
+        service.get_publication_data.return_value = {'count': 0, 'data': [], 'trends': []}
+        # Async views call the aget_ variants; route them to the sync mocks the tests assert on
+        service.aget_publication_data = AsyncMock(side_effect=service.get_publication_data)
+        yield service
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+def _get(factory, user, view, path, **headers):
+    request = factory.get(path, **headers)
+    force_authenticate(request, user=user)
+    response = view(request)
+    if inspect.isawaitable(response):
+        # Async views return a coroutine; run it as Django's handler would
+        response = async_to_sync(_await)(response)
+    return response
+
+
+@pytest.mark.unit
+class TestDashboardConditionalGet:
+    """ETag / Last-Modified support on dashboard views"""
+
+    def test_response_includes_etag_and_last_modified(self, factory, user, mock_service):
+        """
+        Given: Publication dataset at version 3
+        When: Client requests publications without validators
+        Then: Should return 200 with ETag and Last-Modified headers
+        """
+        response = _get(factory, user, PublicationsView.as_view(), '/api/dashboard/publications/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'].startswith('"')
+        assert 'Last-Modified' in response
+        mock_service.get_publication_data.assert_called_once()
+
+    def test_matching_if_none_match_returns_304_without_query(self, factory, user, mock_service):
+        """
+        Given: Client already holds the current ETag
+        When: Client sends If-None-Match with that ETag
+        Then: Should return 304 without calling the data service
+        """
+        view = PublicationsView.as_view()
+        etag = _get(factory, user, view, '/api/dashboard/publications/?year=2023')['ETag']
+        mock_service.get_publication_data.reset_mock()
+
+        response = _get(
+            factory, user, view, '/api/dashboard/publications/?year=2023',
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+        mock_service.get_publication_data.assert_not_called()
+
+    def test_response_includes_cache_control(self, factory, user, mock_service):
+        """
+        Given: Fresh publication data and the default settings (stale serving off)
+        When: Client requests publications
+        Then: Should send private Cache-Control with max-age and no stale-while-revalidate
+        """
+        response = _get(factory, user, PublicationsView.as_view(), '/api/dashboard/publications/')
+
+        cache_control = response['Cache-Control']
+        assert 'private' in cache_control
+        assert 'max-age=0' in cache_control
+        assert 'stale-while-revalidate' not in cache_control
+
+    def test_cache_control_advertises_enabled_stale_window(self, factory, user, mock_service):
+        """
+        Given: DASHBOARD_STALE_WHILE_REVALIDATE enabled in settings
+        When: Client requests publications
+        Then: Should advertise the same stale-while-revalidate window
+        """
+        with patch('apps.dashboard.views.STALE_WHILE_REVALIDATE', 60):
+            response = _get(factory, user, PublicationsView.as_view(), '/api/dashboard/publications/')
+
+        assert 'stale-while-revalidate=60' in response['Cache-Control']
+
+    def test_stale_result_is_sent_without_validators(self, factory, user, mock_service):
+        """
+        Given: The service served a previous-version result while revalidating
+        When: Client requests publications
+        Then: Should send no-cache and omit ETag/Last-Modified
+        """
+        from apps.dashboard import cache as dashboard_cache
+
+        def serve_stale(**kwargs):
+            dashboard_cache._mark_stale()
+            return {'count': 0, 'data': [], 'trends': []}
+
+        mock_service.get_publication_data.side_effect = serve_stale
+
+        response = _get(factory, user, PublicationsView.as_view(), '/api/dashboard/publications/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'no-cache' in response['Cache-Control']
+        assert 'ETag' not in response
+        assert 'Last-Modified' not in response
+
+    def test_etag_changes_with_filters_and_version(self, factory, user, mock_service):
+        """
+        Given: Same endpoint requested with different filters or dataset versions
+        When: ETags are compared
+        Then: Each combination should produce a different ETag
+        """
+        view = PublicationsView.as_view()
+        etag_2023 = _get(factory, user, view, '/api/dashboard/publications/?year=2023')['ETag']
+        etag_2024 = _get(factory, user, view, '/api/dashboard/publications/?year=2024')['ETag']
+
+        mock_service.get_dataset_versions.return_value = {
+            'publication': (4, datetime(2025, 1, 2, tzinfo=timezone.utc)),
+        }
+        etag_2023_v4 = _get(factory, user, view, '/api/dashboard/publications/?year=2023')['ETag']
+
+        assert len({etag_2023, etag_2024, etag_2023_v4}) == 3
+
+    def test_etag_is_keyed_by_negotiated_format(self, factory, user, mock_service):
+        """
+        Given: Same query requested as JSON and as NDJSON via the Accept header
+        When: ETags and Vary headers are compared
+        Then: Each format should get its own ETag and responses should vary on Accept
+        """
+        mock_service.iter_data_rows.return_value = iter([])
+        view = PublicationsView.as_view()
+        path = '/api/dashboard/publications/?year=2023'
+
+        json_response = _get(factory, user, view, path, HTTP_ACCEPT='application/json')
+        ndjson_response = _get(factory, user, view, path, HTTP_ACCEPT='application/x-ndjson')
+
+        assert ndjson_response['Content-Type'] == 'application/x-ndjson'
+        assert json_response['ETag'] != ndjson_response['ETag']
+        assert 'Accept' in json_response['Vary']
+        assert 'Accept' in ndjson_response['Vary']
+
+    def test_invalid_report_type_skips_validators(self, factory, user, mock_service):
+        """
+        Given: Unknown report type
+        When: Client requests the report
+        Then: Should return 400 without ETag
+        """
+        mock_service.get_report_data.side_effect = ValueError('Invalid report type: unknown')
+
+        request = factory.get('/api/dashboard/reports/unknown/')
+        force_authenticate(request, user=user)
+        response = ReportsView.as_view()(request, report_type='unknown')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'ETag' not in response
+        mock_service.get_dataset_versions.assert_not_called()
+
+    @pytest.mark.parametrize('query', ['limit=0', 'limit=-1', 'page=0', 'page=-3', 'limit=abc', 'limit=100000'])
+    def test_invalid_pagination_returns_400(self, factory, user, mock_service, query):
+        """
+        Given: A zero, negative, non-numeric or oversized page/limit
+        When: Client requests the report
+        Then: Should return 400 without calling the service
+        """
+        request = factory.get(f'/api/dashboard/reports/publications/?{query}')
+        force_authenticate(request, user=user)
+        response = ReportsView.as_view()(request, report_type='publications')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_service.get_report_data.assert_not_called()
+
+
+@pytest.mark.unit
+class TestDashboardLayoutParameter:
+    """?layout= parameter handling"""
+
+    def test_columnar_layout_is_passed_to_service(self, factory, user, mock_service):
+        """
+        Given: Client asks for the columnar layout
+        When: Publications are requested
+        Then: Should pass layout='columnar' to the service
+        """
+        _get(factory, user, PublicationsView.as_view(), '/api/dashboard/publications/?layout=columnar')
+
+        assert mock_service.get_publication_data.call_args.kwargs['layout'] == 'columnar'
+
+    def test_unknown_layout_returns_400(self, factory, user, mock_service):
+        """
+        Given: Unknown layout value
+        When: Publications are requested
+        Then: Should return 400 without querying data
+        """
+        response = _get(factory, user, PublicationsView.as_view(), '/api/dashboard/publications/?layout=wide')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_service.get_publication_data.assert_not_called()
+
+
+@pytest.mark.unit
+class TestDashboardNDJSONStreaming:
+    """?format=ndjson streaming on dashboard list views"""
+
+    def test_ndjson_format_streams_rows(self, factory, user, mock_service):
+        """
+        Given: Publication rows produced by a server-side cursor
+        When: Client requests ?format=ndjson
+        Then: Should stream one JSON document per line without building the list payload
+        """
+        mock_service.iter_data_rows.return_value = iter([
+            {'id': 1, 'year': 2023, '논문ID': 'PUB-1'},
+            {'id': 2, 'year': 2023, '논문ID': 'PUB-2'},
+        ])
+
+        response = _get(
+            factory, user, PublicationsView.as_view(),
+            '/api/dashboard/publications/?format=ndjson&year=2023',
+        )
+
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert [json.loads(line)['id'] for line in lines] == [1, 2]
+        mock_service.iter_data_rows.assert_called_once_with(
+            'publication', year=2023, college=None, department=None, fields=None,
+        )
+        mock_service.get_publication_data.assert_not_called()
+
+    def test_fields_parameter_is_passed_as_projection(self, factory, user, mock_service):
+        """
+        Given: Client asks only for the fields a chart needs
+        When: Client requests ?fields=year,department,Impact_Factor
+        Then: Should pass the de-duplicated field list to the service
+        """
+        mock_service.iter_data_rows.return_value = iter([])
+
+        _get(
+            factory, user, PublicationsView.as_view(),
+            '/api/dashboard/publications/?format=ndjson&fields=year, department,Impact_Factor,year',
+        )
+
+        _, kwargs = mock_service.iter_data_rows.call_args
+        assert kwargs['fields'] == ['year', 'department', 'Impact_Factor']
+
+
+@pytest.mark.unit
+class TestDashboardArrowStreaming:
+    """?format=arrow streaming on dashboard list and report views"""
+
+    def test_arrow_format_streams_record_batches(self, factory, user, mock_service):
+        """
+        Given: Publication rows where a metadata key only appears in later rows
+        When: Client requests ?format=arrow
+        Then: Should stream an Arrow IPC stream with the service's column types as schema
+        """
+        pa = pytest.importorskip('pyarrow')
+        mock_service.iter_data_rows.return_value = iter([
+            {'id': 1, 'year': 2023, '논문ID': 'PUB-1'},
+            {'id': 2, 'year': 2023, '논문ID': 'PUB-2', 'Impact_Factor': 2.5},
+        ])
+        mock_service.get_row_types.return_value = {
+            'id': 'integer', 'year': 'integer', '논문ID': 'string', 'Impact_Factor': 'number',
+        }
+
+        response = _get(
+            factory, user, PublicationsView.as_view(),
+            '/api/dashboard/publications/?format=arrow&year=2023',
+        )
+
+        table = pa.ipc.open_stream(b''.join(response.streaming_content)).read_all()
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/vnd.apache.arrow.stream'
+        assert table.column_names == ['id', 'year', '논문ID', 'Impact_Factor']
+        assert table.column('id').to_pylist() == [1, 2]
+        assert table.schema.field('Impact_Factor').type == pa.float64()
+        mock_service.get_row_types.assert_called_once_with(
+            'publication', year=2023, college=None, department=None, fields=None,
+        )
+        mock_service.get_publication_data.assert_not_called()
+
+    def test_report_streams_all_rows_without_pagination(self, factory, user, mock_service):
+        """
+        Given: Research report requested as an Arrow stream with a college filter
+        When: Client requests ?format=arrow&page=2
+        Then: Should stream the research rows ignoring pagination and the college filter
+        """
+        pytest.importorskip('pyarrow')
+        mock_service.iter_data_rows.return_value = iter([{'id': 1, 'year': 2024}])
+        mock_service.get_row_types.return_value = {'id': 'integer', 'year': 'integer'}
+
+        request = factory.get('/api/dashboard/reports/research/?format=arrow&college=공과대학&page=2')
+        force_authenticate(request, user=user)
+        response = ReportsView.as_view()(request, report_type='research')
+        b''.join(response.streaming_content)
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_service.iter_data_rows.assert_called_once_with(
+            'research', year=None, college=None, department=None, fields=None,
+        )
+        mock_service.get_report_data.assert_not_called()
+
+
+@pytest.mark.unit
+class TestReportExport:
+    """GET /api/dashboard/reports/{report_type}/export/"""
+
+    def _export(self, factory, user, path, report_type='publications'):
+        request = factory.get(path)
+        force_authenticate(request, user=user)
+        return ReportExportView.as_view()(request, report_type=report_type)
+
+    def test_csv_export_streams_rows(self, factory, user, mock_service):
+        """
+        Given: Publication report rows from a server-side cursor
+        When: Client requests the export without a format
+        Then: Should stream a CSV attachment with the service's column header
+        """
+        mock_service.iter_report_rows.return_value = (
+            ['id', 'year', '논문ID'],
+            iter([{'id': 1, 'year': 2023, '논문ID': 'PUB-1'}, {'id': 2, 'year': None}]),
+        )
+
+        response = self._export(factory, user, '/api/dashboard/reports/publications/export/?year=2023')
+
+        content = b''.join(response.streaming_content).decode('utf-8-sig')
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'text/csv; charset=utf-8'
+        assert response['Content-Disposition'] == 'attachment; filename="publications-2023.csv"'
+        assert content.splitlines() == ['id,year,논문ID', '1,2023,PUB-1', '2,,']
+        mock_service.iter_report_rows.assert_called_once_with(
+            report_type='publications', year=2023, college=None, department=None, fields=None,
+        )
+
+    def test_xlsx_export_returns_workbook(self, factory, user, mock_service):
+        """
+        Given: Publication report rows
+        When: Client requests ?format=xlsx
+        Then: Should return a workbook attachment with a header row and the data rows
+        """
+        openpyxl = pytest.importorskip('openpyxl')
+        import io
+        mock_service.iter_report_rows.return_value = (
+            ['id', '논문ID'],
+            iter([{'id': 1, '논문ID': 'PUB-1'}]),
+        )
+
+        response = self._export(factory, user, '/api/dashboard/reports/publications/export/?format=xlsx')
+
+        workbook = openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)))
+        assert response.status_code == status.HTTP_200_OK
+        assert 'filename="publications.xlsx"' in response['Content-Disposition']
+        assert list(workbook['publications'].values) == [('id', '논문ID'), (1, 'PUB-1')]
+
+    def test_invalid_report_type_returns_400(self, factory, user, mock_service):
+        """
+        Given: Unknown report type
+        When: Client requests the export
+        Then: Should return 400
+        """
+        mock_service.iter_report_rows.side_effect = ValueError('Invalid report type: unknown')
+
+        response = self._export(factory, user, '/api/dashboard/reports/unknown/export/', report_type='unknown')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.unit
+class TestChangesView:
+    """GET /api/dashboard/changes/"""
+
+    def test_passes_type_and_since_to_service(self, factory, user, mock_service):
+        """
+        Given: Client holding publication version 3
+        When: Client requests changes since 3
+        Then: Should return the service delta with an ETag for the publication version
+        """
+        mock_service.get_changes.return_value = {
+            'type': 'publication', 'since': 3, 'version': 3, 'reset': False, 'added': [], 'removed': [],
+        }
+
+        response = _get(factory, user, ChangesView.as_view(), '/api/dashboard/changes/?type=publication&since=3')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'ETag' in response
+        mock_service.get_changes.assert_called_once_with('publication', since=3)
+        mock_service.get_dataset_versions.assert_called_once_with(('publication',))
+
+    def test_invalid_since_returns_400(self, factory, user, mock_service):
+        """
+        Given: Non-numeric since
+        When: Client requests changes
+        Then: Should return 400 without calling the service
+        """
+        response = _get(factory, user, ChangesView.as_view(), '/api/dashboard/changes/?type=publication&since=abc')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_service.get_changes.assert_not_called()
@@ -9,7 +9,10 @@ from .views import (
     ResearchView,
     StudentsView,
     FiltersView,
+    BootstrapView,
     ReportsView,
+    ReportExportView,
+    ChangesView,
 )
 
 app_name = 'dashboard'
@@ -21,5 +24,8 @@ urlpatterns = [
     path('research/', ResearchView.as_view(), name='research'),
     path('students/', StudentsView.as_view(), name='students'),
     path('filters/', FiltersView.as_view(), name='filters'),
+    path('bootstrap/', BootstrapView.as_view(), name='bootstrap'),
     path('reports/<str:report_type>/', ReportsView.as_view(), name='reports'),
+    path('reports/<str:report_type>/export/', ReportExportView.as_view(), name='reports-export'),
+    path('changes/', ChangesView.as_view(), name='changes'),
 ]
@@ -1,14 +1,227 @@
 """
 Views for dashboard.
 """
+import calendar
+import hashlib
+import tempfile
+from typing import List, Optional, Tuple
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from .services import DashboardService
+from rest_framework.settings import api_settings
+from apps.core.renderers import ArrowStreamRenderer, CSVRenderer, NDJSONRenderer, XLSXRenderer
+from apps.core.views import AsyncAPIView
+from .cache import STALE_WHILE_REVALIDATE, track_stale_results
+from .services import (
+    ALL_DATA_TYPES,
+    LAYOUT_ROWS,
+    LAYOUTS,
+    REPORT_IGNORES_COLLEGE,
+    REPORT_MAX_PAGE_SIZE,
+    REPORT_TYPE_MAPPING,
+    STREAM_CHUNK_SIZE,
+    SUMMARY_DATA_TYPES,
+    DashboardService,
+)
 
+MAX_PROJECTED_FIELDS = 50
 
-class SummaryView(APIView):
+# Cache-Control for dashboard responses (private unless proxies may share them)
+HTTP_MAX_AGE = getattr(settings, 'DASHBOARD_HTTP_MAX_AGE', 0)
+
+CACHE_CONTROL_PUBLIC = getattr(settings, 'DASHBOARD_CACHE_CONTROL_PUBLIC', False)
+
+
+def parse_fields(request) -> Optional[List[str]]:
+    """
+    ?fields=year,department,Impact_Factor 파라미터 파싱.
+    
+    Returns:
+        List[str] or None: 요청된 필드 목록 (파라미터가 없으면 None)
+    """
+    value = request.query_params.get('fields')
+    if not value:
+        return None
+    
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    return list(dict.fromkeys(fields))[:MAX_PROJECTED_FIELDS] or None
+
+
+def parse_pagination(request) -> Optional[Tuple[int, int]]:
+    """
+    ?page=&limit= 파라미터 파싱.
+    
+    Returns:
+        Tuple[int, int] or None: (page, limit) (정수가 아니거나 범위를 벗어나면 None)
+    """
+    try:
+        page = int(request.query_params.get('page', 1))
+        limit = int(request.query_params.get('limit', 20))
+    except ValueError:
+        return None
+    
+    if page < 1 or not 1 <= limit <= REPORT_MAX_PAGE_SIZE:
+        return None
+    return page, limit
+
+
+def parse_layout(request) -> Optional[str]:
+    """
+    ?layout=rows|columnar 파라미터 파싱.
+    
+    Returns:
+        str or None: 응답 레이아웃 (기본 rows, 알 수 없는 값이면 None)
+    """
+    layout = request.query_params.get('layout', LAYOUT_ROWS)
+    return layout if layout in LAYOUTS else None
+
+
+def invalid_layout_response() -> Response:
+    """400 response for an unknown ?layout= value."""
+    return Response(
+        {'error': f"Invalid layout parameter (expected one of: {', '.join(LAYOUTS)})"},
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+class DatasetConditionalMixin:
+    """
+    Conditional GET (ETag / Last-Modified) 지원.
+    
+    ETag는 응답이 의존하는 데이터 타입의 데이터셋 버전, 쿼리 파라미터와 협상된 응답 형식으로
+    계산되며, If-None-Match가 일치하면 리포지토리 조회 없이 304를 반환한다. 응답에는
+    Cache-Control: max-age, stale-while-revalidate와 Vary: Accept가 함께 설정된다.
+    """
+
+    dataset_types: Tuple[str, ...] = ()
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.stale_tracker = track_stale_results()
+
+    def get_dataset_types(self, request, *args, **kwargs) -> Tuple[str, ...]:
+        """Data types the response depends on."""
+        return self.dataset_types
+
+    def get_not_modified_response(self, request, *args, **kwargs):
+        """
+        Compute validators and return a 304 response if the client copy is current.
+        
+        Returns:
+            HttpResponseNotModified or None
+        """
+        self.etag = None
+        self.last_modified = None
+        
+        data_types = self.get_dataset_types(request, *args, **kwargs)
+        if not data_types:
+            return None
+        
+        versions = DashboardService().get_dataset_versions(data_types)
+        
+        # JSON/NDJSON/Arrow bodies of the same query differ; Accept selects them without a query param
+        renderer = getattr(request, 'accepted_renderer', None)
+        key = '|'.join([
+            type(self).__name__,
+            request.path,
+            renderer.format if renderer is not None else '',
+            repr(sorted(request.query_params.lists())),
+            repr(sorted((data_type, version) for data_type, (version, _) in versions.items())),
+        ])
+        self.etag = quote_etag(hashlib.sha256(key.encode('utf-8')).hexdigest()[:40])
+        
+        timestamps = [updated_at for _, updated_at in versions.values() if updated_at]
+        if timestamps:
+            self.last_modified = calendar.timegm(max(timestamps).utctimetuple())
+        
+        return get_conditional_response(
+            request,
+            etag=self.etag,
+            last_modified=self.last_modified,
+        )
+
+    async def aget_not_modified_response(self, request, *args, **kwargs):
+        """get_not_modified_response() for async handlers (the version lookup runs in a thread)."""
+        return await sync_to_async(self.get_not_modified_response)(request, *args, **kwargs)
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        
+        if response.status_code not in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            return response
+        
+        # The body format is negotiated from Accept (JSON, NDJSON, Arrow, ...)
+        patch_vary_headers(response, ['Accept'])
+        
+        tracker = getattr(self, 'stale_tracker', None)
+        if tracker is not None and tracker.stale:
+            # Previous-version result: no validators, so the client does not keep it as current
+            patch_cache_control(response, no_cache=True)
+            return response
+        
+        if getattr(self, 'etag', None):
+            response['ETag'] = self.etag
+        if getattr(self, 'last_modified', None):
+            response['Last-Modified'] = http_date(self.last_modified)
+        
+        cache_control = {'max_age': HTTP_MAX_AGE}
+        cache_control['public' if CACHE_CONTROL_PUBLIC else 'private'] = True
+        if STALE_WHILE_REVALIDATE:
+            cache_control['stale_while_revalidate'] = STALE_WHILE_REVALIDATE
+        patch_cache_control(response, **cache_control)
+        
+        return response
+
+
+class RowStreamMixin:
+    """
+    리스트 행 스트리밍 지원.
+    
+    - NDJSON: ?format=ndjson 또는 Accept: application/x-ndjson
+    - Arrow IPC: ?format=arrow 또는 Accept: application/vnd.apache.arrow.stream (pyarrow 설치 시)
+    
+    행을 서버 사이드 커서에서 생성되는 대로 내보내므로 응답 크기와 무관하게
+    첫 바이트까지의 시간과 워커 메모리가 일정하다.
+    """
+
+    renderer_classes = [
+        *api_settings.DEFAULT_RENDERER_CLASSES,
+        NDJSONRenderer,
+        *([ArrowStreamRenderer] if ArrowStreamRenderer.available else []),
+    ]
+    
+    stream_formats = (NDJSONRenderer.format, ArrowStreamRenderer.format)
+
+    def is_streaming(self, request) -> bool:
+        """Whether the client negotiated a streaming format."""
+        renderer = getattr(request, 'accepted_renderer', None)
+        return renderer is not None and renderer.format in self.stream_formats
+    
+    def stream_rows(self, request, service, data_type: str, **filters) -> StreamingHttpResponse:
+        """Stream the filtered rows of data_type in the negotiated format."""
+        rows = service.iter_data_rows(data_type, **filters)
+        
+        if request.accepted_renderer.format == ArrowStreamRenderer.format:
+            # Arrow needs the schema up front; metadata keys and value types vary between rows
+            types = service.get_row_types(data_type, **filters)
+            return StreamingHttpResponse(
+                ArrowStreamRenderer.stream(rows, types=types, batch_size=STREAM_CHUNK_SIZE),
+                content_type=ArrowStreamRenderer.media_type,
+            )
+        
+        return StreamingHttpResponse(
+            (NDJSONRenderer.render_line(row) for row in rows),
+            content_type=NDJSONRenderer.media_type,
+        )
+
+
+class SummaryView(DatasetConditionalMixin, APIView):
     """
     GET /api/dashboard/summary/
     
@@ -16,9 +229,14 @@ class SummaryView(APIView):
     """
 
     permission_classes = [IsAuthenticated]
+    dataset_types = SUMMARY_DATA_TYPES
 
     def get(self, request):
         """Get dashboard summary."""
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        
         # Query parameters
         year = request.query_params.get('year')
         semester = request.query_params.get('semester', 'all')
@@ -45,7 +263,7 @@ class SummaryView(APIView):
         return Response(result, status=status.HTTP_200_OK)
 
 
-class KPIView(APIView):
+class KPIView(DatasetConditionalMixin, RowStreamMixin, APIView):
     """
     GET /api/dashboard/kpi/
     
@@ -53,14 +271,23 @@ class KPIView(APIView):
     """
 
     permission_classes = [IsAuthenticated]
+    dataset_types = ('kpi',)
 
     def get(self, request):
         """Get KPI data."""
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        
         # Query parameters
         year = request.query_params.get('year')
         semester = request.query_params.get('semester', 'all')
         college = request.query_params.get('college', 'all')
         department = request.query_params.get('department')
+        fields = parse_fields(request)
+        layout = parse_layout(request)
+        if layout is None:
+            return invalid_layout_response()
         
         if year:
             try:
@@ -70,17 +297,31 @@ class KPIView(APIView):
         
         # Call service
         service = DashboardService()
+        if self.is_streaming(request):
+            return self.stream_rows(
+                request,
+                service,
+                'kpi',
+                year=year,
+                semester=semester if semester != 'all' else None,
+                college=college if college != 'all' else None,
+                department=department,
+                fields=fields,
+            )
+        
         result = service.get_kpi_data(
             year=year,
             semester=semester if semester != 'all' else None,
             college=college if college != 'all' else None,
             department=department,
+            fields=fields,
+            layout=layout,
         )
         
         return Response(result, status=status.HTTP_200_OK)
 
 
-class PublicationsView(APIView):
+class PublicationsView(DatasetConditionalMixin, RowStreamMixin, AsyncAPIView):
     """
     GET /api/dashboard/publications/
     
@@ -88,13 +329,22 @@ class PublicationsView(APIView):
     """
 
     permission_classes = [IsAuthenticated]
+    dataset_types = ('publication',)
 
-    def get(self, request):
+    async def get(self, request):
         """Get publications data."""
+        not_modified = await self.aget_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        
         # Query parameters
         year = request.query_params.get('year')
         college = request.query_params.get('college', 'all')
         department = request.query_params.get('department')
+        fields = parse_fields(request)
+        layout = parse_layout(request)
+        if layout is None:
+            return invalid_layout_response()
         
         if year:
             try:
@@ -104,16 +354,29 @@ class PublicationsView(APIView):
         
         # Call service
         service = DashboardService()
-        result = service.get_publication_data(
+        if self.is_streaming(request):
+            return await sync_to_async(self.stream_rows)(
+                request,
+                service,
+                'publication',
+                year=year,
+                college=college if college != 'all' else None,
+                department=department,
+                fields=fields,
+            )
+        
+        result = await service.aget_publication_data(
             year=year,
             college=college if college != 'all' else None,
             department=department,
+            fields=fields,
+            layout=layout,
         )
         
         return Response(result, status=status.HTTP_200_OK)
 
 
-class ResearchView(APIView):
+class ResearchView(DatasetConditionalMixin, RowStreamMixin, AsyncAPIView):
     """
     GET /api/dashboard/research/
     
@@ -121,12 +384,21 @@ class ResearchView(APIView):
     """
 
     permission_classes = [IsAuthenticated]
+    dataset_types = ('research',)
 
-    def get(self, request):
+    async def get(self, request):
         """Get research data."""
+        not_modified = await self.aget_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        
         # Query parameters
         year = request.query_params.get('year')
         department = request.query_params.get('department')
+        fields = parse_fields(request)
+        layout = parse_layout(request)
+        if layout is None:
+            return invalid_layout_response()
         
         if year:
             try:
@@ -136,15 +408,27 @@ class ResearchView(APIView):
         
         # Call service
         service = DashboardService()
-        result = service.get_research_data(
+        if self.is_streaming(request):
+            return await sync_to_async(self.stream_rows)(
+                request,
+                service,
+                'research',
+                year=year,
+                department=department,
+                fields=fields,
+            )
+        
+        result = await service.aget_research_data(
             year=year,
             department=department,
+            fields=fields,
+            layout=layout,
         )
         
         return Response(result, status=status.HTTP_200_OK)
 
 
-class StudentsView(APIView):
+class StudentsView(DatasetConditionalMixin, RowStreamMixin, AsyncAPIView):
     """
     GET /api/dashboard/students/
     
@@ -152,13 +436,22 @@ class StudentsView(APIView):
     """
 
     permission_classes = [IsAuthenticated]
+    dataset_types = ('student',)
 
-    def get(self, request):
+    async def get(self, request):
         """Get students data."""
+        not_modified = await self.aget_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        
         # Query parameters
         year = request.query_params.get('year')
         college = request.query_params.get('college', 'all')
         department = request.query_params.get('department')
+        fields = parse_fields(request)
+        layout = parse_layout(request)
+        if layout is None:
+            return invalid_layout_response()
         
         if year:
             try:
@@ -168,16 +461,29 @@ class StudentsView(APIView):
         
         # Call service
         service = DashboardService()
-        result = service.get_student_data(
+        if self.is_streaming(request):
+            return await sync_to_async(self.stream_rows)(
+                request,
+                service,
+                'student',
+                year=year,
+                college=college if college != 'all' else None,
+                department=department,
+                fields=fields,
+            )
+        
+        result = await service.aget_student_data(
             year=year,
             college=college if college != 'all' else None,
             department=department,
+            fields=fields,
+            layout=layout,
         )
         
         return Response(result, status=status.HTTP_200_OK)
 
 
-class FiltersView(APIView):
+class FiltersView(DatasetConditionalMixin, APIView):
     """
     GET /api/dashboard/filters/
     
@@ -185,32 +491,96 @@ class FiltersView(APIView):
     """
 
     permission_classes = [IsAuthenticated]
+    dataset_types = ALL_DATA_TYPES
 
     def get(self, request):
         """Get available filter options."""
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        
         service = DashboardService()
         filters = service.get_available_filters()
         
         return Response(filters, status=status.HTTP_200_OK)
 
 
-class ReportsView(APIView):
+class BootstrapView(DatasetConditionalMixin, AsyncAPIView):
+    """
+    GET /api/dashboard/bootstrap/
+    
+    대시보드 초기 로딩 데이터 일괄 조회 (summary, kpi, publications, research, students, filters)
+    """
+
+    permission_classes = [IsAuthenticated]
+    dataset_types = ALL_DATA_TYPES
+
+    async def get(self, request):
+        """Get all dashboard sections in one round trip."""
+        not_modified = await self.aget_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        
+        # Query parameters
+        year = request.query_params.get('year')
+        semester = request.query_params.get('semester', 'all')
+        college = request.query_params.get('college', 'all')
+        department = request.query_params.get('department')
+        
+        if year:
+            try:
+                year = int(year)
+            except ValueError:
+                return Response(
+                    {'error': 'Invalid year parameter'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        # Call service
+        service = DashboardService()
+        result = await service.aget_bootstrap_data(
+            year=year,
+            semester=semester if semester != 'all' else None,
+            college=college if college != 'all' else None,
+            department=department,
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class ReportsView(DatasetConditionalMixin, RowStreamMixin, APIView):
     """
     GET /api/dashboard/reports/{report_type}/
     
-    상세 리포트 데이터 조회
+    상세 리포트 데이터 조회 (스트리밍 포맷이면 페이지네이션 없이 전체 행)
     """
 
     permission_classes = [IsAuthenticated]
 
+    def get_dataset_types(self, request, report_type=None, *args, **kwargs):
+        data_type = REPORT_TYPE_MAPPING.get(report_type)
+        return (data_type,) if data_type else ()
+
     def get(self, request, report_type):
         """Get detailed report data."""
+        not_modified = self.get_not_modified_response(request, report_type=report_type)
+        if not_modified is not None:
+            return not_modified
+        
         # Query parameters
         year = request.query_params.get('year')
         college = request.query_params.get('college', 'all')
         department = request.query_params.get('department')
-        page = int(request.query_params.get('page', 1))
-        limit = int(request.query_params.get('limit', 20))
+        fields = parse_fields(request)
+        pagination = parse_pagination(request)
+        cursor = request.query_params.get('cursor')
+        
+        if pagination is None:
+            return Response(
+                {'error': f"Invalid page/limit parameter (page >= 1, 1 <= limit <= {REPORT_MAX_PAGE_SIZE})"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        page, limit = pagination
         
         if year:
             try:
@@ -218,6 +588,34 @@ class ReportsView(APIView):
             except ValueError:
                 year = None
         
+        if cursor:
+            try:
+                cursor = int(cursor)
+            except ValueError:
+                return Response(
+                    {'error': 'Invalid cursor parameter'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        else:
+            cursor = None
+        
+        if self.is_streaming(request):
+            data_type = REPORT_TYPE_MAPPING.get(report_type)
+            if not data_type:
+                return Response(
+                    {'error': f"Invalid report type: {report_type}"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            return self.stream_rows(
+                request,
+                DashboardService(),
+                data_type,
+                year=year,
+                college=None if data_type in REPORT_IGNORES_COLLEGE or college == 'all' else college,
+                department=department,
+                fields=fields,
+            )
+        
         try:
             # Call service
             service = DashboardService()
@@ -226,9 +624,133 @@ class ReportsView(APIView):
                 year=year,
                 college=college if college != 'all' else None,
                 department=department,
+                fields=fields,
                 page=page,
                 limit=limit,
+                cursor=cursor,
+            )
+            
+            return Response(result, status=status.HTTP_200_OK)
+            
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+
+class ReportExportView(DatasetConditionalMixin, APIView):
+    """
+    GET /api/dashboard/reports/{report_type}/export/?format=csv|xlsx
+    
+    상세 리포트 전체 행 내보내기 (기본 CSV)
+    
+    - CSV: 서버 사이드 커서에서 읽는 대로 스트리밍
+    - XLSX: write-only 워크북을 임시 파일에 작성한 뒤 파일로 전송
+    
+    어느 포맷이든 리포트 전체를 메모리에 올리지 않는다.
+    """
+    
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [
+        CSVRenderer,
+        *([XLSXRenderer] if XLSXRenderer.available else []),
+    ]
+    
+    def get_dataset_types(self, request, report_type=None, *args, **kwargs):
+        data_type = REPORT_TYPE_MAPPING.get(report_type)
+        return (data_type,) if data_type else ()
+    
+    def get(self, request, report_type):
+        """Export report rows as a file."""
+        not_modified = self.get_not_modified_response(request, report_type=report_type)
+        if not_modified is not None:
+            return not_modified
+        
+        # Query parameters
+        year = request.query_params.get('year')
+        college = request.query_params.get('college', 'all')
+        department = request.query_params.get('department')
+        fields = parse_fields(request)
+        
+        if year:
+            try:
+                year = int(year)
+            except ValueError:
+                year = None
+        
+        try:
+            service = DashboardService()
+            columns, rows = service.iter_report_rows(
+                report_type=report_type,
+                year=year,
+                college=college if college != 'all' else None,
+                department=department,
+                fields=fields,
             )
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        renderer = request.accepted_renderer
+        filename = f"{report_type}{f'-{year}' if year else ''}.{renderer.format}"
+        
+        if renderer.format == XLSXRenderer.format:
+            # The zip container is only complete after the last row, so spool it to disk
+            output = tempfile.TemporaryFile()
+            XLSXRenderer.write(output, rows, columns, title=report_type)
+            output.seek(0)
+            response = FileResponse(output, as_attachment=True, filename=filename)
+            response['Content-Type'] = XLSXRenderer.media_type
+            return response
+        
+        response = StreamingHttpResponse(
+            CSVRenderer.stream(rows, columns),
+            content_type=f'{CSVRenderer.media_type}; charset={CSVRenderer.charset}',
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+class ChangesView(DatasetConditionalMixin, APIView):
+    """
+    GET /api/dashboard/changes/?type=publication&since=<version>
+    
+    since 버전 이후 추가/삭제된 행 조회 (델타 동기화)
+    
+    added 행에는 내용 기반 키(row_key)가 포함되고, removed는 삭제된 row_key 목록이다.
+    reset이 true이면 added가 현재 전체 행이므로 로컬 사본을 교체해야 한다.
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def get_dataset_types(self, request, *args, **kwargs):
+        data_type = request.query_params.get('type')
+        return (data_type,) if data_type in ALL_DATA_TYPES else ()
+    
+    def get(self, request):
+        """Get rows added and removed since a dataset version."""
+        not_modified = self.get_not_modified_response(request)
+        if not_modified is not None:
+            return not_modified
+        
+        # Query parameters
+        data_type = request.query_params.get('type')
+        since = request.query_params.get('since', 0)
+        
+        try:
+            since = int(since)
+        except ValueError:
+            return Response(
+                {'error': 'Invalid since parameter'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            service = DashboardService()
+            result = service.get_changes(data_type, since=since)
             
             return Response(result, status=status.HTTP_200_OK)
             
@@ -0,0 +1,231 @@
+"""
+Server-Sent Events for upload progress and dataset version changes.
+
+A single DataEventHub per process polls on behalf of every open stream:
+dataset versions come from the database (one query per interval however
+many clients are connected) and upload progress of the connected users
+from the cache (see progress.py). Streams are async generators served by
+the ASGI worker (see Procfile), so an idle connection costs a coroutine
+and a small queue instead of a gunicorn worker.
+"""
+import asyncio
+import json
+import logging
+import secrets
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections
+
+from apps.dashboard.repositories import DashboardRepository
+from apps.dashboard.services import ALL_DATA_TYPES
+from .progress import get_progress, progress_key
+
+
+logger = logging.getLogger(__name__)
+
+
+EVENT_DATASET = 'dataset'
+EVENT_UPLOAD = 'upload'
+
+# Seconds between cache reads for upload progress
+EVENTS_POLL_INTERVAL = getattr(settings, 'DATA_EVENTS_POLL_INTERVAL', 0.5)
+
+# Seconds between dataset version queries
+EVENTS_VERSION_INTERVAL = getattr(settings, 'DATA_EVENTS_VERSION_INTERVAL', 2.0)
+
+# Comment line sent when nothing happened for this many seconds (keeps proxies from closing the stream)
+EVENTS_HEARTBEAT_INTERVAL = getattr(settings, 'DATA_EVENTS_HEARTBEAT_INTERVAL', 15)
+
+# Seconds a stream ticket can be redeemed (once) after it is issued
+EVENTS_TICKET_TIMEOUT = getattr(settings, 'DATA_EVENTS_TICKET_TIMEOUT', 30)
+
+# Streams end after this many seconds (or at token expiry); clients reconnect with a new ticket
+EVENTS_MAX_AGE = getattr(settings, 'DATA_EVENTS_MAX_AGE', 30 * 60)
+
+# Reconnect delay advertised to EventSource (milliseconds)
+EVENTS_RETRY_MS = getattr(settings, 'DATA_EVENTS_RETRY_MS', 3000)
+
+# Events buffered per stream; a slow client drops the oldest (every event is a full snapshot)
+EVENTS_QUEUE_SIZE = 16
+
+
+def format_event(event: str, data: Any) -> bytes:
+    """One SSE message (JSON data on a single line)."""
+    payload = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':'))
+    return f'event: {event}\ndata: {payload}\n\n'.encode('utf-8')
+
+
+def _ticket_key(ticket: str) -> str:
+    return f'events_ticket:{ticket}'
+
+
+def issue_stream_ticket(user_id: int) -> str:
+    """
+    Short-lived single-use ticket opening one event stream for the user.
+
+    EventSource cannot send an Authorization header; the ticket keeps the
+    JWT itself out of URLs, proxy logs and browser history.
+    """
+    ticket = secrets.token_urlsafe(32)
+    cache.set(_ticket_key(ticket), user_id, EVENTS_TICKET_TIMEOUT)
+    return ticket
+
+
+def redeem_stream_ticket(ticket: str) -> Optional[int]:
+    """User id of a valid ticket, consuming it (None if unknown, expired or already used)."""
+    key = _ticket_key(ticket)
+    user_id = cache.get(key)
+    # Only the request whose delete removes the key gets the ticket
+    if user_id is None or not cache.delete(key):
+        return None
+    return user_id
+
+
+def _load_versions() -> Dict[str, int]:
+    close_old_connections()
+    try:
+        versions = DashboardRepository().get_dataset_versions(ALL_DATA_TYPES)
+    finally:
+        close_old_connections()
+    return {data_type: version for data_type, (version, _) in versions.items()}
+
+
+def _load_progress(user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    entries = cache.get_many([progress_key(user_id) for user_id in user_ids])
+    return {
+        user_id: entries[progress_key(user_id)]
+        for user_id in user_ids
+        if progress_key(user_id) in entries
+    }
+
+
+def dataset_event(versions: Dict[str, int], changed: List[str]) -> Tuple[str, Dict[str, Any]]:
+    return EVENT_DATASET, {'versions': versions, 'changed': changed}
+
+
+class DataEventHub:
+    """Per-process poller fanning dataset/upload events out to stream queues."""
+
+    def __init__(self):
+        self.subscribers: Dict[asyncio.Queue, int] = {}
+        self.versions: Optional[Dict[str, int]] = None
+        self.progress_seen: Dict[int, float] = {}
+        self.task: Optional[asyncio.Task] = None
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=EVENTS_QUEUE_SIZE)
+        self.subscribers[queue] = user_id
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self.subscribers.pop(queue, None)
+        if not self.subscribers and self.task is not None:
+            self.task.cancel()
+            self.task = None
+            # Nobody was watching; the next stream starts from fresh state
+            self.versions = None
+            self.progress_seen.clear()
+
+    def publish(self, event: Tuple[str, Any], user_id: Optional[int] = None) -> None:
+        """Queue an event for every stream (or only the streams of user_id)."""
+        for queue, subscriber in list(self.subscribers.items()):
+            if user_id is not None and subscriber != user_id:
+                continue
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        versions_at = 0.0
+        while self.subscribers:
+            try:
+                if loop.time() - versions_at >= EVENTS_VERSION_INTERVAL:
+                    versions_at = loop.time()
+                    await self.poll_versions()
+                await self.poll_progress()
+            except Exception as e:
+                logger.warning(f"Data event poll failed: {e}")
+            await asyncio.sleep(EVENTS_POLL_INTERVAL)
+
+    async def poll_versions(self) -> None:
+        # Not thread-sensitive: the hub outlives the request that started it
+        versions = await sync_to_async(_load_versions, thread_sensitive=False)()
+        previous, self.versions = self.versions, versions
+        if previous is None:
+            return
+        changed = [data_type for data_type in versions if versions[data_type] != previous.get(data_type)]
+        if changed:
+            self.publish(dataset_event(versions, changed))
+
+    async def poll_progress(self) -> None:
+        user_ids = sorted(set(self.subscribers.values()))
+        entries = await sync_to_async(_load_progress, thread_sensitive=False)(user_ids)
+        for user_id, state in entries.items():
+            if self.progress_seen.get(user_id) != state['updated_at']:
+                self.progress_seen[user_id] = state['updated_at']
+                self.publish((EVENT_UPLOAD, state), user_id=user_id)
+        for user_id in set(self.progress_seen) - set(user_ids):
+            del self.progress_seen[user_id]
+
+
+_hub: Optional[DataEventHub] = None
+
+
+def get_hub() -> DataEventHub:
+    global _hub
+
+    if _hub is None:
+        _hub = DataEventHub()
+    return _hub
+
+
+async def event_stream(
+    user_id: int,
+    max_age: float = EVENTS_MAX_AGE,
+    hub: Optional[DataEventHub] = None,
+) -> AsyncIterator[bytes]:
+    """
+    SSE body for one client.
+
+    Starts with the current dataset versions and the user's upload progress,
+    then yields 'dataset' and 'upload' events as the hub sees changes, with
+    a heartbeat comment while idle. Ends after max_age seconds.
+    """
+    hub = hub or get_hub()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_age
+    queue = hub.subscribe(user_id)
+    try:
+        yield f'retry: {EVENTS_RETRY_MS}\n\n'.encode('utf-8')
+
+        versions = hub.versions
+        if versions is None:
+            versions = await sync_to_async(_load_versions, thread_sensitive=False)()
+            # Baseline for the hub, so a change right after connecting is still published
+            if hub.versions is None:
+                hub.versions = versions
+        yield format_event(*dataset_event(versions, []))
+
+        progress = await sync_to_async(get_progress, thread_sensitive=False)(user_id)
+        if progress is not None:
+            yield format_event(EVENT_UPLOAD, progress)
+
+        while True:
+            timeout = min(EVENTS_HEARTBEAT_INTERVAL, deadline - loop.time())
+            if timeout <= 0:
+                return
+            try:
+                event, data = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield b': ping\n\n'
+                continue
+            yield format_event(event, data)
+    finally:
+        hub.unsubscribe(queue)
@@ -0,0 +1,199 @@
+"""
+Bulk dataset export helpers (PostgreSQL COPY).
+
+Rows are produced by the server with COPY (SELECT ...) TO STDOUT as CSV,
+so millions of rows never pass through the ORM or Python row objects.
+iter_copy() turns the COPY output into an iterator of byte chunks for
+streaming HTTP responses, and write_parquet() converts a CSV chunk stream
+into Parquet record batches (requires pyarrow, pinned in requirements.txt;
+Parquet export is reported as unavailable on installs without it).
+"""
+import io
+import queue
+import threading
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from django.db import connections
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+
+EXPORT_FORMATS = ('csv', 'parquet')
+
+PARQUET_AVAILABLE = pa is not None
+
+# Column kinds reported by DataUploadRepository.get_export_columns()
+KIND_INTEGER = 'integer'
+KIND_NUMBER = 'number'
+KIND_TEXT = 'text'
+KIND_TIMESTAMP = 'timestamp'
+
+# COPY output is buffered into chunks of about this many bytes
+COPY_CHUNK_SIZE = 256 * 1024
+
+# Chunks buffered between the COPY thread and the consumer
+COPY_QUEUE_SIZE = 8
+
+_DONE = object()
+
+
+class ExportCancelled(Exception):
+    """Raised inside the COPY thread when the consumer stopped reading."""
+
+
+class _ChunkWriter:
+    """File-like target for copy_expert() that hands buffered chunks to a queue."""
+
+    def __init__(self, chunks: queue.Queue, cancelled: threading.Event):
+        self.chunks = chunks
+        self.cancelled = cancelled
+        self.buffer = bytearray()
+
+    def write(self, data) -> None:
+        self.buffer += data
+        if len(self.buffer) >= COPY_CHUNK_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.buffer:
+            self._put(bytes(self.buffer))
+            self.buffer.clear()
+
+    def _put(self, item) -> None:
+        # Bounded queue: blocks while the consumer is slow, aborts if it went away
+        while True:
+            if self.cancelled.is_set():
+                raise ExportCancelled()
+            try:
+                self.chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+def copy_to(sql: str, output, using: str = 'default') -> int:
+    """Run a COPY ... TO STDOUT statement into a binary file object; returns the row count."""
+    with connections[using].cursor() as cursor:
+        cursor.copy_expert(sql, output)
+        return cursor.rowcount
+
+
+def iter_copy(sql: str, using: str = 'default') -> Iterator[bytes]:
+    """
+    Run a COPY ... TO STDOUT statement and yield its output in chunks.
+
+    COPY runs in a worker thread on its own database connection and hands
+    chunks over through a bounded queue, so memory use does not depend on
+    the export size. Closing the iterator early cancels the COPY.
+    """
+    chunks: queue.Queue = queue.Queue(maxsize=COPY_QUEUE_SIZE)
+    cancelled = threading.Event()
+
+    def run():
+        writer = _ChunkWriter(chunks, cancelled)
+        try:
+            copy_to(sql, writer, using=using)
+            writer.flush()
+            writer._put(_DONE)
+        except ExportCancelled:
+            pass
+        except BaseException as e:
+            try:
+                writer._put(e)
+            except ExportCancelled:
+                pass
+        finally:
+            connections[using].close()
+
+    thread = threading.Thread(target=run, name='dataset-export', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        cancelled.set()
+        thread.join()
+
+
+class _ChunkReader(io.RawIOBase):
+    """Readable binary file over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self.chunks = iter(chunks)
+        self.pending = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self.pending:
+            self.pending = next(self.chunks, None)
+            if self.pending is None:
+                self.pending = b''
+                return 0
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
+
+
+def _arrow_type(kind: str):
+    return {
+        KIND_INTEGER: pa.int64(),
+        KIND_NUMBER: pa.float64(),
+        KIND_TIMESTAMP: pa.timestamp('us'),
+    }.get(kind, pa.string())
+
+
+def write_parquet(
+    chunks: Iterable[bytes],
+    columns: List[Tuple[str, str]],
+    output,
+    compression: Optional[str] = 'zstd',
+) -> int:
+    """
+    Convert a CSV chunk stream (with header line) into a Parquet file.
+
+    The CSV is parsed block by block and every block is written as a row
+    group slice, so memory use is bounded by the parse block size.
+
+    Args:
+        chunks: CSV bytes as produced by COPY ... (FORMAT csv, HEADER true)
+        columns: [(column name, kind)] in CSV order
+        output: Path or writable binary file object
+        compression: Parquet compression codec
+
+    Returns:
+        int: Number of rows written
+    """
+    if pa is None:
+        raise RuntimeError('Parquet export requires the pyarrow package')
+
+    schema = pa.schema([pa.field(name, _arrow_type(kind)) for name, kind in columns])
+    reader = pa_csv.open_csv(
+        io.BufferedReader(_ChunkReader(chunks), buffer_size=COPY_CHUNK_SIZE),
+        read_options=pa_csv.ReadOptions(block_size=4 * 1024 * 1024),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=schema,
+            # COPY writes NULL unquoted and empty strings as ""
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=False,
+        ),
+    )
+
+    rows = 0
+    with pq.ParquetWriter(output, schema, compression=compression) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
@@ -0,0 +1,61 @@
+"""
+Django management command to export a dataset with PostgreSQL COPY.
+"""
+import os
+import sys
+from django.core.management.base import BaseCommand, CommandError
+from apps.data_upload.exceptions import DataUploadError
+from apps.data_upload.exports import EXPORT_FORMATS
+from apps.data_upload.models import UploadedData
+from apps.data_upload.services import DataUploadService
+
+
+class Command(BaseCommand):
+    help = '데이터 타입의 전체 행을 metadata 키를 컬럼으로 펼쳐 CSV/Parquet 파일로 내보냅니다 (COPY 사용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'data_type',
+            choices=[choice for choice, _ in UploadedData.DATA_TYPE_CHOICES],
+            help='내보낼 데이터 타입',
+        )
+        parser.add_argument(
+            '--format',
+            dest='file_format',
+            choices=EXPORT_FORMATS,
+            default='csv',
+            help='출력 형식 (기본값: csv)',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            help="출력 파일 경로 (기본값: <data_type>.<format>, CSV는 '-'이면 표준 출력)",
+        )
+
+    def handle(self, *args, **options):
+        data_type = options['data_type']
+        file_format = options['file_format']
+        output = options['output'] or f'{data_type}.{file_format}'
+
+        service = DataUploadService()
+        try:
+            if output == '-':
+                if file_format != 'csv':
+                    raise CommandError('표준 출력은 CSV 형식만 지원합니다.')
+                service.export_dataset(data_type, sys.stdout.buffer, file_format=file_format)
+                sys.stdout.buffer.flush()
+                return
+
+            # Write next to the target and rename, so readers never see a partial extract
+            partial = f'{output}.partial'
+            try:
+                with open(partial, 'wb') as f:
+                    rows = service.export_dataset(data_type, f, file_format=file_format)
+                os.replace(partial, output)
+            finally:
+                if os.path.exists(partial):
+                    os.remove(partial)
+        except DataUploadError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(f'✅ {data_type} 데이터 {rows}건을 내보냈습니다: {output}'))
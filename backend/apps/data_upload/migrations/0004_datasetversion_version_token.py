@@ -0,0 +1,17 @@
+import apps.data_upload.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0003_datasetversion_changes_from'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='datasetversion',
+            name='version_token',
+            field=models.CharField(default=apps.data_upload.models.new_version_token, max_length=32),
+        ),
+    ]
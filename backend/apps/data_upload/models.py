@@ -1,6 +1,9 @@
 """
 Models for data upload app.
 """
+import uuid
+
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
 from apps.authentication.models import User
 
@@ -29,7 +32,8 @@ class DataUploadLog(models.Model):
         db_table = 'data_upload_logs'
         managed = False
         indexes = [
-            models.Index(fields=['user_id']),
+            # A user's upload history, newest first (get_upload_logs_by_user)
+            models.Index(fields=['user_id', '-uploaded_at'], name='idx_upload_logs_user_uploaded'),
             models.Index(fields=['status']),
             models.Index(fields=['-uploaded_at']),
         ]
@@ -39,7 +43,14 @@ class DataUploadLog(models.Model):
 
 
 class UploadedData(models.Model):
-    """Uploaded data storage."""
+    """
+    Uploaded data storage.
+
+    The table is LIST-partitioned by data_type (uploaded_data_<type>); see
+    0008_partition_uploaded_data.sql. Queries filtering on data_type only
+    scan that type's partition. The database primary key is (id, data_type)
+    since it has to include the partition key; id alone is unique.
+    """
 
     DATA_TYPE_CHOICES = [
         ('kpi', 'KPI'),
@@ -63,11 +74,43 @@ class UploadedData(models.Model):
         db_table = 'uploaded_data'
         managed = False
         indexes = [
+            # data_type is the partition key and needs no index
             models.Index(fields=['upload_log_id']),
-            models.Index(fields=['data_type']),
-            models.Index(fields=['year']),
+            # Common dashboard filters; covers counts and id lookups (index-only)
+            models.Index(fields=['year', 'college', 'department'], include=['data_type', 'id'], name='idx_uploaded_data_filters'),
             models.Index(fields=['college', 'department']),
+            # Newest rows first (get_uploaded_data)
+            models.Index(fields=['year', '-created_at'], name='idx_uploaded_data_year_created'),
+            # Append-only rows: created_at follows the physical order
+            BrinIndex(fields=['created_at'], name='idx_uploaded_data_created_brin'),
         ]
 
     def __str__(self):
         return f"{self.data_type} - {self.year}"
+
+
+def new_version_token() -> str:
+    return uuid.uuid4().hex
+
+
+class DatasetVersion(models.Model):
+    """Per data type dataset version (bumped on every upload/delete)."""
+
+    data_type = models.CharField(
+        primary_key=True,
+        max_length=50,
+        choices=UploadedData.DATA_TYPE_CHOICES,
+    )
+    version = models.BigIntegerField(default=0)
+    # Oldest version that dataset_changes can still answer a delta request from
+    changes_from = models.BigIntegerField(default=0)
+    # Renewed by a trigger on every version change; tells this database's vN from another's
+    version_token = models.CharField(max_length=32, default=new_version_token)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'dataset_versions'
+        managed = False
+
+    def __str__(self):
+        return f"{self.data_type} - v{self.version}"
@@ -0,0 +1,79 @@
+"""
+Upload progress reporting through the Django cache.
+
+DataUploadService writes the state of a running upload (stage, rows parsed
+and inserted) under a per-user key; the event stream (events.py) reads it
+and pushes changes to the browser. With the default per-process memory
+cache only streams served by the uploading process would see the
+progress, so the event stream requires a shared cache (REDIS_URL) outside
+DEBUG; see apps.core.cache.cache_is_shared().
+"""
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+STAGE_PARSING = 'parsing'
+STAGE_REPLACING = 'replacing'
+STAGE_INSERTING = 'inserting'
+STAGE_REFRESHING = 'refreshing'
+STAGE_SUCCESS = 'success'
+STAGE_FAILED = 'failed'
+
+FINAL_STAGES = (STAGE_SUCCESS, STAGE_FAILED)
+
+# Progress entries expire after this many seconds without an update
+UPLOAD_PROGRESS_TIMEOUT = getattr(settings, 'DATA_UPLOAD_PROGRESS_TIMEOUT', 10 * 60)
+
+# Minimum seconds between inserted-row updates written to the cache
+UPLOAD_PROGRESS_INTERVAL = getattr(settings, 'DATA_UPLOAD_PROGRESS_INTERVAL', 0.25)
+
+
+def progress_key(user_id: int) -> str:
+    return f'upload_progress:{user_id}'
+
+
+def get_progress(user_id: int) -> Optional[Dict[str, Any]]:
+    """Latest progress of the user's upload, or None."""
+    return cache.get(progress_key(user_id))
+
+
+class UploadProgress:
+    """Progress of one upload, published to the cache on every change."""
+
+    def __init__(self, user_id: int, upload_log_id: int, filename: str):
+        self.key = progress_key(user_id)
+        self.state: Dict[str, Any] = {
+            'upload_log_id': upload_log_id,
+            'filename': filename,
+            'stage': STAGE_PARSING,
+            'data_type': None,
+            'rows_parsed': 0,
+            'rows_inserted': 0,
+            'total_records': None,
+            'error': None,
+            'updated_at': None,
+        }
+        self._published_at = 0.0
+        self.publish()
+
+    def update(self, **changes) -> None:
+        self.state.update(changes)
+        self.publish()
+
+    def inserted(self, rows: int) -> None:
+        """Record inserted rows; cache writes are throttled to UPLOAD_PROGRESS_INTERVAL."""
+        self.state['rows_inserted'] = rows
+        if time.monotonic() - self._published_at >= UPLOAD_PROGRESS_INTERVAL:
+            self.publish()
+
+    def publish(self) -> None:
+        self._published_at = time.monotonic()
+        self.state['updated_at'] = time.time()
+        try:
+            cache.set(self.key, dict(self.state), UPLOAD_PROGRESS_TIMEOUT)
+        except Exception:
+            # Progress is best effort; a cache outage must not fail the upload
+            pass
@@ -1,9 +1,30 @@
 """
 Repository layer for data upload - Data access layer.
 """
-from typing import List, Dict, Any, Optional
-from django.db import transaction
-from .models import DataUploadLog, UploadedData
+import json
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import F
+from psycopg2 import sql
+from .exports import KIND_INTEGER, KIND_NUMBER, KIND_TEXT, KIND_TIMESTAMP
+from .models import DataUploadLog, UploadedData, DatasetVersion
+
+
+# Rows per INSERT in bulk_create_uploaded_data/replace_uploaded_data (progress is reported per batch)
+BULK_INSERT_BATCH_SIZE = 500
+
+# uploaded_data columns placed before the flattened metadata keys in exports
+EXPORT_BASE_COLUMNS = (
+    ('id', KIND_INTEGER),
+    ('upload_log_id', KIND_INTEGER),
+    ('data_type', KIND_TEXT),
+    ('year', KIND_INTEGER),
+    ('semester', KIND_TEXT),
+    ('college', KIND_TEXT),
+    ('department', KIND_TEXT),
+    ('created_at', KIND_TIMESTAMP),
+    ('updated_at', KIND_TIMESTAMP),
+)
 
 
 class DataUploadRepository:
@@ -77,6 +98,7 @@ class DataUploadRepository:
         self,
         upload_log_id: int,
         records: List[Dict[str, Any]],
+        on_progress: Optional[Callable[[int], None]] = None,
     ) -> int:
         """
         Bulk insert uploaded data records.
@@ -84,6 +106,7 @@ class DataUploadRepository:
         Args:
             upload_log_id: Upload log ID
             records: List of normalized record dictionaries
+            on_progress: Called with the number of rows inserted so far after each batch
             
         Returns:
             int: Number of created records
@@ -101,7 +124,10 @@ class DataUploadRepository:
             for record in records
         ]
         
-        UploadedData.objects.bulk_create(instances, batch_size=500)
+        for start in range(0, len(instances), BULK_INSERT_BATCH_SIZE):
+            UploadedData.objects.bulk_create(instances[start:start + BULK_INSERT_BATCH_SIZE])
+            if on_progress is not None:
+                on_progress(min(start + BULK_INSERT_BATCH_SIZE, len(instances)))
         return len(instances)
     
     def get_upload_logs_by_user(
@@ -159,19 +185,67 @@ class DataUploadRepository:
         return DataUploadLog.objects.count()
     
     @transaction.atomic
-    def delete_previous_data_by_type(self, data_type: str) -> int:
+    def replace_uploaded_data(
+        self,
+        upload_log_id: int,
+        data_type: str,
+        records: List[Dict[str, Any]],
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Tuple[int, int]:
         """
-        Delete all previous uploaded data of a specific type.
-        Used when uploading new data to replace old data.
+        Replace all uploaded data of a type with new records.
+        
+        On PostgreSQL the records are loaded into a staging table while
+        reads keep seeing the old rows, then the staging table is swapped in
+        for the type's partition (begin_uploaded_data_replacement and
+        swap_uploaded_data_partition functions). The old rows are dropped
+        with their partition instead of being deleted row by row. Elsewhere
+        the old rows are deleted and the new ones inserted.
         
         Args:
-            data_type: Data type to delete
+            upload_log_id: Upload log ID
+            data_type: Data type to replace (every record must be of this type)
+            records: List of normalized record dictionaries
+            on_progress: Called with the number of rows inserted so far after each batch
             
         Returns:
-            int: Number of deleted records
+            Tuple[int, int]: (deleted records, created records)
         """
-        deleted_count, _ = UploadedData.objects.filter(data_type=data_type).delete()
-        return deleted_count
+        connection = connections[DEFAULT_DB_ALIAS]
+        if connection.vendor != 'postgresql':
+            deleted_count, _ = UploadedData.objects.filter(data_type=data_type).delete()
+            return deleted_count, self.bulk_create_uploaded_data(upload_log_id, records, on_progress)
+        
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT begin_uploaded_data_replacement(%s)', [data_type])
+            staging_table = cursor.fetchone()[0]
+            insert = sql.SQL(
+                'INSERT INTO {} (upload_log_id, data_type, year, semester, college, department, metadata) VALUES '
+            ).format(sql.Identifier(staging_table)).as_string(connection.connection)
+            
+            for start in range(0, len(records), BULK_INSERT_BATCH_SIZE):
+                batch = records[start:start + BULK_INSERT_BATCH_SIZE]
+                cursor.execute(
+                    insert + ', '.join(['(%s, %s, %s, %s, %s, %s, %s::jsonb)'] * len(batch)),
+                    [
+                        value
+                        for record in batch
+                        for value in (
+                            upload_log_id,
+                            record['data_type'],
+                            record.get('year'),
+                            record.get('semester'),
+                            record.get('college'),
+                            record.get('department'),
+                            json.dumps(record.get('metadata', {})),
+                        )
+                    ],
+                )
+                if on_progress is not None:
+                    on_progress(start + len(batch))
+            
+            cursor.execute('SELECT swap_uploaded_data_partition(%s)', [data_type])
+            return cursor.fetchone()[0], len(records)
     
     def get_uploaded_data(
         self,
@@ -261,6 +335,44 @@ class DataUploadRepository:
         deleted, _ = UploadedData.objects.filter(upload_log_id=log_id).delete()
         return deleted
     
+    def get_data_types_by_log(self, log_id: int) -> List[str]:
+        """
+        Get distinct data types stored under an upload log.
+        
+        Args:
+            log_id: Upload log ID
+            
+        Returns:
+            List[str]: Data types of the records created by the upload
+        """
+        return list(
+            UploadedData.objects
+            .filter(upload_log_id=log_id)
+            .values_list('data_type', flat=True)
+            .distinct()
+        )
+    
+    @transaction.atomic
+    def bump_dataset_version(self, data_type: str) -> int:
+        """
+        Increment the dataset version of a data type.
+        
+        Args:
+            data_type: Data type whose rows changed
+            
+        Returns:
+            int: New dataset version
+        """
+        updated = (
+            DatasetVersion.objects
+            .filter(data_type=data_type)
+            .update(version=F('version') + 1)
+        )
+        if not updated:
+            DatasetVersion.objects.create(data_type=data_type, version=1)
+        
+        return DatasetVersion.objects.get(data_type=data_type).version
+    
     @transaction.atomic
     def delete_upload_log(self, log_id: int) -> None:
         """
@@ -270,3 +382,89 @@ class DataUploadRepository:
             log_id: Upload log ID
         """
         DataUploadLog.objects.filter(id=log_id).delete()
+    
+    def get_export_columns(
+        self,
+        data_type: str,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        Columns of a flattened dataset export.
+        
+        Base columns come first, followed by every metadata key of the data
+        type in order of first appearance. A metadata key is typed as integer
+        or number when all of its non-null values are JSON numbers. Keys that
+        clash with a base column are exported as 'metadata.<key>'.
+        
+        Args:
+            data_type: Data type to export
+            using: Database alias to read from
+            
+        Returns:
+            List[Tuple[str, str, Optional[str]]]: (column name, kind, metadata key or None)
+        """
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT
+                    e.key,
+                    bool_and(jsonb_typeof(e.value) IN ('number', 'null')) AS is_number,
+                    bool_and(jsonb_typeof(e.value) <> 'number' OR e.value::text ~ '^-?[0-9]+$') AS is_integer
+                FROM uploaded_data d, jsonb_each(d.metadata) e
+                WHERE d.data_type = %s
+                GROUP BY e.key
+                ORDER BY MIN(d.id), e.key
+                """,
+                [data_type],
+            )
+            metadata_keys = cursor.fetchall()
+        
+        base_names = {name for name, _ in EXPORT_BASE_COLUMNS}
+        columns = [(name, kind, None) for name, kind in EXPORT_BASE_COLUMNS]
+        for key, is_number, is_integer in metadata_keys:
+            kind = KIND_TEXT
+            if is_number:
+                kind = KIND_INTEGER if is_integer else KIND_NUMBER
+            name = f'metadata.{key}' if key in base_names else key
+            columns.append((name, kind, key))
+        
+        return columns
+    
+    def get_export_copy_sql(
+        self,
+        data_type: str,
+        columns: List[Tuple[str, str, Optional[str]]],
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> str:
+        """
+        COPY (SELECT ...) TO STDOUT statement for a flattened dataset export.
+        
+        Metadata keys are projected with metadata ->> key, so text values are
+        unquoted and nested values are written as JSON text. COPY does not
+        accept bind parameters, so identifiers and literals are quoted by
+        psycopg2.
+        
+        Args:
+            data_type: Data type to export
+            columns: Columns from get_export_columns()
+            using: Database alias the statement will run on (used for quoting)
+            
+        Returns:
+            str: COPY statement producing CSV with a header line, ordered by id
+        """
+        projections = []
+        for name, kind, key in columns:
+            if key is None:
+                projections.append(sql.Identifier(name))
+            else:
+                projections.append(sql.SQL('metadata ->> {} AS {}').format(
+                    sql.Literal(key), sql.Identifier(name),
+                ))
+        
+        statement = sql.SQL(
+            'COPY (SELECT {} FROM uploaded_data WHERE data_type = {} ORDER BY id) '
+            "TO STDOUT WITH (FORMAT csv, HEADER true, ENCODING 'UTF8')"
+        ).format(sql.SQL(', ').join(projections), sql.Literal(data_type))
+        
+        connections[using].ensure_connection()
+        return statement.as_string(connections[using].connection)
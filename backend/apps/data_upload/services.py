@@ -1,12 +1,29 @@
 """
 Service layer for data upload - Business logic orchestration.
 """
-from typing import Dict, Any, Tuple
-from django.db import transaction
+import logging
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from django.db import connections, router, transaction
+from apps.core.db_routers import pin_user_to_primary, use_primary
+from apps.dashboard.repositories import DashboardRepository
+from apps.dashboard.services import schedule_warm_up
 from .parsers import ExcelParser
 from .validators import DataValidator
 from .repositories import DataUploadRepository
 from .exceptions import DataUploadError
+from .exports import EXPORT_FORMATS, PARQUET_AVAILABLE, copy_to, iter_copy, write_parquet
+from .models import UploadedData
+from .progress import (
+    STAGE_FAILED,
+    STAGE_INSERTING,
+    STAGE_REFRESHING,
+    STAGE_REPLACING,
+    STAGE_SUCCESS,
+    UploadProgress,
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 class DataUploadService:
@@ -16,6 +33,38 @@ class DataUploadService:
         self.parser = ExcelParser()
         self.validator = DataValidator()
         self.repository = DataUploadRepository()
+        self.dashboard_repository = DashboardRepository()
+    
+    def _on_dataset_changed(self, data_type: str) -> None:
+        """
+        데이터 타입의 행이 변경된 후 (같은 트랜잭션 안에서) 파생 데이터 갱신.
+        
+        Args:
+            data_type: 변경된 데이터 타입
+        """
+        # Bump dataset version (invalidates dashboard ETags and caches)
+        version = self.repository.bump_dataset_version(data_type)
+        
+        # Refresh filter dimension table and aggregate rollups
+        self.dashboard_repository.refresh_filter_dimensions(data_type)
+        self.dashboard_repository.refresh_rollups(data_type)
+        
+        # Row-level added/removed log for delta sync clients
+        self.dashboard_repository.record_changes(data_type, version)
+        
+        # Publish the shared columnar snapshot once the new rows are visible
+        transaction.on_commit(
+            lambda: self._publish_snapshot(data_type, version)
+        )
+    
+    def _publish_snapshot(self, data_type: str, version: int) -> None:
+        """커밋 후 컬럼형 스냅샷 작성 (실패해도 업로드 결과에는 영향 없음)."""
+        try:
+            # The replica may not have the new version yet
+            with use_primary():
+                self.dashboard_repository.publish_columnar_snapshot(data_type, version)
+        except Exception as e:
+            logger.warning(f"Failed to publish dashboard snapshot for {data_type}: {e}")
     
     @transaction.atomic
     def upload_and_process(
@@ -53,6 +102,7 @@ class DataUploadService:
             DataUploadError: 업로드 실패 시
         """
         upload_log = None
+        progress = None
         
         try:
             # 1. Create upload log (pending state)
@@ -63,6 +113,9 @@ class DataUploadService:
                 status='pending',
             )
             
+            # Progress for the event stream (GET /api/data-upload/events/)
+            progress = UploadProgress(user_id, upload_log.id, filename)
+            
             # 2. Validate file
             self.validator.validate_all(filename, file_size, content_type)
             
@@ -70,19 +123,35 @@ class DataUploadService:
             data_type, normalized_records, total_records = self.parser.parse_and_normalize(
                 file_content, filename
             )
+            progress.update(
+                stage=STAGE_REPLACING if replace_existing else STAGE_INSERTING,
+                data_type=data_type,
+                rows_parsed=total_records,
+                total_records=total_records,
+            )
             
-            # 4. Replace existing data if requested
+            # 4-5. Insert data, replacing the type's existing rows if requested
+            progress.update(stage=STAGE_INSERTING)
             if replace_existing:
-                deleted_count = self.repository.delete_previous_data_by_type(data_type)
-                print(f"Deleted {deleted_count} existing {data_type} records")
+                deleted_count, processed_records = self.repository.replace_uploaded_data(
+                    upload_log_id=upload_log.id,
+                    data_type=data_type,
+                    records=normalized_records,
+                    on_progress=progress.inserted,
+                )
+                print(f"Replaced {deleted_count} existing {data_type} records")
+            else:
+                processed_records = self.repository.bulk_create_uploaded_data(
+                    upload_log_id=upload_log.id,
+                    records=normalized_records,
+                    on_progress=progress.inserted,
+                )
             
-            # 5. Bulk insert data
-            processed_records = self.repository.bulk_create_uploaded_data(
-                upload_log_id=upload_log.id,
-                records=normalized_records,
-            )
+            # 6. Refresh dataset version and derived dashboard data
+            progress.update(stage=STAGE_REFRESHING, rows_inserted=processed_records)
+            self._on_dataset_changed(data_type)
             
-            # 6. Update upload log to success
+            # 7. Update upload log to success
             self.repository.update_upload_log(
                 log_id=upload_log.id,
                 status='success',
@@ -90,6 +159,11 @@ class DataUploadService:
                 processed_records=processed_records,
             )
             
+            # 8. Precompute common dashboard responses after commit
+            transaction.on_commit(schedule_warm_up)
+            transaction.on_commit(lambda: pin_user_to_primary(user_id))
+            transaction.on_commit(lambda: progress.update(stage=STAGE_SUCCESS))
+            
             return {
                 'upload_log_id': upload_log.id,
                 'status': 'success',
@@ -107,6 +181,8 @@ class DataUploadService:
                     status='failed',
                     error_message=str(e),
                 )
+            if progress:
+                progress.update(stage=STAGE_FAILED, error=str(e))
             
             # Re-raise as DataUploadError
             raise DataUploadError(str(e))
@@ -198,13 +274,84 @@ class DataUploadService:
             raise DataUploadError(f'업로드 로그를 찾을 수 없습니다. (ID: {log_id})')
         
         # Delete associated data
+        data_types = self.repository.get_data_types_by_log(log_id)
         deleted_count = self.repository.delete_uploaded_data_by_log(log_id)
         
+        for data_type in data_types:
+            self._on_dataset_changed(data_type)
+        
         # Delete upload log
         self.repository.delete_upload_log(log_id)
+        transaction.on_commit(lambda: pin_user_to_primary(user_id))
         
         return {
             'message': '데이터가 성공적으로 삭제되었습니다.',
             'deleted_records': deleted_count,
             'log_id': log_id,
         }
+    
+    def _prepare_export(
+        self,
+        data_type: str,
+        file_format: str,
+    ) -> Tuple[List[Tuple[str, str, Optional[str]]], str, str]:
+        """
+        내보내기 요청 검증 후 (컬럼 목록, COPY 문, 읽기 DB alias) 생성.
+        
+        대량 스캔이므로 읽기 복제본이 설정되어 있으면 복제본에서 실행된다.
+        
+        Raises:
+            DataUploadError: 알 수 없는 데이터 타입/포맷이거나 PostgreSQL이 아닌 경우
+        """
+        if data_type not in dict(UploadedData.DATA_TYPE_CHOICES):
+            raise DataUploadError(f'알 수 없는 데이터 타입입니다: {data_type}')
+        if file_format not in EXPORT_FORMATS:
+            raise DataUploadError(f'지원하지 않는 내보내기 형식입니다: {file_format}')
+        if file_format == 'parquet' and not PARQUET_AVAILABLE:
+            raise DataUploadError('Parquet 내보내기에는 pyarrow 패키지가 필요합니다 (requirements.txt).')
+        using = router.db_for_read(UploadedData)
+        if connections[using].vendor != 'postgresql':
+            raise DataUploadError('데이터셋 내보내기는 PostgreSQL에서만 지원됩니다.')
+        
+        columns = self.repository.get_export_columns(data_type, using=using)
+        return columns, self.repository.get_export_copy_sql(data_type, columns, using=using), using
+    
+    def export_dataset(self, data_type: str, output, file_format: str = 'csv') -> int:
+        """
+        데이터 타입의 전체 행을 metadata 키를 컬럼으로 펼쳐 파일로 내보내기 (BI 추출용).
+        
+        행은 PostgreSQL COPY (SELECT ...) TO STDOUT으로 생성되어 ORM을 거치지 않는다.
+        
+        Args:
+            data_type: 내보낼 데이터 타입
+            output: 바이너리 파일 객체 (parquet는 경로도 가능)
+            file_format: 'csv' 또는 'parquet'
+            
+        Returns:
+            int: 내보낸 행 수
+            
+        Raises:
+            DataUploadError: 알 수 없는 데이터 타입/포맷이거나 PostgreSQL이 아닌 경우
+        """
+        columns, statement, using = self._prepare_export(data_type, file_format)
+        
+        if file_format == 'parquet':
+            return write_parquet(
+                iter_copy(statement, using=using),
+                [(name, kind) for name, kind, _ in columns],
+                output,
+            )
+        return copy_to(statement, output, using=using)
+    
+    def iter_dataset_csv(self, data_type: str) -> Iterator[bytes]:
+        """
+        데이터셋 CSV 내보내기를 chunk 단위로 스트리밍 (HTTP 응답용).
+        
+        Returns:
+            Iterator[bytes]: COPY 출력 chunk (헤더 포함)
+            
+        Raises:
+            DataUploadError: 알 수 없는 데이터 타입이거나 PostgreSQL이 아닌 경우
+        """
+        _, statement, using = self._prepare_export(data_type, 'csv')
+        return iter_copy(statement, using=using)
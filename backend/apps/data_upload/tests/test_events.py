@@ -0,0 +1,226 @@
+"""
+Unit tests for upload progress and the data event stream
+"""
+import asyncio
+import json
+
+import pytest
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import AsyncRequestFactory, RequestFactory, override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.data_upload import events, progress
+from apps.data_upload.progress import STAGE_INSERTING, STAGE_PARSING, UploadProgress, get_progress
+from apps.data_upload.views import DataEventsTicketView, DataEventsView
+
+
+def _parse(chunk):
+    """SSE message -> (event, data) or the raw line for retry/comment lines."""
+    lines = chunk.decode('utf-8').strip().split('\n')
+    if not lines[0].startswith('event: '):
+        return lines[0]
+    return lines[0][len('event: '):], json.loads(lines[1][len('data: '):])
+
+
+@pytest.mark.unit
+class TestUploadProgress:
+    """UploadProgress cache publishing"""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_publishes_state_per_user(self):
+        """
+        Given: An upload started by a user
+        When: Its stage changes
+        Then: Should expose the latest state under that user's key only
+        """
+        upload = UploadProgress(user_id=7, upload_log_id=3, filename='kpi.csv')
+        assert get_progress(7)['stage'] == STAGE_PARSING
+
+        upload.update(stage=STAGE_INSERTING, rows_parsed=1000, total_records=1000)
+
+        state = get_progress(7)
+        assert state['stage'] == STAGE_INSERTING
+        assert state['rows_parsed'] == 1000
+        assert state['upload_log_id'] == 3
+        assert get_progress(8) is None
+
+    def test_inserted_rows_are_throttled(self, monkeypatch):
+        """
+        Given: Batches inserted faster than the progress interval
+        When: inserted() is called per batch
+        Then: Should not write every batch to the cache
+        """
+        monkeypatch.setattr(progress, 'UPLOAD_PROGRESS_INTERVAL', 60)
+        upload = UploadProgress(user_id=7, upload_log_id=3, filename='kpi.csv')
+
+        upload.inserted(500)
+        upload.inserted(1000)
+
+        assert get_progress(7)['rows_inserted'] == 0
+        upload.update(stage=STAGE_INSERTING)
+        assert get_progress(7)['rows_inserted'] == 1000
+
+
+@pytest.mark.unit
+class TestEventStream:
+    """event_stream() and DataEventHub fan-out"""
+
+    def test_sends_snapshot_then_changes(self, monkeypatch):
+        """
+        Given: A connected stream
+        When: The dataset version and the user's upload progress change
+        Then: Should send the initial versions, then 'dataset' and 'upload' events
+        """
+        versions = {'kpi': 1, 'publication': 4}
+        entries = {}
+        monkeypatch.setattr(events, '_load_versions', lambda: dict(versions))
+        monkeypatch.setattr(events, '_load_progress', lambda user_ids: dict(entries))
+        monkeypatch.setattr(events, 'get_progress', lambda user_id: None)
+        monkeypatch.setattr(events, 'EVENTS_POLL_INTERVAL', 0.01)
+        monkeypatch.setattr(events, 'EVENTS_VERSION_INTERVAL', 0.01)
+        hub = events.DataEventHub()
+
+        async def consume():
+            stream = events.event_stream(7, hub=hub)
+            received = [_parse(await stream.__anext__()) for _ in range(2)]
+
+            versions['publication'] = 5
+            entries[7] = {'stage': STAGE_INSERTING, 'updated_at': 1.0}
+            received += [_parse(await stream.__anext__()) for _ in range(2)]
+            await stream.aclose()
+            return received
+
+        received = asyncio.run(asyncio.wait_for(consume(), timeout=2))
+
+        assert received[0] == f'retry: {events.EVENTS_RETRY_MS}'
+        assert received[1] == ('dataset', {'versions': {'kpi': 1, 'publication': 4}, 'changed': []})
+        assert ('dataset', {'versions': {'kpi': 1, 'publication': 5}, 'changed': ['publication']}) in received
+        assert ('upload', {'stage': STAGE_INSERTING, 'updated_at': 1.0}) in received
+        assert hub.subscribers == {}
+        assert hub.task is None
+
+    def test_upload_progress_goes_to_the_uploading_user_only(self):
+        """
+        Given: Streams of two users
+        When: An upload event is published for one of them
+        Then: Should queue it for that user's stream only
+        """
+        async def publish():
+            hub = events.DataEventHub()
+            hub.task = asyncio.get_running_loop().create_future()
+            mine, other = hub.subscribe(7), hub.subscribe(8)
+            hub.publish(('upload', {'stage': STAGE_PARSING}), user_id=7)
+            return mine.qsize(), other.qsize()
+
+        assert asyncio.run(publish()) == (1, 0)
+
+
+@pytest.mark.unit
+class TestStreamTickets:
+    """Single-use event stream tickets"""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_ticket_is_redeemed_once(self):
+        """
+        Given: A ticket issued to a user
+        When: It is redeemed twice
+        Then: Should return the user id the first time only
+        """
+        ticket = events.issue_stream_ticket(7)
+
+        assert events.redeem_stream_ticket(ticket) == 7
+        assert events.redeem_stream_ticket(ticket) is None
+        assert events.redeem_stream_ticket('unknown') is None
+
+
+@pytest.mark.unit
+class TestDataEventsView:
+    """GET /api/data-upload/events/ authentication"""
+
+    @pytest.fixture(autouse=True)
+    def shared_cache(self):
+        cache.clear()
+        with patch('apps.data_upload.views.cache_is_shared', return_value=True):
+            yield
+
+    def _get(self, query='', factory=AsyncRequestFactory):
+        request = factory().get(f'/api/data-upload/events/{query}')
+        return asyncio.run(DataEventsView.as_view()(request))
+
+    def test_missing_token_returns_401(self):
+        """
+        Given: No Authorization header and no ticket parameter
+        When: The stream is requested
+        Then: Should return 401 without opening a stream
+        """
+        response = self._get()
+
+        assert response.status_code == 401
+        assert not response.streaming
+
+    def test_ticket_opens_one_stream(self):
+        """
+        Given: A ticket issued through the ticket endpoint
+        When: The stream is requested with it twice
+        Then: Should open the first stream and reject the reused ticket
+        """
+        user = type('User', (), {'id': 7, 'is_authenticated': True})()
+        request = APIRequestFactory().post('/api/data-upload/events/ticket/')
+        force_authenticate(request, user=user)
+        issued = DataEventsTicketView.as_view()(request)
+        ticket = issued.data['ticket']
+
+        with patch('apps.data_upload.views.User') as MockUser:
+            MockUser.objects.filter.return_value.first.return_value = user
+            first = self._get(f'?ticket={ticket}')
+            second = self._get(f'?ticket={ticket}')
+
+        assert issued.status_code == 201
+        assert first.status_code == 200
+        assert first.streaming
+        assert second.status_code == 401
+        MockUser.objects.filter.assert_called_once_with(id=7, is_active=True)
+
+    def test_jwt_in_query_string_is_rejected(self):
+        """
+        Given: An access token passed as ?token= (would end up in URLs and logs)
+        When: The stream is requested
+        Then: Should return 401
+        """
+        response = self._get('?token=header.payload.signature')
+
+        assert response.status_code == 401
+
+    @override_settings(DEBUG=False)
+    def test_per_process_cache_returns_503(self):
+        """
+        Given: The default per-process memory cache outside DEBUG
+        When: A ticket or the stream is requested
+        Then: Should return 503 since other workers would not see tickets or progress
+        """
+        request = APIRequestFactory().post('/api/data-upload/events/ticket/')
+        force_authenticate(request, user=type('User', (), {'id': 7, 'is_authenticated': True})())
+
+        with patch('apps.data_upload.views.cache_is_shared', return_value=False):
+            issued = DataEventsTicketView.as_view()(request)
+            response = self._get()
+
+        assert issued.status_code == 503
+        assert response.status_code == 503
+
+    def test_wsgi_request_returns_503(self):
+        """
+        Given: A stream request served through WSGI (e.g. runserver)
+        When: The stream is requested
+        Then: Should return 503 since WSGI buffers the stream until it ends
+        """
+        response = self._get(factory=RequestFactory)
+
+        assert response.status_code == 503
+        assert not response.streaming
+        assert 'ASGI' in json.loads(response.content)['detail']
@@ -0,0 +1,133 @@
+"""
+Unit tests for the COPY-based dataset export
+"""
+import io
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from apps.data_upload import exports
+from apps.data_upload.exceptions import DataUploadError
+from apps.data_upload.services import DataUploadService
+
+
+def _fake_copy(lines, started=None):
+    """copy_to() replacement writing lines like psycopg2's copy_expert (one write per row)."""
+    def copy_to(sql, output, using='default'):
+        if started is not None:
+            started.set()
+        for line in lines:
+            output.write(line)
+        return len(lines)
+    return copy_to
+
+
+@pytest.mark.unit
+class TestIterCopy:
+    """iter_copy() chunked streaming"""
+
+    def test_yields_buffered_chunks_in_order(self, monkeypatch):
+        """
+        Given: COPY output of 1,000 rows and a small chunk size
+        When: Iterated
+        Then: Should yield fewer chunks than rows with the full output in order
+        """
+        lines = [f'{n},row {n}\n'.encode('utf-8') for n in range(1000)]
+        monkeypatch.setattr(exports, 'COPY_CHUNK_SIZE', 512)
+
+        with patch.object(exports, 'copy_to', _fake_copy(lines)), \
+                patch.object(exports, 'connections'):
+            chunks = list(exports.iter_copy('COPY ...'))
+
+        assert 1 < len(chunks) < len(lines)
+        assert b''.join(chunks) == b''.join(lines)
+
+    def test_copy_error_is_raised_to_consumer(self):
+        """
+        Given: COPY fails in the worker thread
+        When: Iterated
+        Then: Should raise the same error in the consumer
+        """
+        def failing_copy(sql, output, using='default'):
+            raise RuntimeError('connection lost')
+
+        with patch.object(exports, 'copy_to', failing_copy), \
+                patch.object(exports, 'connections'):
+            with pytest.raises(RuntimeError, match='connection lost'):
+                list(exports.iter_copy('COPY ...'))
+
+    def test_closing_early_cancels_copy(self, monkeypatch):
+        """
+        Given: COPY output far larger than the queue
+        When: The consumer stops after the first chunk
+        Then: Should stop the worker thread instead of buffering the rest
+        """
+        monkeypatch.setattr(exports, 'COPY_CHUNK_SIZE', 16)
+        started = threading.Event()
+
+        with patch.object(exports, 'copy_to', _fake_copy([b'x' * 16] * 100_000, started)), \
+                patch.object(exports, 'connections'):
+            iterator = exports.iter_copy('COPY ...')
+            next(iterator)
+            iterator.close()
+
+        assert started.is_set()
+        assert not any(thread.name == 'dataset-export' for thread in threading.enumerate())
+
+
+@pytest.mark.unit
+class TestWriteParquet:
+    """write_parquet() CSV to Parquet conversion"""
+
+    def test_types_columns_and_keeps_null_vs_empty_string(self):
+        """
+        Given: COPY CSV with an unquoted NULL, a quoted empty string and typed columns
+        When: Converted to Parquet
+        Then: Should apply the column kinds and keep NULL distinct from ''
+        """
+        pq = pytest.importorskip('pyarrow.parquet')
+        csv_bytes = (
+            'id,created_at,학과,Impact_Factor\n'
+            '1,2025-01-01 09:30:00.123456,컴퓨터공학과,3.9\n'
+            '2,2025-01-02 00:00:00,"",\n'
+            '3,2025-01-03 00:00:00,,1\n'
+        ).encode('utf-8')
+        columns = [
+            ('id', exports.KIND_INTEGER),
+            ('created_at', exports.KIND_TIMESTAMP),
+            ('학과', exports.KIND_TEXT),
+            ('Impact_Factor', exports.KIND_NUMBER),
+        ]
+        output = io.BytesIO()
+
+        rows = exports.write_parquet([csv_bytes[:20], csv_bytes[20:]], columns, output)
+
+        table = pq.read_table(io.BytesIO(output.getvalue()))
+        assert rows == 3
+        assert str(table.schema.field('created_at').type) == 'timestamp[us]'
+        assert table.column('학과').to_pylist() == ['컴퓨터공학과', '', None]
+        assert table.column('Impact_Factor').to_pylist() == [3.9, None, 1.0]
+
+
+@pytest.mark.unit
+class TestDataUploadServiceExport:
+    """DataUploadService export validation"""
+
+    def test_unknown_data_type_raises_error(self):
+        """
+        Given: Unknown data type
+        When: export_dataset is called
+        Then: Should raise DataUploadError before touching the database
+        """
+        with pytest.raises(DataUploadError):
+            DataUploadService().export_dataset('unknown', io.BytesIO())
+
+    def test_unknown_format_raises_error(self):
+        """
+        Given: Unsupported output format
+        When: export_dataset is called
+        Then: Should raise DataUploadError
+        """
+        with pytest.raises(DataUploadError):
+            DataUploadService().export_dataset('publication', io.BytesIO(), file_format='xlsx')
@@ -0,0 +1,126 @@
+"""
+Integration tests for the partitioned uploaded_data table
+
+Applies the supabase/migrations SQL to the test database and checks the
+table's keys and the staged partition swap of replacement uploads.
+"""
+import pytest
+from unittest.mock import patch
+from django.db import DatabaseError, connection, transaction
+
+from apps.authentication.models import User
+from apps.data_upload.models import DataUploadLog, UploadedData
+from apps.data_upload.repositories import DataUploadRepository
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(connection.vendor != 'postgresql', reason='Partitioning is PostgreSQL specific'),
+]
+
+
+@pytest.fixture
+def upload_log(supabase_schema, db):
+    user = User.objects.create(username='partitions_user', password_hash='!')
+    return DataUploadLog.objects.create(user_id=user.id, filename='partitions.xlsx', status='success')
+
+
+@pytest.mark.django_db
+class TestUploadedDataPartitions:
+    """uploaded_data partitions by data type"""
+
+    def test_primary_key_includes_partition_key(self, upload_log):
+        """
+        Given: The migrated uploaded_data table
+        When: Its primary key and partitions are inspected
+        Then: Should have PRIMARY KEY (id, data_type) and plain (not sub-partitioned) type partitions
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT array_agg(a.attname ORDER BY k.ordinality)
+                FROM pg_constraint c
+                CROSS JOIN unnest(c.conkey) WITH ORDINALITY AS k(attnum, ordinality)
+                JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.attnum
+                WHERE c.conrelid = 'uploaded_data'::regclass AND c.contype = 'p'
+                """
+            )
+            primary_key = cursor.fetchone()[0]
+            cursor.execute(
+                """
+                SELECT c.relname, c.relkind
+                FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'uploaded_data'::regclass
+                ORDER BY c.relname
+                """
+            )
+            partitions = cursor.fetchall()
+
+        assert primary_key == ['id', 'data_type']
+        assert partitions == [
+            ('uploaded_data_kpi', 'r'),
+            ('uploaded_data_publication', 'r'),
+            ('uploaded_data_research', 'r'),
+            ('uploaded_data_student', 'r'),
+        ]
+
+    def test_replacement_swaps_in_staged_partition(self, upload_log):
+        """
+        Given: Rows of two data types
+        When: The rows of one type are replaced
+        Then: Should load without locking uploaded_data, then swap in a partition holding only the new rows
+        """
+        UploadedData.objects.bulk_create(
+            UploadedData(upload_log_id=upload_log.id, data_type=data_type, year=2023, metadata={})
+            for data_type in ('kpi', 'kpi', 'student')
+        )
+        records = [
+            {'data_type': 'kpi', 'year': 2024, 'college': '공과대학', 'metadata': {'지표': index}}
+            for index in range(3)
+        ]
+        locks_while_loading = set()
+
+        def on_progress(rows):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT relation::regclass::text, mode FROM pg_locks
+                    WHERE pid = pg_backend_pid() AND relation IN ('uploaded_data'::regclass, 'uploaded_data_kpi'::regclass)
+                    """
+                )
+                locks_while_loading.update(cursor.fetchall())
+
+        with patch('apps.data_upload.repositories.BULK_INSERT_BATCH_SIZE', 2):
+            result = DataUploadRepository().replace_uploaded_data(upload_log.id, 'kpi', records, on_progress)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT count(*) FROM pg_index
+                WHERE indrelid = 'uploaded_data_kpi'::regclass AND indisprimary
+                """
+            )
+            primary_keys = cursor.fetchone()[0]
+
+        assert result == (2, 3)
+        assert ('uploaded_data_kpi', 'AccessExclusiveLock') not in locks_while_loading
+        assert ('uploaded_data', 'AccessExclusiveLock') not in locks_while_loading
+        assert sorted(
+            UploadedData.objects.filter(data_type='kpi').values_list('year', 'metadata__지표')
+        ) == [(2024, 0), (2024, 1), (2024, 2)]
+        assert UploadedData.objects.filter(data_type='student').count() == 1
+        assert primary_keys == 1
+
+    def test_failed_replacement_keeps_previous_rows(self, upload_log):
+        """
+        Given: Rows of a data type
+        When: A replacement fails while loading (record of another type)
+        Then: Should roll back to the previous partition and rows
+        """
+        UploadedData.objects.create(upload_log_id=upload_log.id, data_type='kpi', year=2023, metadata={})
+        records = [{'data_type': 'kpi', 'metadata': {}}, {'data_type': 'student', 'metadata': {}}]
+
+        with pytest.raises(DatabaseError):
+            with transaction.atomic():
+                DataUploadRepository().replace_uploaded_data(upload_log.id, 'kpi', records)
+
+        assert list(UploadedData.objects.filter(data_type='kpi').values_list('year', flat=True)) == [2023]
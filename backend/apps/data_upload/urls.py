@@ -2,7 +2,15 @@
 URL routing for data upload.
 """
 from django.urls import path
-from .views import DataUploadView, DataUploadListView, DataStatisticsView, DataDeleteView
+from .views import (
+    DataUploadView,
+    DataUploadListView,
+    DataStatisticsView,
+    DataDeleteView,
+    DatasetExportView,
+    DataEventsView,
+    DataEventsTicketView,
+)
 
 app_name = 'data_upload'
 
@@ -11,4 +19,7 @@ urlpatterns = [
     path('logs/', DataUploadListView.as_view(), name='logs'),
     path('statistics/', DataStatisticsView.as_view(), name='statistics'),
     path('delete/<int:log_id>/', DataDeleteView.as_view(), name='delete'),
+    path('export/<str:data_type>/', DatasetExportView.as_view(), name='export'),
+    path('events/', DataEventsView.as_view(), name='events'),
+    path('events/ticket/', DataEventsTicketView.as_view(), name='events-ticket'),
 ]
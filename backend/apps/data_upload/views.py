@@ -1,12 +1,32 @@
 """
 Views for data upload.
 """
+import tempfile
+import time
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connection
+from django.http import FileResponse, JsonResponse, StreamingHttpResponse
+from django.views import View
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
+from apps.authentication.authentication import CustomJWTAuthentication
+from apps.authentication.models import User
+from apps.core.cache import cache_is_shared
 from apps.core.permissions import IsAdminUser
+from apps.core.renderers import CSVRenderer, ParquetRenderer
+from .events import (
+    EVENTS_MAX_AGE,
+    EVENTS_TICKET_TIMEOUT,
+    event_stream,
+    issue_stream_ticket,
+    redeem_stream_ticket,
+)
 from .services import DataUploadService
 from .serializers import (
     DataUploadLogSerializer,
@@ -166,3 +186,165 @@ class DataDeleteView(APIView):
                 {'error': f'서버 오류가 발생했습니다: {str(e)}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class DatasetExportView(APIView):
+    """
+    GET /api/data-upload/export/<data_type>/?format=csv|parquet
+    
+    데이터 타입 전체 행 내보내기 API (관리자 전용, BI 추출용)
+    
+    metadata 키를 컬럼으로 펼친 결과를 PostgreSQL COPY로 생성한다.
+    CSV는 스트리밍으로, Parquet는 임시 파일에 작성한 뒤 전송한다.
+    """
+    
+    permission_classes = [IsAdminUser]
+    renderer_classes = [
+        CSVRenderer,
+        *([ParquetRenderer] if ParquetRenderer.available else []),
+    ]
+    
+    def get(self, request, data_type):
+        """Export a dataset as CSV or Parquet."""
+        file_format = request.accepted_renderer.format
+        filename = f'{data_type}.{file_format}'
+        
+        try:
+            service = DataUploadService()
+            
+            if file_format == ParquetRenderer.format:
+                output = tempfile.TemporaryFile()
+                service.export_dataset(data_type, output, file_format=file_format)
+                output.seek(0)
+                response = FileResponse(output, as_attachment=True, filename=filename)
+                response['Content-Type'] = ParquetRenderer.media_type
+                return response
+            
+            response = StreamingHttpResponse(
+                service.iter_dataset_csv(data_type),
+                content_type=f'{CSVRenderer.media_type}; charset={CSVRenderer.charset}',
+            )
+            response['Content-Disposition'] = f'attachment; filename="{filename}"'
+            return response
+            
+        except DataUploadError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+
+def _events_unavailable() -> bool:
+    """
+    Whether the event stream is disabled for lack of a shared cache.
+    
+    Tickets and upload progress live in the cache; with per-process memory a
+    stream on another worker would miss both (a DEBUG uvicorn server is a single process).
+    """
+    return not cache_is_shared() and not settings.DEBUG
+
+
+def _events_unavailable_response(detail: str = 'The event stream requires a shared cache (set REDIS_URL).') -> JsonResponse:
+    return JsonResponse({'detail': detail}, status=503)
+
+
+class DataEventsTicketView(APIView):
+    """
+    POST /api/data-upload/events/ticket/
+    
+    이벤트 스트림용 일회용 티켓 발급 (EventSource는 Authorization 헤더를 보낼 수 없음)
+    
+    발급된 티켓은 EVENTS_TICKET_TIMEOUT초 안에 한 번만 사용할 수 있다.
+    스트림이 끝나면 클라이언트는 새 티켓을 받아 다시 연결한다.
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request):
+        """Issue a stream ticket for the current user."""
+        if _events_unavailable():
+            return _events_unavailable_response()
+        
+        return Response(
+            {
+                'ticket': issue_stream_ticket(request.user.id),
+                'expires_in': EVENTS_TICKET_TIMEOUT,
+            },
+            status=status.HTTP_201_CREATED
+        )
+
+
+def _authenticate_event_stream(request):
+    """
+    스트림 요청 인증: Authorization 헤더의 JWT 또는 ?ticket= 일회용 티켓.
+    
+    Returns:
+        Tuple: (user, 스트림 만료 시각(epoch) - 티켓이면 None)
+        
+    Raises:
+        AuthenticationFailed: 자격 증명이 없거나 유효하지 않은 경우
+    """
+    authentication = CustomJWTAuthentication()
+    try:
+        header = authentication.get_header(request)
+        raw_token = authentication.get_raw_token(header) if header else None
+        if raw_token:
+            validated_token = authentication.get_validated_token(raw_token)
+            return authentication.get_user(validated_token), validated_token['exp']
+        
+        ticket = request.GET.get('ticket')
+        if not ticket:
+            raise AuthenticationFailed('Authentication credentials were not provided.')
+        
+        user_id = redeem_stream_ticket(ticket)
+        user = User.objects.filter(id=user_id, is_active=True).first() if user_id else None
+        if user is None:
+            raise AuthenticationFailed('Stream ticket is invalid, expired or already used.')
+        return user, None
+    finally:
+        # The stream itself needs no database connection; don't hold one open for its lifetime
+        connection.close()
+
+
+class DataEventsView(View):
+    """
+    GET /api/data-upload/events/?ticket=<ticket>
+    
+    업로드 진행 상황 및 데이터셋 버전 변경 이벤트 스트림 (Server-Sent Events)
+    
+    - event: dataset  {'versions': {data_type: version}, 'changed': [data_type]}
+    - event: upload   업로드 진행 상황 (stage, rows_parsed, rows_inserted, ...)
+    
+    EventSource는 POST /events/ticket/ 으로 받은 일회용 티켓으로, 헤더를 보낼 수 있는
+    클라이언트는 Authorization 헤더로 인증한다. JWT를 URL에 싣지 않는다.
+    
+    비동기 뷰로 ASGI 워커에서 실행되어, 열려 있는 연결이 워커를 점유하지 않는다.
+    """
+    
+    async def get(self, request):
+        """Open the event stream."""
+        if not isinstance(request, ASGIRequest):
+            # WSGI servers (runserver included) buffer the async iterator until the stream ends
+            return _events_unavailable_response(
+                'The event stream requires an ASGI server (uvicorn config.asgi:application).'
+            )
+        if _events_unavailable():
+            return _events_unavailable_response()
+        
+        try:
+            user, expires_at = await sync_to_async(_authenticate_event_stream)(request)
+        except AuthenticationFailed as e:
+            # Same body as DRF's 401 responses
+            detail = e.detail if isinstance(e.detail, dict) else {'detail': e.detail}
+            return JsonResponse(detail, status=401)
+        
+        # End the stream when the token expires; the client reconnects with fresh credentials
+        max_age = EVENTS_MAX_AGE if expires_at is None else min(EVENTS_MAX_AGE, expires_at - time.time())
+        
+        response = StreamingHttpResponse(
+            event_stream(user.id, max_age=max_age),
+            content_type='text/event-stream',
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
@@ -0,0 +1,147 @@
+"""
+Benchmark: sync (WSGI) vs async (ASGI) dashboard views under load.
+
+Starts gunicorn twice with the same worker count, once with sync workers
+on config.wsgi and once with uvicorn workers on config.asgi (as in the
+Procfile), and drives each dashboard endpoint with concurrent keep-alive
+clients. Reports requests/sec and p50/p95 latency per endpoint.
+
+Async views run their independent section queries concurrently, and a
+waiting request does not hold a worker, so the difference grows with the
+number of clients per worker. Run it against a database with uploaded
+data (the JWT is minted for the first active admin user):
+
+    cd backend
+    DJANGO_SETTINGS_MODULE=config.settings.development \\
+        python benchmarks/bench_async_views.py --workers 2 --clients 32 --duration 10
+"""
+import argparse
+import http.client
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework_simplejwt.tokens import RefreshToken  # noqa: E402
+
+from apps.authentication.models import User  # noqa: E402
+
+
+DEFAULT_PATHS = (
+    '/api/dashboard/publications/',
+    '/api/dashboard/research/',
+    '/api/dashboard/students/',
+    '/api/dashboard/bootstrap/',
+)
+
+SERVERS = (
+    ('sync', ['config.wsgi', '--worker-class', 'sync']),
+    ('async', ['config.asgi', '--worker-class', 'uvicorn.workers.UvicornWorker']),
+)
+
+
+def mint_token() -> str:
+    user = User.objects.filter(role='admin', is_active=True).order_by('id').first()
+    if user is None:
+        sys.exit('No active admin user to authenticate the benchmark requests.')
+    return str(RefreshToken.for_user(user).access_token)
+
+
+def start_server(args, port: int, workers: int) -> subprocess.Popen:
+    server = subprocess.Popen(
+        ['gunicorn', *args, '--workers', str(workers), '--bind', f'127.0.0.1:{port}', '--log-level', 'warning'],
+        cwd=BACKEND_DIR,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    sys.exit(f'Server on port {port} did not start')
+
+
+def run_load(port: int, path: str, token: str, clients: int, duration: float):
+    """Each client thread sends requests back to back on one connection until the deadline."""
+    latencies, errors = [], []
+    lock = threading.Lock()
+    headers = {'Authorization': f'Bearer {token}', 'Accept-Encoding': 'identity'}
+    deadline = time.monotonic() + duration
+
+    def client():
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                ok = response.status == 200
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+                ok = False
+            with lock:
+                (latencies if ok else errors).append(time.perf_counter() - started)
+        connection.close()
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, len(errors), time.monotonic() - started
+
+
+def report(label: str, path: str, latencies, errors: int, elapsed: float) -> None:
+    if not latencies:
+        print(f'{label:<6} {path:<32} no successful requests ({errors} errors)')
+        return
+    p50 = statistics.median(latencies) * 1000
+    p95 = statistics.quantiles(latencies, n=20)[-1] * 1000 if len(latencies) > 1 else p50
+    print(
+        f'{label:<6} {path:<32} {len(latencies) / elapsed:>8.1f} req/s  '
+        f'p50 {p50:>8.1f} ms  p95 {p95:>8.1f} ms  errors {errors}'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds per endpoint and server')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--paths', nargs='+', default=list(DEFAULT_PATHS))
+    args = parser.parse_args()
+
+    token = mint_token()
+    print(f'{args.workers} workers, {args.clients} clients, {args.duration:.0f} s per endpoint')
+
+    for label, server_args in SERVERS:
+        server = start_server(server_args, args.port, args.workers)
+        try:
+            for path in args.paths:
+                # Warm the result cache so both servers measure steady state
+                run_load(args.port, path, token, clients=1, duration=0.5)
+                report(label, path, *run_load(args.port, path, token, args.clients, args.duration))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark: dashboard JSON rendering and bytes on the wire.
+
+Renders synthetic publication and student list responses (same shape as
+/api/dashboard/publications/ and /students/) with DRF's JSONRenderer and
+ORJSONRenderer, and reports render time plus raw, gzip and brotli sizes as
+produced by CompressionMiddleware. No database is needed:
+
+    cd backend
+    python benchmarks/bench_json_rendering.py --rows 20000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.utils.text import compress_string  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from apps.core import middleware  # noqa: E402
+from apps.core.renderers import ORJSONRenderer  # noqa: E402
+
+
+def publication_response(count: int) -> dict:
+    data = [
+        {
+            'id': n,
+            'year': 2015 + n % 10,
+            'college': f'단과대학{n % 12}',
+            'department': f'학과{n % 80}',
+            '논문ID': f'PUB-{n}',
+            '논문제목': f'벤치마크 논문 제목 {n}',
+            '주저자': f'저자{n % 500}',
+            '참여저자': f'저자{n % 37};저자{n % 41}',
+            '학술지명': f'학술지{n % 40}',
+            '저널등급': 'SCIE' if n % 3 == 0 else 'KCI',
+            'Impact_Factor': round((n % 100) / 10.0, 1),
+            '게재일': '2024-01-01',
+        }
+        for n in range(count)
+    ]
+    trends = [{'year': 2015 + year, 'count': count // 10} for year in range(10)]
+    return {'count': count, 'data': data, 'trends': trends, 'filters': {}}
+
+
+def student_response(count: int) -> dict:
+    data = [
+        {
+            'id': n,
+            'year': 2015 + n % 10,
+            'college': f'단과대학{n % 12}',
+            'department': f'학과{n % 80}',
+            '학번': f'20{n:08d}',
+            '이름': f'학생{n}',
+            '학년': n % 4 + 1,
+            '과정구분': '학사' if n % 5 else '석사',
+            '학적상태': '재학' if n % 7 else '휴학',
+            '성별': '남' if n % 2 else '여',
+            '입학년도': 2015 + n % 10,
+            '지도교수': f'교수{n % 200}',
+            '이메일': f'student{n}@example.ac.kr',
+        }
+        for n in range(count)
+    ]
+    statistics = {'total_students': count, 'by_program': {'학사': count}, 'by_status': {'재학': count}}
+    return {'count': count, 'data': data, 'statistics': statistics, 'filters': {}}
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=20_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, payload in (
+        ('publications', publication_response(args.rows)),
+        ('students', student_response(args.rows)),
+    ):
+        print(f'{name} ({args.rows:,} rows)')
+        for renderer in (JSONRenderer(), ORJSONRenderer()):
+            seconds = best_of(lambda: renderer.render(payload), args.repeat)
+            print(f'  {type(renderer).__name__:<16} render {seconds * 1000:>8.1f} ms')
+
+        body = ORJSONRenderer().render(payload)
+        print(f'  {"raw":<16} {len(body):>12,} bytes')
+
+        started = time.perf_counter()
+        gzipped = compress_string(body)
+        print(f'  {"gzip":<16} {len(gzipped):>12,} bytes  {(time.perf_counter() - started) * 1000:>8.1f} ms')
+
+        if middleware.brotli is not None:
+            started = time.perf_counter()
+            compressed = middleware.brotli.compress(body, quality=middleware.COMPRESSION_BROTLI_QUALITY)
+            print(f'  {"br":<16} {len(compressed):>12,} bytes  {(time.perf_counter() - started) * 1000:>8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
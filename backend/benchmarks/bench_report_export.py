@@ -0,0 +1,87 @@
+"""
+Benchmark: report export memory.
+
+Exports the first 100 rows and then the whole synthetic publication
+report as CSV and XLSX through the same path as ReportExportView, and
+reports rows/sec and peak Python memory (tracemalloc). The peak should
+stay roughly flat as the row count grows.
+
+Rows are inserted inside a transaction that is rolled back (see
+bench_row_iteration.py):
+
+    cd backend
+    DJANGO_SETTINGS_MODULE=config.settings.development \\
+        python benchmarks/bench_report_export.py --rows 1000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from itertools import islice
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+
+from apps.core.renderers import CSVRenderer, XLSXRenderer  # noqa: E402
+from apps.dashboard.services import DashboardService  # noqa: E402
+from bench_row_iteration import seed_rows  # noqa: E402
+
+
+def export_csv(limit):
+    columns, rows = DashboardService().iter_report_rows('publications')
+    size = 0
+    for chunk in CSVRenderer.stream(islice(rows, limit), columns):
+        size += len(chunk)
+    return size
+
+
+def export_xlsx(limit):
+    columns, rows = DashboardService().iter_report_rows('publications')
+    with tempfile.TemporaryFile() as output:
+        XLSXRenderer.write(output, islice(rows, limit), columns, title='publications')
+        return output.tell()
+
+
+def measure(label: str, export, limit) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = export(limit)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = limit if limit is not None else '   all'
+    print(
+        f'{label:<6} {count:>9} rows  {elapsed:>8.2f} s  {size / 1024 / 1024:>9,.1f} MiB file  '
+        f'peak {peak / 1024 / 1024:>7,.1f} MiB'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    if connection.vendor != 'postgresql':
+        sys.exit('This benchmark needs PostgreSQL (server-side cursors, generate_series).')
+
+    with transaction.atomic():
+        seed_rows(args.rows)
+
+        for label, export in (('csv', export_csv), ('xlsx', export_xlsx)):
+            measure(label, export, 100)
+            measure(label, export, None)
+
+        transaction.set_rollback(True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: dashboard list row iteration.
+
+Compares the previous row path (full UploadedData model instances copied
+into dicts) with DashboardRepository's values_list() rows fetched through a
+server-side cursor, on a synthetic publication dataset. Reports rows/sec
+and peak Python memory (tracemalloc) for building the full list and for
+streaming the rows.
+
+Rows are inserted inside a transaction that is rolled back, so the script
+can run against a scratch copy of the PostgreSQL database:
+
+    cd backend
+    DJANGO_SETTINGS_MODULE=config.settings.development \\
+        python benchmarks/bench_row_iteration.py --rows 500000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+
+from apps.authentication.models import User  # noqa: E402
+from apps.dashboard.repositories import ROW_COLUMNS, DashboardRepository  # noqa: E402
+from apps.data_upload.models import DataUploadLog, UploadedData  # noqa: E402
+
+
+DATA_TYPE = 'publication'
+
+
+def seed_rows(count: int) -> None:
+    """Insert count synthetic publication rows with generate_series."""
+    user = User(username='bench_row_iteration', role='admin')
+    user.set_password('bench')
+    user.save()
+    log = DataUploadLog.objects.create(user_id=user.id, filename='bench.csv', status='success')
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO uploaded_data (upload_log_id, data_type, year, college, department, metadata)
+            SELECT
+                %s,
+                %s,
+                2015 + (n %% 10),
+                '단과대학' || (n %% 12),
+                '학과' || (n %% 80),
+                jsonb_build_object(
+                    '논문ID', 'PUB-' || n,
+                    '논문제목', '벤치마크 논문 제목 ' || n,
+                    '주저자', '저자' || (n %% 500),
+                    '학술지명', '학술지' || (n %% 40),
+                    '저널등급', CASE WHEN n %% 3 = 0 THEN 'SCIE' ELSE 'KCI' END,
+                    'Impact_Factor', round((n %% 100) / 10.0, 1),
+                    '게재일', '2024-01-01'
+                )
+            FROM generate_series(1, %s) AS n
+            """,
+            [log.id, DATA_TYPE, count],
+        )
+
+
+def instance_rows():
+    """Previous implementation: model instances, then a dict per row."""
+    columns = ROW_COLUMNS[DATA_TYPE]
+    for item in UploadedData.objects.filter(data_type=DATA_TYPE):
+        row = {column: getattr(item, column) for column in columns}
+        row.update(item.metadata)
+        yield row
+
+
+def value_rows():
+    """Current implementation: values_list() through a server-side cursor."""
+    return DashboardRepository().iter_rows(DATA_TYPE)
+
+
+def measure(label: str, make_rows, materialize: bool) -> None:
+    def run():
+        rows = make_rows()
+        if materialize:
+            return len(list(rows))
+        return sum(1 for _ in rows)
+
+    started = time.perf_counter()
+    count = run()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f'{label:<28} {count:>9,} rows  {count / elapsed:>12,.0f} rows/s  '
+        f'peak {peak / 1024 / 1024:>9,.1f} MiB'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=500_000)
+    args = parser.parse_args()
+
+    if connection.vendor != 'postgresql':
+        sys.exit('This benchmark needs PostgreSQL (server-side cursors, generate_series).')
+
+    with transaction.atomic():
+        seed_rows(args.rows)
+
+        measure('instances, list', instance_rows, materialize=True)
+        measure('values_list, list', value_rows, materialize=True)
+        measure('instances, streamed', instance_rows, materialize=False)
+        measure('values_list, streamed', value_rows, materialize=False)
+
+        transaction.set_rollback(True)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,13 @@
 """
 ASGI config for the project.
+
+Served by gunicorn with uvicorn workers (see Procfile), so async views such
+as the data event stream do not hold a worker while their connection is open.
 """
 import os
 from django.core.asgi import get_asgi_application
+from apps.core.asgi import close_event_streams_on_disconnect
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.production')
 
-application = get_asgi_application()
+application = close_event_streams_on_disconnect(get_asgi_application())
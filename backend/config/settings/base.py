@@ -44,7 +44,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'apps.core.middleware.ASGIStreamingMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'apps.core.middleware.CompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -76,17 +78,80 @@ TEMPLATES = [
 WSGI_APPLICATION = 'config.wsgi.application'
 
 # Database
+def database_pool():
+    """
+    Connection pool settings for the apps.core.postgresql_pool backend
+    (DB_POOL_*; unset values use apps.core.postgresql_pool.pool.POOL_DEFAULTS).
+    Django returns the connection to the pool after each request, so use
+    it with CONN_MAX_AGE = 0.
+    """
+    pool = {}
+    for key in ('MIN_SIZE', 'MAX_SIZE', 'TIMEOUT', 'MAX_IDLE', 'MAX_LIFETIME', 'CHECK_AFTER'):
+        value = os.environ.get(f'DB_POOL_{key}')
+        if value:
+            pool[key] = float(value)
+    return pool
+
+
+def disable_server_side_cursors(port):
+    """
+    Whether QuerySet.iterator() must avoid server-side cursors. Django
+    declares them WITH HOLD outside transactions, so they do not survive a
+    transaction-mode pooler (pgbouncer, Supabase's pooler on port 6543)
+    that hands the next statement to another server connection.
+    DB_DISABLE_SERVER_SIDE_CURSORS overrides the port-based default.
+    """
+    value = os.environ.get('DB_DISABLE_SERVER_SIDE_CURSORS')
+    if value:
+        return value == 'True'
+    return str(port) == '6543'
+
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'apps.core.postgresql_pool',
         'NAME': os.environ.get('DB_NAME', 'university_dashboard'),
         'USER': os.environ.get('DB_USER', 'postgres'),
         'PASSWORD': os.environ.get('DB_PASSWORD', ''),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        'CONN_MAX_AGE': 0,
+        'POOL': database_pool(),
+        'DISABLE_SERVER_SIDE_CURSORS': disable_server_side_cursors(os.environ.get('DB_PORT', '5432')),
     }
 }
 
+
+def replica_database(primary):
+    """
+    Read replica settings (DB_REPLICA_*), falling back to the primary's
+    credentials. DB_REPLICA_NAME allows a second database on the same
+    server for local testing.
+    """
+    port = os.environ.get('DB_REPLICA_PORT', primary['PORT'])
+    return {
+        **primary,
+        'NAME': os.environ.get('DB_REPLICA_NAME', primary['NAME']),
+        'USER': os.environ.get('DB_REPLICA_USER', primary['USER']),
+        'PASSWORD': os.environ.get('DB_REPLICA_PASSWORD', primary['PASSWORD']),
+        'HOST': os.environ['DB_REPLICA_HOST'],
+        'PORT': port,
+        'DISABLE_SERVER_SIDE_CURSORS': disable_server_side_cursors(port),
+        # Tests read and write through the primary connection
+        'TEST': {'MIRROR': 'default'},
+    }
+
+
+# Read replica: dashboard and upload reads go to the replica when DB_REPLICA_HOST is set
+# (apps.core.db_routers.ReplicaRouter); settings modules redefining DATABASES repeat this
+if os.environ.get('DB_REPLICA_HOST'):
+    DATABASES['replica'] = replica_database(DATABASES['default'])
+
+DATABASE_ROUTERS = ['apps.core.db_routers.ReplicaRouter']
+
+# Keep a user's reads on the primary this long after their upload/delete (seconds)
+DATABASE_REPLICA_PIN_SECONDS = int(os.environ.get('DB_REPLICA_PIN_SECONDS', 10))
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -123,6 +188,10 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'apps.authentication.authentication.CustomJWTAuthentication',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'apps.core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_FILTER_BACKENDS': [
@@ -132,6 +201,31 @@ REST_FRAMEWORK = {
     'EXCEPTION_HANDLER': 'apps.core.exception_handlers.custom_exception_handler',
 }
 
+# Cache
+# Per-process memory cache by default; set REDIS_URL to share entries across workers
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'default',
+    },
+}
+
+if os.environ.get('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['REDIS_URL'],
+    }
+
+# Response compression (apps.core.middleware.CompressionMiddleware)
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+
+# Dashboard
+# Shared memory-mapped dataset snapshots (one directory per data type and version)
+DASHBOARD_SNAPSHOT_DIR = os.environ.get(
+    'DASHBOARD_SNAPSHOT_DIR',
+    os.path.join(BASE_DIR, 'var', 'snapshots'),
+)
+
 # JWT Settings
 from datetime import timedelta
 
@@ -15,15 +15,21 @@ CORS_ALLOWED_ORIGINS = [
 # Database - using Supabase PostgreSQL
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'apps.core.postgresql_pool',
         'NAME': os.environ.get('DB_NAME', 'postgres'),
         'USER': os.environ.get('DB_USER', 'postgres'),
         'PASSWORD': os.environ.get('DB_PASSWORD', ''),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        'CONN_MAX_AGE': 0,
+        'POOL': database_pool(),
+        'DISABLE_SERVER_SIDE_CURSORS': disable_server_side_cursors(os.environ.get('DB_PORT', '5432')),
     }
 }
 
+if os.environ.get('DB_REPLICA_HOST'):
+    DATABASES['replica'] = replica_database(DATABASES['default'])
+
 # Email Backend for Development
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
@@ -24,19 +24,25 @@ ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', '').split(',')
 # Database - Railway PostgreSQL
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'apps.core.postgresql_pool',
         'NAME': os.environ.get('DB_NAME'),
         'USER': os.environ.get('DB_USER'),
         'PASSWORD': os.environ.get('DB_PASSWORD'),
         'HOST': os.environ.get('DB_HOST'),
         'PORT': os.environ.get('DB_PORT', '5432'),
-        'CONN_MAX_AGE': 600,
+        # Connections are reused through the per-worker pool instead of per thread
+        'CONN_MAX_AGE': 0,
+        'POOL': database_pool(),
+        'DISABLE_SERVER_SIDE_CURSORS': disable_server_side_cursors(os.environ.get('DB_PORT', '5432')),
         'OPTIONS': {
             'connect_timeout': 10,
         }
     }
 }
 
+if os.environ.get('DB_REPLICA_HOST'):
+    DATABASES['replica'] = replica_database(DATABASES['default'])
+
 # Static files settings for production
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATIC_URL = '/static/'
@@ -46,12 +52,19 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 MEDIA_URL = '/media/'
 
 # Whitenoise for static files (Railway에서 정적 파일 서빙)
-MIDDLEWARE.insert(1, 'whitenoise.middleware.WhiteNoiseMiddleware')
+MIDDLEWARE.insert(
+    MIDDLEWARE.index('django.middleware.security.SecurityMiddleware') + 1,
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+)
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 # CORS for Production
 CORS_ALLOWED_ORIGINS = os.environ.get('CORS_ALLOWED_ORIGINS', '').split(',')
 
+# Dashboard: serve the previous result for this many seconds after an upload while
+# recomputing in the background (0 disables; the uploader may briefly see pre-upload data)
+DASHBOARD_STALE_WHILE_REVALIDATE = int(os.environ.get('DASHBOARD_STALE_WHILE_REVALIDATE', 60))
+
 # Email Backend for Production (선택사항)
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = os.environ.get('EMAIL_HOST', 'smtp.gmail.com')
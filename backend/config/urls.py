@@ -15,4 +15,5 @@ urlpatterns = [
     path('api/users/', include('apps.users.urls')),
     path('api/data-upload/', include('apps.data_upload.urls')),
     path('api/dashboard/', include('apps.dashboard.urls')),
+    path('api/health/', include('apps.core.urls')),
 ]
@@ -2,6 +2,8 @@
 Pytest configuration and fixtures
 """
 import os
+from pathlib import Path
+
 import django
 from django.conf import settings
 
@@ -10,8 +12,11 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
 django.setup()
 
 import pytest
+from django.db import connection
 from rest_framework.test import APIClient
 
+SUPABASE_MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / 'supabase' / 'migrations'
+
 
 @pytest.fixture
 def api_client():
@@ -24,3 +29,15 @@ def db_setup(db):
     """Setup test database"""
     # This fixture ensures database is available for tests
     return db
+
+
+@pytest.fixture(scope='session')
+def supabase_schema(django_db_setup, django_db_blocker):
+    """Create the unmanaged tables from the supabase SQL migrations (users comes from Django)."""
+    with django_db_blocker.unblock():
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass('uploaded_data')")
+            if cursor.fetchone()[0] is None:
+                for path in sorted(SUPABASE_MIGRATIONS_DIR.glob('*.sql')):
+                    if 'example' not in path.name:
+                        cursor.execute(path.read_text(encoding='utf-8'))
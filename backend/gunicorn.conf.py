@@ -0,0 +1,38 @@
+"""
+Gunicorn configuration.
+
+Picked up automatically from the working directory (see Procfile). Command
+line options still take precedence.
+"""
+import os
+
+
+def _open_database_pools(worker):
+    """Open each pooled database's connections before the worker takes requests."""
+    from django.db import connections
+
+    for alias in connections:
+        if connections.settings[alias]['ENGINE'] != 'apps.core.postgresql_pool':
+            continue
+        try:
+            # The first checkout starts the pool, which then fills up to MIN_SIZE
+            connections[alias].ensure_connection()
+            connections[alias].close()
+        except Exception as e:
+            worker.log.warning(f'Could not open database pool {alias}: {e}')
+
+
+def post_worker_init(worker):
+    """
+    Open database pools in each new worker, and warm the dashboard cache
+    when DASHBOARD_WARM_ON_BOOT is set.
+    """
+    _open_database_pools(worker)
+
+    if os.environ.get('DASHBOARD_WARM_ON_BOOT', 'False').lower() not in ('1', 'true', 'yes'):
+        return
+
+    from apps.dashboard.services import schedule_warm_up
+
+    schedule_warm_up()
+    worker.log.info('Scheduled dashboard cache warm-up')
@@ -0,0 +1,26 @@
+-- Migration: 0004_dataset_versions.sql
+-- Description: Per data type dataset version used for dashboard ETags and cache keys
+
+BEGIN;
+
+-- ============================================================================
+-- 1. dataset_versions 테이블
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS dataset_versions (
+    data_type VARCHAR(50) PRIMARY KEY CHECK (data_type IN ('kpi', 'publication', 'research', 'student')),
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 데이터 타입별 초기 버전
+INSERT INTO dataset_versions (data_type, version)
+VALUES ('kpi', 1), ('publication', 1), ('research', 1), ('student', 1)
+ON CONFLICT (data_type) DO NOTHING;
+
+-- updated_at 자동 업데이트 트리거
+CREATE TRIGGER trigger_dataset_versions_update_timestamp
+BEFORE UPDATE ON dataset_versions
+FOR EACH ROW
+EXECUTE FUNCTION update_timestamp();
+
+COMMIT;
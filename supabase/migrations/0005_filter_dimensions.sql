@@ -0,0 +1,43 @@
+-- Migration: 0005_filter_dimensions.sql
+-- Description: Filter dimension table (distinct year/college/department/semester per data type)
+
+BEGIN;
+
+-- ============================================================================
+-- 1. dashboard_filter_dimensions 테이블
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS dashboard_filter_dimensions (
+    id BIGSERIAL PRIMARY KEY,
+    data_type VARCHAR(50) NOT NULL,
+    dimension VARCHAR(20) NOT NULL CHECK (dimension IN ('year', 'college', 'department', 'semester')),
+    value VARCHAR(100) NOT NULL,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (data_type, dimension, value)
+);
+
+CREATE INDEX IF NOT EXISTS idx_dashboard_filter_dimensions_dimension
+    ON dashboard_filter_dimensions(dimension);
+
+-- ============================================================================
+-- 2. 기존 데이터로 초기화
+-- ============================================================================
+INSERT INTO dashboard_filter_dimensions (data_type, dimension, value, row_count)
+SELECT data_type, 'year', year::text, COUNT(*)
+FROM uploaded_data WHERE year IS NOT NULL
+GROUP BY data_type, year
+UNION ALL
+SELECT data_type, 'college', college, COUNT(*)
+FROM uploaded_data WHERE college IS NOT NULL
+GROUP BY data_type, college
+UNION ALL
+SELECT data_type, 'department', department, COUNT(*)
+FROM uploaded_data WHERE department IS NOT NULL
+GROUP BY data_type, department
+UNION ALL
+SELECT data_type, 'semester', semester, COUNT(*)
+FROM uploaded_data WHERE semester IS NOT NULL
+GROUP BY data_type, semester
+ON CONFLICT (data_type, dimension, value) DO NOTHING;
+
+COMMIT;
@@ -0,0 +1,94 @@
+-- Migration: 0006_dashboard_rollups.sql
+-- Description: Pre-aggregated dashboard rollups per data type (year, semester, college, department grain)
+
+BEGIN;
+
+-- ============================================================================
+-- 1. dashboard_rollups 테이블
+-- ============================================================================
+-- metric_key = ''      : 행 수(row_count)와 총연구비 합계(budget_sum)
+-- metric_key = 과정구분 : 학생 과정구분별 행 수
+-- metric_key = 학적상태 : 학생 학적상태별 행 수
+-- metric_key = 과제번호 : 연구 과제번호별 행 수 (과제 수 중복 제거용)
+CREATE TABLE IF NOT EXISTS dashboard_rollups (
+    id BIGSERIAL PRIMARY KEY,
+    data_type VARCHAR(50) NOT NULL,
+    year INTEGER,
+    semester VARCHAR(10),
+    college VARCHAR(100),
+    department VARCHAR(100),
+    metric_key VARCHAR(50) NOT NULL DEFAULT '',
+    metric_value VARCHAR(255),
+    row_count INTEGER NOT NULL DEFAULT 0,
+    budget_sum BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_dashboard_rollups_type_metric_year
+    ON dashboard_rollups(data_type, metric_key, year);
+
+-- ============================================================================
+-- 2. 데이터 타입별 롤업 재계산 함수 (업로드/삭제 트랜잭션 안에서 호출)
+-- ============================================================================
+CREATE OR REPLACE FUNCTION refresh_dashboard_rollups(p_data_type VARCHAR)
+RETURNS INTEGER AS $$
+DECLARE
+    rollup_count INTEGER;
+BEGIN
+    DELETE FROM dashboard_rollups WHERE data_type = p_data_type;
+
+    -- 기본 grain: 행 수와 총연구비 합계 (정수로 변환할 수 없는 값은 0)
+    INSERT INTO dashboard_rollups
+        (data_type, year, semester, college, department, metric_key, metric_value, row_count, budget_sum)
+    SELECT
+        data_type, year, semester, college, department, '', NULL, COUNT(*),
+        COALESCE(SUM(
+            CASE
+                WHEN jsonb_typeof(metadata->'총연구비') = 'number'
+                    THEN trunc((metadata->>'총연구비')::numeric)::bigint
+                WHEN metadata->>'총연구비' ~ '^\s*[-+]?[0-9]+\s*$'
+                    THEN btrim(metadata->>'총연구비')::bigint
+                ELSE 0
+            END
+        ), 0)
+    FROM uploaded_data
+    WHERE data_type = p_data_type
+    GROUP BY data_type, year, semester, college, department;
+
+    -- 학생: 과정구분 / 학적상태 분포 (키가 없으면 'Unknown')
+    IF p_data_type = 'student' THEN
+        INSERT INTO dashboard_rollups
+            (data_type, year, semester, college, department, metric_key, metric_value, row_count, budget_sum)
+        SELECT data_type, year, semester, college, department, m.key, m.value, COUNT(*), 0
+        FROM uploaded_data
+        CROSS JOIN LATERAL (
+            VALUES
+                ('과정구분', CASE WHEN metadata ? '과정구분' THEN metadata->>'과정구분' ELSE 'Unknown' END),
+                ('학적상태', CASE WHEN metadata ? '학적상태' THEN metadata->>'학적상태' ELSE 'Unknown' END)
+        ) AS m(key, value)
+        WHERE data_type = p_data_type
+        GROUP BY data_type, year, semester, college, department, m.key, m.value;
+    END IF;
+
+    -- 연구: 과제번호 (과제 수 = 과제번호 고유 값 수)
+    IF p_data_type = 'research' THEN
+        INSERT INTO dashboard_rollups
+            (data_type, year, semester, college, department, metric_key, metric_value, row_count, budget_sum)
+        SELECT data_type, year, semester, college, department, '과제번호', metadata->>'과제번호', COUNT(*), 0
+        FROM uploaded_data
+        WHERE data_type = p_data_type
+          AND COALESCE(metadata->>'과제번호', '') <> ''
+        GROUP BY data_type, year, semester, college, department, metadata->>'과제번호';
+    END IF;
+
+    SELECT COUNT(*) INTO rollup_count FROM dashboard_rollups WHERE data_type = p_data_type;
+    RETURN rollup_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- 3. 기존 데이터로 초기화
+-- ============================================================================
+SELECT refresh_dashboard_rollups(data_type)
+FROM (VALUES ('kpi'), ('publication'), ('research'), ('student')) AS t(data_type);
+
+COMMIT;
@@ -0,0 +1,111 @@
+-- Migration: 0007_dataset_changes.sql
+-- Description: Row-level change log per dataset version (delta sync for clients keeping local copies)
+
+BEGIN;
+
+-- ============================================================================
+-- 1. dataset_row_state 테이블 (현재 버전의 행 키 -> uploaded_data.id)
+-- ============================================================================
+-- row_key = md5(year, semester, college, department, metadata) || ':' || 같은 내용 행의 순번
+-- 전체 교체 업로드로 id가 바뀌어도 내용이 같은 행은 같은 키를 가진다.
+CREATE TABLE IF NOT EXISTS dataset_row_state (
+    data_type VARCHAR(50) NOT NULL,
+    row_key VARCHAR(64) NOT NULL,
+    row_id BIGINT NOT NULL,
+    PRIMARY KEY (data_type, row_key)
+);
+
+-- ============================================================================
+-- 2. dataset_changes 테이블 (버전별 추가/삭제 tombstone)
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS dataset_changes (
+    id BIGSERIAL PRIMARY KEY,
+    data_type VARCHAR(50) NOT NULL,
+    version BIGINT NOT NULL,
+    row_key VARCHAR(64) NOT NULL,
+    op CHAR(1) NOT NULL CHECK (op IN ('I', 'D'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_dataset_changes_type_version
+    ON dataset_changes(data_type, version);
+
+-- 변경 로그로 응답할 수 있는 가장 오래된 since 버전 (이보다 오래되면 전체 재동기화)
+ALTER TABLE dataset_versions ADD COLUMN IF NOT EXISTS changes_from BIGINT NOT NULL DEFAULT 0;
+
+-- ============================================================================
+-- 3. 변경 기록 함수 (업로드/삭제 트랜잭션 안에서 버전 증가 후 호출)
+-- ============================================================================
+CREATE OR REPLACE FUNCTION record_dataset_changes(
+    p_data_type VARCHAR,
+    p_version BIGINT,
+    p_keep_versions INTEGER
+)
+RETURNS INTEGER AS $$
+DECLARE
+    change_count INTEGER;
+    removed_count INTEGER;
+BEGIN
+    DROP TABLE IF EXISTS pg_temp.dataset_new_state;
+    CREATE TEMP TABLE dataset_new_state ON COMMIT DROP AS
+    SELECT
+        content_hash || ':' || row_number() OVER (PARTITION BY content_hash ORDER BY id) AS row_key,
+        id AS row_id
+    FROM (
+        SELECT id, md5(jsonb_build_array(year, semester, college, department, metadata)::text) AS content_hash
+        FROM uploaded_data
+        WHERE data_type = p_data_type
+    ) AS rows;
+
+    -- 새로 생긴 행
+    INSERT INTO dataset_changes (data_type, version, row_key, op)
+    SELECT p_data_type, p_version, n.row_key, 'I'
+    FROM dataset_new_state n
+    WHERE NOT EXISTS (
+        SELECT 1 FROM dataset_row_state s
+        WHERE s.data_type = p_data_type AND s.row_key = n.row_key
+    );
+    GET DIAGNOSTICS change_count = ROW_COUNT;
+
+    -- 사라진 행 (tombstone)
+    INSERT INTO dataset_changes (data_type, version, row_key, op)
+    SELECT p_data_type, p_version, s.row_key, 'D'
+    FROM dataset_row_state s
+    WHERE s.data_type = p_data_type
+      AND NOT EXISTS (SELECT 1 FROM dataset_new_state n WHERE n.row_key = s.row_key);
+    GET DIAGNOSTICS removed_count = ROW_COUNT;
+
+    DELETE FROM dataset_row_state WHERE data_type = p_data_type;
+    INSERT INTO dataset_row_state (data_type, row_key, row_id)
+    SELECT p_data_type, row_key, row_id FROM dataset_new_state;
+
+    -- 보존 기간이 지난 변경 삭제
+    IF p_keep_versions > 0 AND p_version - p_keep_versions > 0 THEN
+        DELETE FROM dataset_changes
+        WHERE data_type = p_data_type AND version <= p_version - p_keep_versions;
+
+        UPDATE dataset_versions
+        SET changes_from = GREATEST(changes_from, p_version - p_keep_versions)
+        WHERE data_type = p_data_type;
+    END IF;
+
+    RETURN change_count + removed_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- 4. 기존 데이터로 초기화 (현재 버전부터 변경 추적)
+-- ============================================================================
+INSERT INTO dataset_row_state (data_type, row_key, row_id)
+SELECT
+    data_type,
+    content_hash || ':' || row_number() OVER (PARTITION BY data_type, content_hash ORDER BY id),
+    id
+FROM (
+    SELECT id, data_type, md5(jsonb_build_array(year, semester, college, department, metadata)::text) AS content_hash
+    FROM uploaded_data
+) AS rows
+ON CONFLICT (data_type, row_key) DO NOTHING;
+
+UPDATE dataset_versions SET changes_from = version;
+
+COMMIT;
@@ -0,0 +1,138 @@
+-- Migration: 0008_partition_uploaded_data.sql
+-- Description: LIST partitioning of uploaded_data by data_type, replacement uploads swap in a staged partition
+
+BEGIN;
+
+-- ============================================================================
+-- 1. 기존 테이블을 옆으로 옮기고 id 시퀀스를 분리
+-- ============================================================================
+ALTER TABLE uploaded_data RENAME TO uploaded_data_unpartitioned;
+ALTER SEQUENCE uploaded_data_id_seq OWNED BY NONE;
+DROP TRIGGER IF EXISTS trigger_uploaded_data_update_timestamp ON uploaded_data_unpartitioned;
+
+-- ============================================================================
+-- 2. 파티션 테이블 (data_type별 LIST 파티션)
+-- ============================================================================
+-- 파티션 테이블의 PRIMARY KEY는 파티션 키를 포함해야 하므로 (id, data_type)로 둔다.
+-- id는 uploaded_data_id_seq에서만 발급되어 그 자체로 유일하며, id로 시작하는
+-- 기본 키 인덱스가 id 조회에 쓰인다.
+CREATE TABLE uploaded_data (
+    id BIGINT NOT NULL DEFAULT nextval('uploaded_data_id_seq'),
+    upload_log_id BIGINT NOT NULL REFERENCES data_upload_logs(id) ON DELETE CASCADE,
+    data_type VARCHAR(50) NOT NULL CHECK (data_type IN ('kpi', 'publication', 'research', 'student')),
+    year INTEGER,
+    semester VARCHAR(10),
+    college VARCHAR(100),
+    department VARCHAR(100),
+    metadata JSONB NOT NULL DEFAULT '{}'::jsonb,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, data_type)
+) PARTITION BY LIST (data_type);
+
+ALTER SEQUENCE uploaded_data_id_seq OWNED BY uploaded_data.id;
+
+CREATE TABLE uploaded_data_kpi PARTITION OF uploaded_data FOR VALUES IN ('kpi');
+CREATE TABLE uploaded_data_publication PARTITION OF uploaded_data FOR VALUES IN ('publication');
+CREATE TABLE uploaded_data_research PARTITION OF uploaded_data FOR VALUES IN ('research');
+CREATE TABLE uploaded_data_student PARTITION OF uploaded_data FOR VALUES IN ('student');
+
+-- ============================================================================
+-- 3. 기존 데이터 이동 (인덱스는 적재 후 생성)
+-- ============================================================================
+INSERT INTO uploaded_data
+    (id, upload_log_id, data_type, year, semester, college, department, metadata, created_at, updated_at)
+SELECT id, upload_log_id, data_type, year, semester, college, department, metadata, created_at, updated_at
+FROM uploaded_data_unpartitioned;
+
+DROP TABLE uploaded_data_unpartitioned;
+
+-- ============================================================================
+-- 4. 인덱스 및 트리거 (부모에 만들면 모든 파티션에 적용됨)
+-- ============================================================================
+-- data_type 단독 인덱스는 파티션 프루닝으로 대체되어 만들지 않는다.
+CREATE INDEX IF NOT EXISTS idx_uploaded_data_upload_log_id
+    ON uploaded_data(upload_log_id);
+
+CREATE INDEX IF NOT EXISTS idx_uploaded_data_year
+    ON uploaded_data(year);
+
+CREATE INDEX IF NOT EXISTS idx_uploaded_data_college_department
+    ON uploaded_data(college, department);
+
+CREATE INDEX IF NOT EXISTS idx_uploaded_data_metadata
+    ON uploaded_data USING GIN(metadata);
+
+CREATE TRIGGER trigger_uploaded_data_update_timestamp
+BEFORE UPDATE ON uploaded_data
+FOR EACH ROW
+EXECUTE FUNCTION update_timestamp();
+
+ANALYZE uploaded_data;
+
+-- ============================================================================
+-- 5. 데이터 타입 교체 (교체 업로드 트랜잭션 안에서 호출)
+-- ============================================================================
+-- 새 행은 분리된 스테이징 테이블(uploaded_data_<type>_staging)에 적재하고, 적재가 끝나면
+-- 기존 타입 파티션을 DETACH/DROP한 뒤 스테이징 테이블을 ATTACH한다.
+-- 적재하는 동안에는 uploaded_data를 잠그지 않으므로 조회는 이전 행을 계속 읽는다.
+-- DETACH는 부모 테이블을 ACCESS EXCLUSIVE로 잠그므로 교체 후 커밋까지 (파생 데이터 갱신)
+-- uploaded_data 조회가 대기한다. 대량 DELETE와 달리 dead tuple/VACUUM 부담이 없고,
+-- 인덱스는 ATTACH 시 한 번에 만들어진다. 롤백하면 기존 파티션이 그대로 남는다.
+
+-- 스테이징 테이블 생성 (같은 타입의 동시 교체는 커밋까지 대기)
+CREATE OR REPLACE FUNCTION begin_uploaded_data_replacement(p_data_type VARCHAR)
+RETURNS TEXT AS $$
+DECLARE
+    partition_table TEXT := 'uploaded_data_' || p_data_type;
+    staging_table TEXT := 'uploaded_data_' || p_data_type || '_staging';
+BEGIN
+    IF to_regclass(partition_table) IS NULL THEN
+        RAISE EXCEPTION 'uploaded_data has no partition for data type %', p_data_type;
+    END IF;
+
+    PERFORM pg_advisory_xact_lock(hashtext('uploaded_data_replacement'), hashtext(p_data_type));
+
+    EXECUTE format('DROP TABLE IF EXISTS %I', staging_table);
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE uploaded_data INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        staging_table
+    );
+    -- ATTACH가 파티션 조건 검증을 위해 테이블을 스캔하지 않도록 조건을 미리 둔다
+    EXECUTE format(
+        'ALTER TABLE %I ADD CONSTRAINT %I CHECK (data_type = %L)',
+        staging_table, partition_table || '_data_type_check', p_data_type
+    );
+
+    RETURN staging_table;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 기존 파티션을 스테이징 테이블로 교체하고 제거된 행 수를 반환
+CREATE OR REPLACE FUNCTION swap_uploaded_data_partition(p_data_type VARCHAR)
+RETURNS BIGINT AS $$
+DECLARE
+    partition_table TEXT := 'uploaded_data_' || p_data_type;
+    staging_table TEXT := 'uploaded_data_' || p_data_type || '_staging';
+    removed_count BIGINT;
+BEGIN
+    IF to_regclass(staging_table) IS NULL THEN
+        RAISE EXCEPTION 'no staged rows for data type % (call begin_uploaded_data_replacement first)', p_data_type;
+    END IF;
+
+    EXECUTE format('SELECT COUNT(*) FROM %I', partition_table) INTO removed_count;
+    EXECUTE format('ALTER TABLE uploaded_data DETACH PARTITION %I', partition_table);
+    EXECUTE format('DROP TABLE %I', partition_table);
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', staging_table, partition_table);
+    -- 부모의 인덱스, 외래 키, 트리거가 새 파티션에 만들어진다
+    EXECUTE format(
+        'ALTER TABLE uploaded_data ATTACH PARTITION %I FOR VALUES IN (%L)',
+        partition_table, p_data_type
+    );
+
+    EXECUTE format('ANALYZE %I', partition_table);
+    RETURN removed_count;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMIT;
@@ -0,0 +1,43 @@
+-- Migration: 0009_covering_brin_indexes.sql
+-- Description: Composite/covering indexes for repository filter and ordering patterns, BRIN on uploaded_data.created_at
+
+BEGIN;
+
+-- ============================================================================
+-- 1. data_upload_logs: 사용자별 최근 업로드 이력 (get_upload_logs_by_user)
+-- ============================================================================
+-- WHERE user_id = ? ORDER BY uploaded_at DESC LIMIT ? 를 정렬 없이 인덱스 순서로 읽는다.
+-- user_id 단독 인덱스는 선행 컬럼이 같은 이 인덱스로 대체된다.
+CREATE INDEX IF NOT EXISTS idx_upload_logs_user_uploaded
+    ON data_upload_logs(user_id, uploaded_at DESC);
+
+DROP INDEX IF EXISTS idx_data_upload_logs_user_id;
+
+-- ============================================================================
+-- 2. uploaded_data: 대시보드 공통 필터 (year, college, department)
+-- ============================================================================
+-- data_type은 파티션 키이므로 (0008) 파티션 안에서 상수라 키 컬럼에서는 뺀다.
+-- 다만 프루닝 후에도 data_type 조건은 Filter로 남으므로 INCLUDE에 넣어야
+-- 필터된 행 수/ID 조회가 테이블을 읽지 않는 index-only scan이 된다.
+-- year 단독 인덱스는 선행 컬럼이 같은 이 인덱스로 대체된다.
+CREATE INDEX IF NOT EXISTS idx_uploaded_data_filters
+    ON uploaded_data(year, college, department) INCLUDE (data_type, id);
+
+DROP INDEX IF EXISTS idx_uploaded_data_year;
+
+-- ============================================================================
+-- 3. uploaded_data: 최신순 조회 (get_uploaded_data, ORDER BY created_at DESC)
+-- ============================================================================
+-- year 필터와 함께 정렬 없이 상위 N개를 읽는다.
+CREATE INDEX IF NOT EXISTS idx_uploaded_data_year_created
+    ON uploaded_data(year, created_at DESC);
+
+-- 행은 업로드 단위로 추가만 되어 created_at이 물리적 순서와 거의 일치하므로,
+-- 기간 조건은 블록 범위 요약(BRIN)으로 충분하다 (B-tree 대비 수백 분의 1 크기).
+CREATE INDEX IF NOT EXISTS idx_uploaded_data_created_brin
+    ON uploaded_data USING BRIN(created_at);
+
+ANALYZE data_upload_logs;
+ANALYZE uploaded_data;
+
+COMMIT;
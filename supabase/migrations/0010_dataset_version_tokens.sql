@@ -0,0 +1,30 @@
+-- Migration: 0010_dataset_version_tokens.sql
+-- Description: Random token per dataset version identifying it across databases (snapshot keys)
+
+BEGIN;
+
+-- ============================================================================
+-- 1. dataset_versions.version_token
+-- ============================================================================
+-- 버전 번호는 데이터베이스마다 1부터 다시 세어지므로 (DB 초기화, 복원, 환경 간 공유 디렉터리)
+-- 버전 번호만으로는 디스크에 남은 컬럼형 스냅샷이 현재 데이터의 것인지 알 수 없다.
+-- 버전이 바뀔 때마다 새 난수 토큰을 발급하고, 스냅샷은 (버전, 토큰)으로 식별한다.
+ALTER TABLE dataset_versions
+    ADD COLUMN IF NOT EXISTS version_token VARCHAR(32) NOT NULL DEFAULT md5(random()::text || clock_timestamp()::text);
+
+CREATE OR REPLACE FUNCTION renew_dataset_version_token()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.version IS DISTINCT FROM OLD.version THEN
+        NEW.version_token := md5(random()::text || clock_timestamp()::text);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_dataset_versions_renew_token
+BEFORE UPDATE ON dataset_versions
+FOR EACH ROW
+EXECUTE FUNCTION renew_dataset_version_token();
+
+COMMIT;